@@ -0,0 +1,4 @@
+import sys
+from arm_preprocessing.cli import main
+
+sys.exit(main())
@@ -0,0 +1,18 @@
+import hashlib
+
+
+def file_digest(path):
+    """
+    Compute the SHA-256 digest of the contents of a file.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,41 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+def workers(n_jobs, items):
+    """
+    Compute the number of workers.
+
+    Args:
+        n_jobs (int): Requested number of workers. -1 uses all processors.
+        items (list): Items processed by the workers.
+
+    Returns:
+        int: Number of workers.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    return max(1, min(n_jobs, len(items)))
+
+
+def thread_map(function, items, n_jobs):
+    """
+    Apply the function to every item, in parallel threads if requested.
+
+    Threads share the memory of the process, so no data is copied between
+    workers.
+
+    Args:
+        function (Callable): Function applied to an item.
+        items (list): Items, e.g. columns or files.
+        n_jobs (int): Number of threads. -1 uses all processors.
+
+    Returns:
+        list: Results in the order of the items.
+    """
+    if workers(n_jobs, items) == 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers(n_jobs, items)) as executor:
+        return list(executor.map(function, items))
@@ -0,0 +1,264 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import time
+import pandas as pd
+from arm_preprocessing._files import file_digest
+
+
+class ResultCache:
+    """
+    On-disk cache of the results of preprocessing steps.
+
+    Every result is stored under a key derived from the input files and the
+    sequence of :class:`~arm_preprocessing.dataset.Dataset` method calls
+    leading to it, so a chain of preprocessing steps rerun on unchanged
+    input is served from the cache up to the first changed step. The data
+    is stored in the Feather columnar format, categorical columns as their
+    codes, and the information about the dataset and the fitted pipeline
+    are pickled next to it.
+
+    Input files are identified by the SHA-256 digest of their contents.
+    Files whose size and modification time did not change are not hashed
+    again. When the total size of the stored results exceeds ``max_size``,
+    the least recently used results are evicted.
+
+    The cache directory must only be shared with trusted processes, as the
+    results are unpickled when they are read.
+
+    Args:
+        directory (str): Directory of the cache. Created if it does not exist.
+        max_size (int, optional): Maximum total size of the stored results in bytes. Default is 1 GiB.
+
+    Attributes:
+        directory (str): Directory of the cache.
+        max_size (int): Maximum total size of the stored results in bytes.
+
+    Example:
+        >>> dataset = Dataset('datasets/Abalone', result_cache=ResultCache('.cache'))
+        >>> dataset.load()
+        >>> dataset.missing_values(method='impute')
+    """
+
+    INDEX_FILENAME = 'index.json'
+
+    def __init__(self, directory, max_size=1 << 30):
+        """
+        Initialise a ResultCache instance.
+
+        Args:
+            directory (str): Directory of the cache. Created if it does not exist.
+            max_size (int, optional): Maximum total size of the stored results in bytes. Default is 1 GiB.
+
+        Raises:
+            ValueError: Invalid maximum size.
+            ValueError: Caching results requires pyarrow.
+        """
+        # Validate maximum size
+        if max_size <= 0:
+            raise ValueError(f'Invalid maximum size: {max_size}')
+
+        # pyarrow is an optional dependency, required to store the data
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ValueError(
+                'Caching results requires pyarrow, install arm-preprocessing[arrow]') from None
+
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+        self._index = {'files': {}, 'entries': {}}
+        index_filename = os.path.join(directory, ResultCache.INDEX_FILENAME)
+        if os.path.exists(index_filename):
+            with open(index_filename) as file:
+                self._index = json.load(file)
+
+    def __contains__(self, key):
+        return key in self._index['entries']
+
+    def __len__(self):
+        return len(self._index['entries'])
+
+    def size(self):
+        """
+        Total size of the stored results in bytes.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return sum(entry[0] for entry in self._index['entries'].values())
+
+    def key(*parts):
+        """
+        Derive a key from JSON serialisable parts, e.g. the key of the
+        previous step, a method name and its arguments.
+
+        Args:
+            *parts: Parts of the key.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest of the parts.
+        """
+        encoded = json.dumps(parts, sort_keys=True, default=repr)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def fingerprint(self, paths):
+        """
+        Identify input files by their contents.
+
+        Args:
+            paths (list): Paths to the files.
+
+        Returns:
+            list: Hexadecimal SHA-256 digest of each file.
+        """
+        digests, changed = [], False
+        for path in paths:
+            path = os.path.abspath(path)
+            status = os.stat(path)
+            stats = [status.st_size, status.st_mtime_ns]
+            known = self._index['files'].get(path)
+            if known is None or known[:2] != stats:
+                known = stats + [file_digest(path)]
+                self._index['files'][path] = known
+                changed = True
+            digests.append(known[2])
+        if changed:
+            self._write_index()
+        return digests
+
+    def get(self, key):
+        """
+        Read the state of a stored result without its data, which is read
+        by :meth:`read_data`. The result is marked as recently used.
+
+        Args:
+            key (str): Key of the result.
+
+        Returns:
+            dict | None: State of the result, or None if it is not stored.
+        """
+        if key not in self._index['entries']:
+            return None
+        try:
+            with open(os.path.join(self.directory, key, 'state.pickle'), 'rb') as file:
+                state = pickle.load(file)
+        except FileNotFoundError:
+            del self._index['entries'][key]
+            self._write_index()
+            return None
+        self._index['entries'][key][1] = time.time_ns()
+        self._write_index()
+        return state
+
+    def read_data(self, key, state):
+        """
+        Read the data of a stored result.
+
+        Args:
+            key (str): Key of the result.
+            state (dict): State of the result returned by :meth:`get`.
+
+        Returns:
+            pd.DataFrame | None: Data, or None for datasets loaded in chunks.
+        """
+        if not state['has_data']:
+            return None
+
+        # pyarrow is an optional dependency
+        from pyarrow import feather
+        data = feather.read_table(
+            os.path.join(self.directory, key, 'data.feather')).to_pandas()
+        for column, dtype in state['categories'].items():
+            data[column] = pd.Categorical.from_codes(data[column], dtype=dtype)
+        data.index = state['index']
+        return data
+
+    def put(self, key, data, state):
+        """
+        Store a result and evict the least recently used results exceeding
+        the maximum size.
+
+        Args:
+            key (str): Key of the result.
+            data (pd.DataFrame | None): Data, None for datasets loaded in chunks.
+            state (dict): Information about the dataset, fitted steps and other attributes to restore.
+
+        Returns:
+            None
+        """
+        # Write into a temporary directory, renamed once complete
+        path = os.path.join(self.directory, key)
+        temporary = f'{path}.tmp'
+        shutil.rmtree(temporary, ignore_errors=True)
+        os.makedirs(temporary)
+        state = dict(state, has_data=data is not None, categories={}, index=None)
+        if data is not None:
+            # pyarrow is an optional dependency
+            from pyarrow import feather
+
+            # Store categorical columns as codes, as Arrow cannot hold intervals
+            columns = {}
+            for column, dtype in data.dtypes.items():
+                if isinstance(dtype, pd.CategoricalDtype):
+                    state['categories'][column] = dtype
+                    columns[column] = data[column].cat.codes
+                else:
+                    columns[column] = data[column]
+            state['index'] = data.index
+            feather.write_feather(
+                pd.DataFrame(columns).reset_index(drop=True),
+                os.path.join(temporary, 'data.feather'))
+        with open(os.path.join(temporary, 'state.pickle'), 'wb') as file:
+            pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(temporary, path)
+
+        size = sum(entry.stat().st_size for entry in os.scandir(path))
+        self._index['entries'][key] = [size, time.time_ns()]
+        self._evict()
+        self._write_index()
+
+    def clear(self):
+        """
+        Remove all stored results.
+
+        Returns:
+            None
+        """
+        for key in list(self._index['entries']):
+            shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+        self._index = {'files': {}, 'entries': {}}
+        self._write_index()
+
+    def _evict(self):
+        """
+        Remove the least recently used results until the total size does
+        not exceed the maximum size.
+
+        Returns:
+            None
+        """
+        entries = self._index['entries']
+        total = self.size()
+        for key in sorted(entries, key=lambda key: entries[key][1]):
+            if total <= self.max_size:
+                break
+            total -= entries.pop(key)[0]
+            shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+
+    def _write_index(self):
+        """
+        Atomically write the index of input files and stored results.
+
+        Returns:
+            None
+        """
+        index_filename = os.path.join(self.directory, ResultCache.INDEX_FILENAME)
+        temporary = f'{index_filename}.tmp'
+        with open(temporary, 'w') as file:
+            json.dump(self._index, file)
+        os.replace(temporary, index_filename)
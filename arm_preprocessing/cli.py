@@ -0,0 +1,205 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from arm_preprocessing._parallel import workers
+
+# Dataset methods that can be steps of a specification
+STEPS = ['load', 'missing_values', 'scale', 'discretise',
+         'squash', 'feature_selection', 'convert']
+
+FORMATS = ['csv', 'txt', 'json', 'tcx', 'parquet', 'feather']
+
+
+def read_specification(filename):
+    """
+    Read a preprocessing specification from a JSON or YAML file.
+
+    The specification is a mapping with the ``steps`` key, a list of
+    Dataset method calls, each a mapping with the method name under the
+    ``step`` key and its arguments, e.g.
+    ``{'step': 'scale', 'method': 'normalisation'}``. The optional
+    ``format``, ``datetime_columns`` and ``backend`` keys are passed to
+    :class:`~arm_preprocessing.dataset.Dataset` and the optional
+    ``datasets`` key lists datasets to preprocess.
+
+    Args:
+        filename (str): Path to the specification ('.json', '.yaml', '.yml').
+
+    Raises:
+        ValueError: Reading YAML specifications requires PyYAML.
+        ValueError: Invalid specification.
+        ValueError: Invalid step.
+
+    Returns:
+        dict: Specification.
+    """
+    with open(filename) as file:
+        if filename.endswith(('.yaml', '.yml')):
+            # PyYAML is an optional dependency
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError(
+                    'Reading YAML specifications requires PyYAML') from None
+            specification = yaml.safe_load(file)
+        else:
+            specification = json.load(file)
+
+    # Validate specification
+    if not isinstance(specification, dict) or not isinstance(specification.get('steps'), list):
+        raise ValueError('Invalid specification: steps not specified')
+    for step in specification['steps']:
+        if not isinstance(step, dict) or step.get('step') not in STEPS:
+            raise ValueError(f'Invalid step: {step}')
+    return specification
+
+
+def run_job(path, specification, output_directory='.'):
+    """
+    Preprocess a dataset with the steps of a specification.
+
+    The dataset is loaded first unless the first step is 'load'. The
+    ``output_filename`` of the 'convert' step may contain the ``{name}``
+    placeholder, replaced with the name of the dataset, and is relative to
+    the output directory. Default is the name of the dataset.
+
+    Args:
+        path (str): Dataset, with or without the extension of its format.
+        specification (dict): Specification, see :func:`read_specification`.
+        output_directory (str, optional): Directory of converted datasets. Default is the current directory.
+
+    Returns:
+        dict: Dataset, wall time of every step in seconds and the error
+        message if a step failed.
+    """
+    # Heavy dependencies are imported only by the jobs
+    from arm_preprocessing.dataset import Dataset
+
+    result = {'dataset': path, 'steps': [], 'error': None}
+    filename, extension = os.path.splitext(path)
+    if extension[1:] not in FORMATS:
+        filename, extension = path, f'.{specification.get("format", "csv")}'
+    name = os.path.basename(filename.rstrip(os.sep))
+    steps = [dict(step) for step in specification['steps']]
+    if len(steps) == 0 or steps[0]['step'] != 'load':
+        steps.insert(0, {'step': 'load'})
+
+    try:
+        dataset = Dataset(
+            filename, format=extension[1:],
+            datetime_columns=specification.get('datetime_columns', []),
+            backend=specification.get('backend', 'pandas'))
+        for step in steps:
+            method = step.pop('step')
+            if method == 'convert':
+                step['output_filename'] = os.path.join(
+                    output_directory, step.get('output_filename', '{name}').format(name=name))
+            start = time.perf_counter()
+            getattr(dataset, method)(**step)
+            result['steps'].append((method, time.perf_counter() - start))
+    except Exception as error:
+        result['error'] = f'{type(error).__name__}: {error}'
+    return result
+
+
+def run(paths, specification, output_directory='.', n_jobs=None, callback=None):
+    """
+    Preprocess datasets concurrently with the steps of a specification.
+
+    Args:
+        paths (list): Datasets, with or without the extension of their format.
+        specification (dict): Specification, see :func:`read_specification`.
+        output_directory (str, optional): Directory of converted datasets. Default is the current directory.
+        n_jobs (int, optional): Number of processes preprocessing datasets in parallel. -1 uses all processors. Default is None (serial).
+        callback (Callable, optional): Function called with the result of every job once it completes. Default is None.
+
+    Returns:
+        list: Results of the jobs in the order of the datasets, see :func:`run_job`.
+    """
+    processes = workers(n_jobs, paths)
+    results = [None] * len(paths)
+    if processes == 1:
+        for index, path in enumerate(paths):
+            results[index] = run_job(path, specification, output_directory)
+            if callback is not None:
+                callback(results[index])
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = {
+                executor.submit(run_job, path, specification, output_directory): index
+                for index, path in enumerate(paths)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                if callback is not None:
+                    callback(results[futures[future]])
+    return results
+
+
+def format_result(result):
+    """
+    Format the timing of a job as one line.
+
+    Args:
+        result (dict): Result of the job, see :func:`run_job`.
+
+    Returns:
+        str: Dataset, total wall time and wall time of every step.
+    """
+    total = sum(seconds for _, seconds in result['steps'])
+    steps = ' '.join(
+        f'{method}={seconds:.3f}s' for method, seconds in result['steps'])
+    line = f'{result["dataset"]}\t{total:.3f}s\t{steps}'
+    if result['error'] is not None:
+        line += f'\tfailed: {result["error"]}'
+    return line
+
+
+def main(argv=None):
+    """
+    Run the ``arm-preprocessing`` command.
+
+    Args:
+        argv (list, optional): Command-line arguments. Default is the arguments of the process.
+
+    Returns:
+        int: Exit status, 1 if any job failed.
+    """
+    parser = argparse.ArgumentParser(
+        prog='arm-preprocessing',
+        description='Preprocess datasets with the steps of a JSON or YAML specification.')
+    parser.add_argument(
+        'specification', help='specification of the preprocessing steps')
+    parser.add_argument(
+        'datasets', nargs='*',
+        help='datasets to preprocess, with or without the extension of their format '
+        '(default: the datasets of the specification)')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='number of processes preprocessing datasets in parallel, -1 uses all processors')
+    parser.add_argument(
+        '-o', '--output-dir', default='.', help='directory of converted datasets')
+    arguments = parser.parse_args(argv)
+
+    try:
+        specification = read_specification(arguments.specification)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    paths = arguments.datasets or specification.get('datasets', [])
+    if len(paths) == 0:
+        parser.error('no datasets specified')
+    os.makedirs(arguments.output_dir, exist_ok=True)
+
+    # Report every job once it completes
+    start = time.perf_counter()
+    results = run(
+        paths, specification, arguments.output_dir, arguments.jobs,
+        callback=lambda result: print(format_result(result), flush=True))
+    failed = sum(result['error'] is not None for result in results)
+    print(
+        f'{len(results)} datasets in {time.perf_counter() - start:.3f}s, {failed} failed',
+        file=sys.stderr)
+    return 1 if failed > 0 else 0
@@ -1,7 +1,702 @@
+import contextlib
+import functools
+import glob
+import inspect
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
-from sport_activities_features.tcx_manipulation import TCXFile
+from arm_preprocessing import __version__
+from arm_preprocessing._files import file_digest
+from arm_preprocessing._parallel import thread_map, workers
+from arm_preprocessing.cache import ResultCache
 from arm_preprocessing.discretisation import Discretisation
+from arm_preprocessing.feature_selection import FeatureSelection
+from arm_preprocessing.lazy import LazyDataset
+from arm_preprocessing.pipeline import Pipeline
+from arm_preprocessing.quantiles import QuantileSketch
+from arm_preprocessing.scaling import Scaling
 from arm_preprocessing.squashing import Squash
+from arm_preprocessing.transactions import Transactions
+
+
+def _contains_text(values):
+    """
+    Check whether any of the values is a long text, i.e. its string
+    representation has at least 25 characters. The check stops at the first
+    long text.
+
+    Args:
+        values (array-like): Values.
+
+    Returns:
+        bool: True if any of the values is a long text.
+    """
+    return any(len(str(value)) >= 25 for value in values)
+
+
+def _profile_frame(frame, sample_size=None):
+    """
+    Profile all columns of a frame.
+
+    Min/max values of numerical columns are computed directly on their NumPy
+    arrays, falling back to pandas only for columns with missing values or
+    extension dtypes. Object and categorical columns are classified as text
+    as soon as one long string is found. When ``sample_size`` is specified, object columns
+    whose sample already contains a long string are classified as text
+    without computing their unique values.
+
+    Args:
+        frame (pd.DataFrame): Frame to profile.
+        sample_size (int, optional): Number of rows sampled for the text detection. Default is None.
+
+    Returns:
+        dict: Profile of each column, i.e. its kind with its unique values or min/max values.
+    """
+    profiles = {}
+    random_state = np.random.default_rng(0)
+    for column, dtype in frame.dtypes.items():
+        if dtype == 'object' or isinstance(dtype, pd.CategoricalDtype):
+            series = frame[column]
+            if sample_size is not None and len(series) > sample_size:
+                positions = random_state.integers(0, len(series), sample_size)
+                sample = series.to_numpy()[positions]
+                if _contains_text(pd.unique(sample)):
+                    profiles[column] = {
+                        'kind': 'object', 'values': None, 'text': True}
+                    continue
+            unique_values = np.asarray(series.unique(), dtype=object)
+            text = _contains_text(unique_values)
+            profiles[column] = {
+                'kind': 'object',
+                'values': None if text else unique_values,
+                'text': text,
+            }
+        elif dtype == 'datetime64[ns]':
+            profiles[column] = {'kind': 'datetime'}
+        else:
+            minimum = maximum = np.nan
+            if isinstance(dtype, np.dtype) and dtype.kind in 'biuf' and len(frame) > 0:
+                values = frame[column].to_numpy()
+                minimum, maximum = values.min(), values.max()
+            if pd.isna(minimum) or pd.isna(maximum):
+                minimum, maximum = frame[column].min(), frame[column].max()
+            profiles[column] = {
+                'kind': 'numerical', 'min': minimum, 'max': maximum}
+    return profiles
+
+
+def _identify_profiles(profiles):
+    """
+    Identify the type of each column and of the dataset from the profiles of
+    the columns.
+
+    Args:
+        profiles (dict): Profile of each column, see :func:`_profile_frame`.
+
+    Returns:
+        dict: Information about the dataset.
+    """
+    # Initialisation
+    information = {'columns': []}
+    column_types = set()
+
+    # Identify dataset
+    for column, profile in profiles.items():
+        if profile['kind'] == 'object':
+            column_type = 'text' if profile['text'] else 'categorical'
+            column_info = {'column': column, 'type': column_type}
+            if column_type == 'categorical':
+                column_info['categories'] = profile['values'].tolist()
+            information['columns'].append(column_info)
+            column_types.add(column_type)
+        elif profile['kind'] == 'datetime':
+            information['columns'].append(
+                {'column': column, 'type': 'time-series'})
+            column_types.add('time-series')
+        else:
+            information['columns'].append(
+                {
+                    'column': column,
+                    'type': 'numerical',
+                    'min': profile['min'],
+                    'max': profile['max'],
+                }
+            )
+            column_types.add('numerical')
+
+    # Determine the general type of the dataset
+    if 'time-series' in column_types:
+        information['type'] = 'time-series'
+    elif 'numerical' in column_types and len(column_types) == 1:
+        information['type'] = 'numerical'
+    elif 'categorical' in column_types and len(column_types) == 1:
+        information['type'] = 'categorical'
+    elif 'text' in column_types and len(column_types) == 1:
+        information['type'] = 'text'
+    else:
+        information['type'] = 'mixed'
+    return information
+
+
+def _information_profiles(information):
+    """
+    Recover the profiles of the columns from the information about a dataset.
+
+    Args:
+        information (dict): Information about the dataset, see :func:`_identify_profiles`.
+
+    Returns:
+        dict: Profile of each column.
+    """
+    profiles = {}
+    for column in information['columns']:
+        if column['type'] == 'categorical':
+            profiles[column['column']] = {
+                'kind': 'object',
+                'values': np.asarray(column['categories'], dtype=object),
+                'text': False,
+            }
+        elif column['type'] == 'text':
+            profiles[column['column']] = {
+                'kind': 'object', 'values': None, 'text': True}
+        elif column['type'] == 'time-series':
+            profiles[column['column']] = {'kind': 'datetime'}
+        else:
+            profiles[column['column']] = {
+                'kind': 'numerical', 'min': column['min'], 'max': column['max']}
+    return profiles
+
+
+def _fit_dtype(series, dtype):
+    """
+    Convert appended values to the NumPy dtype of the column of the dataset
+    if no value changes, e.g. to a compact integer dtype.
+
+    Args:
+        series (pd.Series): Appended values.
+        dtype (np.dtype): Dtype of the column of the dataset.
+
+    Returns:
+        pd.Series: Converted values, or the original values if they do not fit.
+    """
+    if not isinstance(dtype, np.dtype) or not isinstance(series.dtype, np.dtype):
+        return series
+    values = series.to_numpy()
+    with np.errstate(all='ignore'):
+        try:
+            converted = values.astype(dtype)
+        except (TypeError, ValueError):
+            return series
+    if not np.array_equal(converted.astype(values.dtype), values, equal_nan=values.dtype.kind in 'fc'):
+        return series
+    return pd.Series(converted, index=series.index, name=series.name)
+
+
+def _compact_dtype(series, profile):
+    """
+    Find a more compact dtype holding all values of a column.
+
+    Categorical columns whose values repeat on average at least twice are
+    stored as pandas categories, integer columns are narrowed to the smallest integer type holding their min/max values and
+    float64 columns are narrowed to float32 when no value changes.
+
+    Args:
+        series (pd.Series): Column.
+        profile (dict): Profile of the column.
+
+    Returns:
+        str | np.dtype | None: Compact dtype, or None if the column is already compact.
+    """
+    dtype = series.dtype
+    if profile['kind'] == 'object':
+        if dtype == 'object' and not profile['text'] and 2 * len(profile['values']) <= len(series):
+            return 'category'
+        return None
+    if profile['kind'] != 'numerical' or not isinstance(dtype, np.dtype) or len(series) == 0:
+        return None
+
+    if dtype.kind in 'iu':
+        candidates = [np.uint8, np.uint16, np.uint32] if dtype.kind == 'u' else [
+            np.int8, np.int16, np.int32]
+        for candidate in map(np.dtype, candidates):
+            if candidate.itemsize >= dtype.itemsize:
+                break
+            limits = np.iinfo(candidate)
+            if limits.min <= profile['min'] and profile['max'] <= limits.max:
+                return candidate
+    elif dtype == np.float64:
+        values = series.to_numpy()
+        with np.errstate(over='ignore'):
+            narrow = values.astype(np.float32)
+        if np.array_equal(narrow, values, equal_nan=True):
+            return np.dtype(np.float32)
+    return None
+
+
+def _object_memory_usage(categorical):
+    """
+    Compute the memory usage in bytes of an object column from its categorical
+    version, measuring every distinct value only once.
+
+    Args:
+        categorical (pd.Series): Categorical version of the object column.
+
+    Returns:
+        int: Memory usage of the object column, as in ``memory_usage(deep=True)``.
+    """
+    counts = np.bincount(categorical.cat.codes.to_numpy() + 1,
+                         minlength=len(categorical.cat.categories) + 1)
+    sizes = [sys.getsizeof(np.nan)] + [
+        sys.getsizeof(value) for value in categorical.cat.categories]
+    return int(len(categorical) * np.dtype(object).itemsize + np.dot(counts, sizes))
+
+
+def _merge_profiles(first, second):
+    """
+    Merge the profiles of the same column computed on two chunks.
+
+    Args:
+        first (dict): Profile of the column in the first chunk.
+        second (dict): Profile of the column in the second chunk.
+
+    Returns:
+        dict: Merged profile.
+    """
+    # Chunks without values may be inferred as a different dtype
+    if first['kind'] != second['kind']:
+        missing = {'kind': 'object', 'values': np.array(
+            [np.nan], dtype=object), 'text': False}
+        if second['kind'] == 'object' and first['kind'] == 'numerical' and pd.isna(first['min']):
+            first = missing
+        elif first['kind'] == 'object' and second['kind'] == 'numerical' and pd.isna(second['min']):
+            second = missing
+        else:
+            return second if second['kind'] == 'object' else first
+
+    if first['kind'] == 'object':
+        text = first['text'] or second['text']
+        values = None
+        if not text:
+            values = pd.unique(pd.concat(
+                [pd.Series(first['values'], dtype='object'),
+                 pd.Series(second['values'], dtype='object')]))
+        return {'kind': 'object', 'values': values, 'text': text}
+    elif first['kind'] == 'numerical':
+        return {
+            'kind': 'numerical',
+            'min': pd.Series([first['min'], second['min']]).min(),
+            'max': pd.Series([first['max'], second['max']]).max(),
+        }
+    return first
+
+
+def _column_moments(frames, columns=None):
+    """
+    Compute count, mean, sum of squared deviations, min and max of the
+    numerical columns over a sequence of frames in a single pass.
+
+    Args:
+        frames (Iterable[pd.DataFrame]): Frames of the dataset.
+        columns (list, optional): Columns to consider. Default is all numerical columns.
+
+    Returns:
+        dict: Moments of each numerical column.
+    """
+    moments = {}
+    for frame in frames:
+        for column in frame.columns if columns is None else columns:
+            if frame[column].dtype in ['datetime64[ns]', 'object', 'category']:
+                continue
+            values = frame[column].dropna()
+            if values.dtype == bool:
+                values = values.astype(np.float64)
+            count = len(values)
+            if count == 0:
+                continue
+            mean = values.mean()
+            m2 = ((values - mean) ** 2).sum()
+            if column not in moments:
+                moments[column] = {
+                    'count': count,
+                    'mean': mean,
+                    'm2': m2,
+                    'min': values.min(),
+                    'max': values.max(),
+                }
+                continue
+
+            # Combine with the moments of the previous frames
+            _merge_moments(moments[column], {
+                'count': count, 'mean': mean, 'm2': m2,
+                'min': values.min(), 'max': values.max(),
+            })
+    return moments
+
+
+def _merge_moments(current, other):
+    """
+    Combine the moments of a column with the moments of further rows, using
+    the parallel algorithm of Chan et al. for the mean and the sum of
+    squared deviations.
+
+    Args:
+        current (dict): Moments of the column, updated in place.
+        other (dict): Moments of the further rows.
+
+    Returns:
+        None
+    """
+    total = current['count'] + other['count']
+    delta = other['mean'] - current['mean']
+    current['mean'] += delta * other['count'] / total
+    current['m2'] += other['m2'] + delta ** 2 * \
+        current['count'] * other['count'] / total
+    current['count'] = total
+    current['min'] = min(current['min'], other['min'])
+    current['max'] = max(current['max'], other['max'])
+
+
+def _scaling_parameters(moments, method):
+    """
+    Compute the scaling parameters of the numerical columns from their moments.
+
+    Args:
+        moments (dict): Moments of each numerical column, see :func:`_column_moments`.
+        method (str): Scaling method ('normalisation', 'standardisation').
+
+    Returns:
+        dict: Offset and factor of each numerical column.
+    """
+    parameters = {}
+    for column, moment in moments.items():
+        if method == 'normalisation':
+            parameters[column] = (
+                moment['min'], moment['max'] - moment['min'])
+        elif method == 'standardisation':
+            std = np.sqrt(moment['m2'] / (moment['count'] - 1)
+                          ) if moment['count'] > 1 else np.nan
+            parameters[column] = (moment['mean'], std)
+    return parameters
+
+
+TCX_CACHE_FILENAME = '.arm_preprocessing_cache.json'
+
+
+def _tcx_file():
+    """
+    Create a TCX file reader. sport_activities_features is imported only
+    when TCX files are read, as it imports a large dependency stack.
+
+    Returns:
+        TCXFile: TCX file reader.
+    """
+    from sport_activities_features.tcx_manipulation import TCXFile
+    return TCXFile()
+
+
+def _tcx_metrics(path):
+    """
+    Extract the integral metrics of a TCX file.
+
+    Args:
+        path (str): Path to the TCX file.
+
+    Returns:
+        dict: Integral metrics.
+    """
+    return _tcx_file().extract_integral_metrics(path)
+
+
+def _json_value(value):
+    """
+    Convert a NumPy value of TCX metrics to a JSON serialisable value.
+
+    Args:
+        value (object): Value not serialisable by :mod:`json`.
+
+    Raises:
+        TypeError: Value is not a NumPy value.
+
+    Returns:
+        int | float | bool | list: Value.
+    """
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(
+        f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _read_tcx_directory(directory, n_jobs=None, cache=False):
+    """
+    Extract the integral metrics of all TCX files in a directory.
+
+    Files are parsed in parallel processes if requested. With ``cache``
+    enabled, the metrics are stored in a JSON sidecar file in the directory,
+    keyed by the SHA-256 digest of the file contents, so only new or changed
+    files are parsed on subsequent loads. Files whose size and modification
+    time did not change are not hashed again.
+
+    Args:
+        directory (str): Directory with TCX files.
+        n_jobs (int, optional): Number of processes parsing files in parallel. -1 uses all processors. Default is None (serial).
+        cache (bool, optional): Cache the metrics of parsed files. Default is False.
+
+    Returns:
+        list[dict]: Integral metrics of each file.
+    """
+    files = _tcx_file().read_directory(directory)
+    cache_filename = os.path.join(directory, TCX_CACHE_FILENAME)
+    stored = {'files': {}, 'metrics': {}}
+    if cache and os.path.exists(cache_filename):
+        with open(cache_filename) as file:
+            stored = json.load(file)
+
+    # Identify files by their contents
+    digests, stats = [], {}
+    for path in files:
+        status = os.stat(path)
+        name = os.path.basename(path)
+        stats[name] = [status.st_size, status.st_mtime_ns]
+        known = stored['files'].get(name)
+        if known is not None and known[:2] == stats[name] and known[2] in stored['metrics']:
+            digests.append(known[2])
+        else:
+            digests.append(file_digest(path) if cache else path)
+
+    # Parse files that are not cached
+    pending = {}
+    for path, digest in zip(files, digests):
+        if digest not in stored['metrics'] and digest not in pending:
+            pending[digest] = path
+    processes = workers(n_jobs, pending)
+    if processes == 1:
+        parsed = [_tcx_metrics(path) for path in pending.values()]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            parsed = list(executor.map(
+                _tcx_metrics, pending.values(),
+                chunksize=max(1, len(pending) // (4 * processes))))
+    metrics = dict(stored['metrics'])
+    metrics.update(zip(pending, parsed))
+
+    # Store the metrics of the current files
+    if cache:
+        stored = {
+            'files': {
+                name: stats[name] + [digest]
+                for name, digest in zip(stats, digests)
+            },
+            'metrics': {digest: metrics[digest] for digest in digests},
+        }
+        temporary = f'{cache_filename}.tmp'
+        with open(temporary, 'w') as file:
+            json.dump(stored, file, default=_json_value)
+        os.replace(temporary, cache_filename)
+    return [metrics[digest] for digest in digests]
+
+
+def _partition_files(filename, format):
+    """
+    Find the files of a dataset given as a directory or a glob pattern.
+
+    Directories contain files with the extension of the format, and the
+    extension is appended to glob patterns without it, e.g. ``'data/day-*'``
+    matches ``'data/day-1.csv'`` for the CSV format.
+
+    Args:
+        filename (str): Name of the file without extension, directory or glob pattern.
+        format (str): Format of the dataset file.
+
+    Raises:
+        ValueError: No files match the directory or glob pattern.
+
+    Returns:
+        list | None: Sorted paths of the files, or None for a single file.
+    """
+    if filename is None or format not in ['csv', 'txt', 'json']:
+        return None
+    if os.path.isdir(filename):
+        pattern = os.path.join(filename, f'*.{format}')
+    elif any(character in filename for character in '*?['):
+        pattern = filename if filename.endswith(
+            f'.{format}') else f'{filename}.{format}'
+    else:
+        return None
+    files = sorted(glob.glob(pattern))
+    if len(files) == 0:
+        raise ValueError(f'No files match: {pattern}')
+    return files
+
+
+def _read_arrow(filename, format, columns=None, filters=None):
+    """
+    Read a Parquet or Feather file.
+
+    Only the requested columns are read. Parquet row groups whose statistics
+    do not match the filters are skipped without being read, while Feather
+    files are memory-mapped and filtered after reading.
+
+    Args:
+        filename (str): Path to the file.
+        format (str): Format of the file ('parquet', 'feather').
+        columns (list, optional): Columns to read. Default is all columns.
+        filters (list, optional): Row filters in the disjunctive normal form of :func:`pandas.read_parquet`. Default is None.
+
+    Returns:
+        pd.DataFrame: Data.
+    """
+    if format == 'parquet':
+        return pd.read_parquet(filename, columns=columns, filters=filters)
+
+    # pyarrow is an optional dependency
+    from pyarrow import feather, parquet
+    table = feather.read_table(filename, columns=columns, memory_map=True)
+    if filters is not None:
+        table = table.filter(parquet.filters_to_expression(filters))
+    return table.to_pandas()
+
+
+def _iter_arrow(filename, format, chunksize):
+    """
+    Iterate over a Parquet or Feather file in chunks.
+
+    Args:
+        filename (str): Path to the file.
+        format (str): Format of the file ('parquet', 'feather').
+        chunksize (int): Maximum number of rows per chunk.
+
+    Yields:
+        pd.DataFrame: Chunk of the file.
+    """
+    # pyarrow is an optional dependency
+    from pyarrow import feather, parquet
+    if format == 'parquet':
+        batches = parquet.ParquetFile(filename).iter_batches(
+            batch_size=chunksize)
+    else:
+        batches = feather.read_table(filename, memory_map=True).to_batches(
+            max_chunksize=chunksize)
+
+    # Number rows continuously across chunks
+    start = 0
+    for batch in batches:
+        chunk = batch.to_pandas()
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk
+
+
+def _data_signature(data):
+    """
+    Compute a cheap signature of the data of a dataset.
+
+    The signature consists of the column names, dtypes, shape and the
+    addresses of the arrays holding the columns, so it changes when the
+    data is replaced or columns are dropped, added or converted in place,
+    e.g. by ``data.drop(columns, inplace=True)``. Values assigned into the
+    existing arrays are not detected.
+
+    Args:
+        data (pd.DataFrame | None): Data.
+
+    Returns:
+        tuple | None: Signature, or None for datasets loaded in chunks.
+    """
+    if data is None:
+        return None
+    arrays = []
+    for block in data._mgr.blocks:
+        values = block.values
+        if isinstance(values, np.ndarray):
+            arrays.append(values.__array_interface__['data'][0])
+        else:
+            arrays.append(id(values))
+    return (
+        id(data), tuple(data.columns), tuple(str(dtype) for dtype in data.dtypes),
+        data.shape, tuple(arrays),
+    )
+
+
+def _cached(method):
+    """
+    Serve a preprocessing step of a dataset from its result cache.
+
+    The key of the step chains the key of the previous step, or the input
+    files for :meth:`Dataset.load`, with the method name and its arguments.
+    The number of parallel jobs does not change the result and is not part
+    of the key. Steps of datasets whose data was replaced or whose columns
+    were changed in place outside of cached steps, see
+    :func:`_data_signature`, are not cached until the dataset is loaded
+    again.
+
+    Args:
+        method (Callable): Dataset method returning None.
+
+    Returns:
+        Callable: Cached method.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self.result_cache
+        if cache is None or self._cache_depth > 0:
+            return method(self, *args, **kwargs)
+
+        # Chain the step to the input files or the previous step
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        arguments = {
+            name: value for name, value in arguments.arguments.items()
+            if name not in ['self', 'n_jobs', 'cache']
+        }
+        if method.__name__ == 'load':
+            previous = [
+                __version__, self.filename, self.format, self.datetime_columns,
+                cache.fingerprint(self._input_files()),
+            ]
+        elif self._cache_key is not None and _data_signature(self.data) == self._cache_signature:
+            previous = self._cache_key
+        else:
+            self._cache_key = None
+            return method(self, *args, **kwargs)
+        key = ResultCache.key(previous, method.__name__, arguments)
+
+        # Restore the stored result or run and store the step
+        self._cache_key = None
+        state = cache.get(key)
+        if state is not None:
+            self.data = cache.read_data(key, state)
+            self.information = state['information']
+            self.pipeline = Pipeline(state['steps'])
+            self.chunksize = state['chunksize']
+            self.partitions = state['partitions']
+            self._time_indices = {}
+        else:
+            self._cache_depth += 1
+            try:
+                method(self, *args, **kwargs)
+            finally:
+                self._cache_depth -= 1
+            cache.put(key, self.data, {
+                'information': self.information,
+                'steps': self.pipeline.steps,
+                'chunksize': self.chunksize,
+                'partitions': self.partitions,
+            })
+        self._cache_key = key
+        self._cache_signature = _data_signature(self.data)
+
+    return wrapper
 
 
 class Dataset:
@@ -10,81 +705,519 @@ class Dataset:
 
     Args:
         filename (str): Name of the file without extension.
-        format (str, optional): Format of the dataset file ('csv', 'txt', 'json', 'tcx'). Default is 'csv'.
+        format (str, optional): Format of the dataset file ('csv', 'txt', 'json', 'tcx', 'parquet', 'feather'). Default is 'csv'.
         target_format (str, optional): Target format for conversion. Default is None.
         datetime_columns (list, optional): List of columns containing datetime values. Default is an empty list.
+        backend (str, optional): Data frame library holding the dataset ('pandas', 'polars'). Default is 'pandas'.
 
     Attributes:
         filename (str): Name of the file without extension.
-        format (str): Format of the dataset file ('csv', 'txt', 'json', 'tcx').
+        format (str): Format of the dataset file ('csv', 'txt', 'json', 'tcx', 'parquet', 'feather').
         target_format (str): Target format for conversion.
         datetime_columns (list): List of columns containing datetime values.
         information (dict): Information about the dataset.
-        data (pd.DataFrame): Dataset.
+        backend (str): Data frame library holding the dataset ('pandas', 'polars').
+        data (pd.DataFrame | pl.DataFrame): Dataset. None when the dataset is loaded in chunks.
+        chunksize (int): Number of rows per chunk when the dataset is loaded in chunks.
+        pipeline (Pipeline): Fitted preprocessing steps applied to the dataset.
+        partitions (list): Source file and range of index labels ('file', 'start', 'stop') of the rows read from each file.
+        result_cache (ResultCache): Cache of the results of preprocessing steps, None if results are not cached.
     """
 
-    def __init__(self, filename=None, format='csv', target_format=None, datetime_columns=[]):
+    def __init__(self, filename=None, format='csv', target_format=None, datetime_columns=[], backend='pandas', result_cache=None):
         """
         Initialise a Dataset instance.
 
         Args:
-            filename (str): Name of the file without extension.
-            format (str, optional): Format of the dataset file ('csv', 'txt', 'json', 'tcx'). Default is 'csv'.
+            filename (str): Name of the file without extension. CSV, TXT and JSON datasets may also be a directory or a glob pattern matching several files, which are concatenated.
+            format (str, optional): Format of the dataset file ('csv', 'txt', 'json', 'tcx', 'parquet', 'feather'). Default is 'csv'.
             target_format (str, optional): Target format for conversion. Default is None.
             datetime_columns (list, optional): List of columns containing datetime values. Default is an empty list.
+            backend (str, optional): Data frame library holding the dataset ('pandas', 'polars'). The polars backend supports loading, identification, missing values, scaling, discretisation with bin edges and datetime filtering. Default is 'pandas'.
+            result_cache (ResultCache, optional): Cache serving the results of loading, identification, missing values, scaling, discretisation, squashing and feature selection rerun on unchanged input. Default is None (no caching).
+
+        Raises:
+            ValueError: Invalid format.
+            ValueError: Invalid backend.
+            ValueError: Result caching is not supported for the polars backend.
         """
         # Validate format
-        if format not in ['csv', 'txt', 'json', 'tcx']:
+        if format not in ['csv', 'txt', 'json', 'tcx', 'parquet', 'feather']:
             raise ValueError(f'Invalid format: {format}')
 
+        # Validate backend
+        if backend not in ['pandas', 'polars']:
+            raise ValueError(f'Invalid backend: {backend}')
+
         # Initialise attributes
         self.filename = filename
         self.format = format
         self.target_format = target_format
         self.datetime_columns = [datetime_columns]
+        self.backend = backend
         self.information = {}
-
-    def load(self):
+        self._appended = []
+        self._moments = None
+        self._moments_signature = None
+        self.data = None
+        self.chunksize = None
+        self.pipeline = Pipeline()
+        self.partitions = []
+        self.result_cache = result_cache
+        self._time_indices = {}
+        self._cache_key = None
+        self._cache_signature = None
+        self._cache_depth = 0
+
+        # polars is an optional dependency
+        self._polars = None
+        if backend == 'polars':
+            from arm_preprocessing.polars_backend import PolarsBackend
+            self._polars = PolarsBackend
+        if result_cache is not None:
+            self._validate_backend('Result caching')
+
+    @property
+    def data(self):
+        """
+        pd.DataFrame | pl.DataFrame: Loaded dataset, None for datasets loaded
+        in chunks. Rows added by :meth:`append` are concatenated with the
+        dataset once, when it is accessed next.
+        """
+        if self._appended:
+            valid = self._valid_moments()
+            self._data = pd.concat([self._data, *self._appended])
+            self._appended = []
+            if valid:
+                self._moments_signature = _data_signature(self._data)
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._appended = []
+        self._moments = None
+
+    @_cached
+    def load(self, chunksize=None, sample_size=None, n_jobs=None, cache=False, columns=None, filters=None, compact=False):
         """
         Load data from the specified file and analyse it.
 
+        When ``chunksize`` is specified, the file is not read into memory.
+        Instead, the dataset is analysed chunk by chunk and subsequent
+        preprocessing steps are fitted on the chunks and applied lazily
+        by :meth:`iter_chunks`.
+
+        The files of datasets given as a directory or a glob pattern are read
+        in parallel threads and concatenated once. The rows read from each
+        file are recorded in :attr:`partitions`.
+
+        Args:
+            chunksize (int, optional): Number of rows per chunk. Default is None.
+            sample_size (int, optional): Number of rows sampled by :meth:`identify_dataset`. Default is None.
+            n_jobs (int, optional): Number of processes parsing TCX files or threads reading the files of a directory or glob pattern in parallel. -1 uses all processors. Default is None (serial).
+            cache (bool, optional): Cache the metrics of parsed TCX files in the directory, so only new or changed files are parsed on subsequent loads. Default is False.
+            columns (list, optional): Columns to read from Parquet and Feather files. Default is all columns.
+            filters (list, optional): Row filters for Parquet and Feather files in the disjunctive normal form of :func:`pandas.read_parquet`, e.g. ``[('age', '>', 30)]``. Parquet row groups not matching the filters are skipped. Default is None.
+            compact (bool, optional): Convert columns to compact dtypes, as in :meth:`identify_dataset`. Default is False.
+
         Raises:
             ValueError: Specified format is not supported.
+            ValueError: Invalid chunk size.
+            ValueError: Column projection and filters are not supported.
+            ValueError: Chunked loading is not supported for the polars backend.
+            ValueError: No files match the directory or glob pattern.
 
         Returns:
             None
         """
-        # Load data from file
+        # Validate column projection and filters
+        if (columns is not None or filters is not None) and (
+                self.format not in ['parquet', 'feather'] or chunksize is not None):
+            raise ValueError(
+                'Column projection and filters are only supported for Parquet and Feather files loaded at once')
+
+        # Load data in chunks
+        if chunksize is not None:
+            self._validate_backend('Chunked loading')
+            if chunksize <= 0:
+                raise ValueError(f'Invalid chunk size: {chunksize}')
+            if self.format == 'tcx':
+                raise ValueError(
+                    f'Chunked loading is not supported for format: {self.format}')
+            self.chunksize = chunksize
+            self.pipeline = Pipeline()
+            self.partitions = []
+            self.data = None
+            self.identify_dataset(sample_size, compact)
+            return
+
+        # Read the files of a directory or glob pattern in parallel
+        files = _partition_files(self.filename, self.format)
         filename = f'{self.filename}.{self.format}'
-        if self.format == 'csv' or self.format == 'txt':
-            if len(self.datetime_columns[0]) == 0:
-                data = pd.read_csv(filename)
+        if files is not None:
+            if self._polars is not None:
+                frames = thread_map(
+                    lambda file: self._polars.read(
+                        file, self.format, self.datetime_columns[0]),
+                    files, n_jobs)
             else:
-                data = pd.read_csv(
-                    filename, parse_dates=self.datetime_columns)
-        elif self.format == 'json':
-            if len(self.datetime_columns[0]) == 0:
-                data = pd.read_json(filename, orient='records')
+                frames = thread_map(self._read_file, files, n_jobs)
+        elif self._polars is not None:
+            if self.format == 'tcx':
+                data = self._polars.from_records(
+                    _read_tcx_directory(self.filename, n_jobs, cache))
             else:
-                data = pd.read_json(
-                    filename, parse_dates=self.datetime_columns, orient='records'
-                )
+                data = self._polars.read(
+                    filename, self.format, self.datetime_columns[0], columns, filters)
+        elif self.format == 'csv' or self.format == 'txt' or self.format == 'json':
+            data = self._read_file(filename)
         elif self.format == 'tcx':
-            tcx_file = TCXFile()
-            all_files = tcx_file.read_directory(self.filename)
             data = pd.DataFrame(
-                [tcx_file.extract_integral_metrics(file) for file in all_files])
+                _read_tcx_directory(self.filename, n_jobs, cache))
+        elif self.format == 'parquet' or self.format == 'feather':
+            data = _read_arrow(filename, self.format, columns, filters)
+
+        # Record the rows read from each file
+        if files is not None:
+            self.partitions = []
+            start = 0
+            for file, frame in zip(files, frames):
+                self.partitions.append(
+                    {'file': file, 'start': start, 'stop': start + len(frame)})
+                start += len(frame)
+            data = self._polars.concat(frames) if self._polars is not None else pd.concat(
+                frames, ignore_index=True)
+            del frames
+        else:
+            self.partitions = [{
+                'file': self.filename if self.format == 'tcx' else filename,
+                'start': 0,
+                'stop': len(data),
+            }]
         self.data = data
+        self.chunksize = None
+        self.pipeline = Pipeline()
 
         # Analyse data
-        self.identify_dataset()
+        self.identify_dataset(sample_size, compact)
+
+    def iter_chunks(self, chunksize=None):
+        """
+        Iterate over the dataset file in chunks.
+
+        Preprocessing steps recorded in the pipeline are replayed on every
+        chunk. JSON files must be in the JSON Lines format. Parquet files are
+        read batch by batch and Feather files are memory-mapped.
+
+        Args:
+            chunksize (int, optional): Number of rows per chunk. Default is the chunk size used in :meth:`load`.
+
+        Raises:
+            ValueError: Chunk size not specified.
+            ValueError: Specified format is not supported.
+            ValueError: Chunked loading is not supported for the polars backend.
+
+        Yields:
+            pd.DataFrame: Chunk of the dataset.
+        """
+        # Validate chunk size
+        self._validate_backend('Chunked loading')
+        if chunksize is None:
+            chunksize = self.chunksize
+        if chunksize is None:
+            raise ValueError('Chunk size not specified')
+
+        # Replay preprocessing steps on every chunk, numbering rows across files
+        files = _partition_files(self.filename, self.format)
+        start = 0
+        for filename in files or [f'{self.filename}.{self.format}']:
+            with self._open_reader(filename, chunksize) as chunks:
+                for chunk in chunks:
+                    if files is not None:
+                        chunk.index = pd.RangeIndex(start, start + len(chunk))
+                        start += len(chunk)
+                    yield self.pipeline.transform(chunk, copy=False)
+
+    def append(self, data):
+        """
+        Append rows to the loaded dataset, e.g. batches of a streaming feed.
+
+        The fitted preprocessing steps are applied to the rows and the
+        information about the dataset is updated from the rows alone: the
+        min/max values of numerical columns and the categories of categorical
+        columns. Counts, means and variances of the numerical columns are
+        maintained as well, so :meth:`scale` needs no pass over the dataset
+        to fit its parameters. The first append computes them once over the
+        loaded rows, and so does the next append after the dataset was
+        modified. Columns converted since the dataset was identified, e.g.
+        discretised, are profiled as a whole. Rows of consecutive appends are concatenated with the
+        dataset only when it is accessed next.
+
+        Appended rows are numbered after the last row of the dataset. Columns
+        of compact dtypes keep their dtypes if the rows fit into them. The
+        memory usage measured by :meth:`identify_dataset` is kept but not
+        updated.
+
+        Args:
+            data (pd.DataFrame): Rows with the same columns as the loaded data before preprocessing.
+
+        Raises:
+            ValueError: Appending is not supported for the polars backend.
+            ValueError: Appending requires a loaded dataset.
+            ValueError: Columns do not match the dataset.
+
+        Returns:
+            None
+        """
+        self._validate_backend('Appending')
+        if self._data is None:
+            raise ValueError('Appending requires a loaded dataset')
+
+        # Apply the fitted steps to the rows
+        batch = self.pipeline.transform(data)
+        if list(batch.columns) != list(self._data.columns):
+            raise ValueError('Columns do not match the dataset')
+
+        # Compute moments of the dataset on the first append or once it was modified
+        if not self._valid_moments():
+            self._moments = _column_moments([self.data])
+
+        # Number rows after the last row of the dataset
+        labels = self._appended[-1].index if self._appended else self._data.index
+        if len(labels) > 0 and labels.dtype.kind in 'iu' and labels.is_monotonic_increasing:
+            batch.index = pd.RangeIndex(labels[-1] + 1, labels[-1] + 1 + len(batch))
+
+        # Keep the dtypes of the dataset where the rows fit into them
+        for column, dtype in self._data.dtypes.items():
+            if batch[column].dtype == dtype:
+                continue
+            if isinstance(dtype, pd.CategoricalDtype):
+                new = pd.Index(batch[column].dropna().unique()
+                               ).difference(dtype.categories)
+                if len(new) > 0:
+                    dtype = pd.CategoricalDtype(
+                        dtype.categories.append(new), dtype.ordered)
+                    for frame in [self._data, *self._appended]:
+                        frame[column] = frame[column].astype(dtype)
+                batch[column] = batch[column].astype(dtype)
+            else:
+                batch[column] = _fit_dtype(batch[column], dtype)
+
+        # Update moments and information from the rows only
+        for column, moment in _column_moments([batch]).items():
+            if column in self._moments:
+                _merge_moments(self._moments[column], moment)
+            else:
+                self._moments[column] = moment
+        profiles = _information_profiles(self.information)
+        for column, profile in _profile_frame(batch).items():
+            if column in profiles and profiles[column]['kind'] != profile['kind']:
+                # Profile columns converted since identifying the dataset, e.g. discretised, as a whole
+                profile = _profile_frame(
+                    pd.concat([self.data[[column]], batch[[column]]]))[column]
+            elif column in profiles:
+                profile = _merge_profiles(profiles[column], profile)
+            profiles[column] = profile
+        information = _identify_profiles(profiles)
+        if 'memory' in self.information:
+            information['memory'] = self.information['memory']
+        self.information = information
+        self._appended.append(batch)
+        self._moments_signature = _data_signature(self._data)
+
+    def _valid_moments(self):
+        """
+        Check that the moments maintained by :meth:`append` describe the
+        dataset, i.e. the dataset was not modified since they were updated.
+        Modifications are detected by :func:`_data_signature`.
+
+        Returns:
+            bool: Moments are valid.
+        """
+        return self._moments is not None and \
+            _data_signature(self._data) == self._moments_signature
+
+    def _input_files(self):
+        """
+        List the files the dataset is read from.
+
+        Returns:
+            list: Paths to the files.
+        """
+        files = _partition_files(self.filename, self.format)
+        if files is not None:
+            return files
+        if self.format == 'tcx':
+            return _tcx_file().read_directory(self.filename)
+        return [f'{self.filename}.{self.format}']
+
+    def _read_file(self, filename):
+        """
+        Read a CSV, TXT or JSON file.
+
+        Args:
+            filename (str): Path to the file.
+
+        Returns:
+            pd.DataFrame: Data.
+        """
+        if self.format == 'csv' or self.format == 'txt':
+            if len(self.datetime_columns[0]) == 0:
+                return pd.read_csv(filename)
+            return pd.read_csv(filename, parse_dates=self.datetime_columns)
+        if len(self.datetime_columns[0]) == 0:
+            return pd.read_json(filename, orient='records')
+        return pd.read_json(
+            filename, parse_dates=self.datetime_columns, orient='records'
+        )
+
+    def _open_reader(self, filename, chunksize):
+        """
+        Open a chunked reader of a file.
+
+        Args:
+            filename (str): Path to the file.
+            chunksize (int): Number of rows per chunk.
+
+        Raises:
+            ValueError: Specified format is not supported.
+
+        Returns:
+            ContextManager[Iterable[pd.DataFrame]]: Reader yielding the chunks of the file.
+        """
+        if self.format == 'csv' or self.format == 'txt':
+            if len(self.datetime_columns[0]) == 0:
+                return pd.read_csv(filename, chunksize=chunksize)
+            return pd.read_csv(
+                filename, parse_dates=self.datetime_columns, chunksize=chunksize)
+        elif self.format == 'json':
+            return pd.read_json(
+                filename,
+                convert_dates=self.datetime_columns[0] or True,
+                orient='records',
+                lines=True,
+                chunksize=chunksize,
+            )
+        elif self.format == 'parquet' or self.format == 'feather':
+            return contextlib.closing(
+                _iter_arrow(filename, self.format, chunksize))
+        raise ValueError(
+            f'Chunked loading is not supported for format: {self.format}')
+
+    def iter_partitions(self):
+        """
+        Iterate over the rows of the loaded dataset read from each file.
+
+        Rows are matched by the index labels assigned when the dataset was
+        loaded, so partitions keep their remaining rows after rows are dropped
+        or filtered.
+
+        Raises:
+            ValueError: Partitions are not supported for the polars backend.
+
+        Yields:
+            tuple[str, pd.DataFrame]: Source file and its rows.
+        """
+        self._validate_backend('Partitions')
+        index = self.data.index
+        for partition in self.partitions:
+            if index.is_monotonic_increasing:
+                start, stop = index.searchsorted(
+                    [partition['start'], partition['stop']])
+                rows = self.data.iloc[start:stop]
+            else:
+                rows = self.data[(index >= partition['start']) & (
+                    index < partition['stop'])]
+            yield partition['file'], rows
+
+    def transform(self, data):
+        """
+        Apply the preprocessing steps fitted on the dataset to new data
+        without refitting them.
+
+        Args:
+            data (pd.DataFrame | pl.DataFrame): New data with the same columns as the dataset, in the data frame library of the backend.
+
+        Returns:
+            pd.DataFrame | pl.DataFrame: Preprocessed data.
+        """
+        if self._polars is not None:
+            for step in self.pipeline.steps:
+                data = self._polars.apply_step(data, step)
+            return data
+        return self.pipeline.transform(data)
+
+    def _record(self, step, copy=True):
+        """
+        Record a fitted step in the pipeline and apply it to the loaded data.
+
+        Args:
+            step (dict): Fitted step.
+            copy (bool, optional): Impute and scale a copy of the numerical columns instead of modifying them in place where possible. Default is True.
+
+        Returns:
+            None
+        """
+        self.pipeline.append(step)
+        # Steps may modify the data in place, e.g. fill missing timestamps
+        self._time_indices = {}
+        if self.data is not None and self._polars is not None:
+            self.data = self._polars.apply_step(self.data, step)
+        elif self.data is not None:
+            self.data = Pipeline.apply_step(self.data, step, copy)
+
+    def _frames(self):
+        """
+        Return the frames holding the dataset: the loaded data or its chunks.
+
+        Returns:
+            Iterable[pd.DataFrame]: Frames of the dataset.
+        """
+        if self.data is None and self.chunksize is not None:
+            return self.iter_chunks()
+        return [self.data]
+
+    def _validate_backend(self, operation):
+        """
+        Check that the operation is supported by the backend of the dataset.
+
+        Args:
+            operation (str): Description of the operation.
+
+        Raises:
+            ValueError: Operation is not supported for the polars backend.
+
+        Returns:
+            None
+        """
+        if self._polars is not None:
+            raise ValueError(
+                f'{operation} is not supported for the polars backend, convert the dataset with to_pandas()')
+
+    def to_pandas(self):
+        """
+        Return the dataset as a pandas DataFrame, e.g. for NiaARM.
+
+        Discretised columns of the polars backend are converted to ordered
+        categorical columns of intervals, as in the pandas backend.
+
+        Returns:
+            pd.DataFrame: Dataset.
+        """
+        if self._polars is not None and self.data is not None:
+            return self._polars.to_pandas(self.data, self.pipeline.steps)
+        return self.data
 
     def convert(self, target_format=None, output_filename='converted_data'):
         """
         Convert the dataset to the specified target format.
 
+        Parquet and Feather files keep the dtypes of the columns, including
+        categorical and datetime columns set by preprocessing.
+
         Args:
-            target_format (str): Target format for conversion.
+            target_format (str): Target format for conversion ('csv', 'json', 'parquet', 'feather').
             output_filename (str): Name of the output file without extension.
 
         Raises:
@@ -101,66 +1234,83 @@ class Dataset:
         output_filepath = f'{output_filename}.{target_format}'
 
         # Convert data
-        if target_format == 'csv':
+        if self._polars is not None:
+            self._polars.write(self.data, target_format, output_filepath)
+        elif target_format == 'csv':
             self.data.to_csv(output_filepath, index=False)
         elif target_format == 'json':
             self.data.to_json(output_filepath, orient='records')
+        elif target_format == 'parquet':
+            self.data.to_parquet(output_filepath, index=False)
+        elif target_format == 'feather':
+            self.data.reset_index(drop=True).to_feather(output_filepath)
 
-    def identify_dataset(self):
+    @_cached
+    def identify_dataset(self, sample_size=None, compact=False):
         """
         Identify the type of the dataset and store the information.
 
+        With ``compact`` enabled, categorical columns with repeating values are
+        converted to the pandas category dtype, integer columns to the narrowest integer dtype
+        holding their values and float64 columns to float32 when no value
+        changes. The memory usage of the dataset in bytes before and after
+        the conversion is stored in the information under the ``memory`` key.
+
+        Args:
+            sample_size (int, optional): Number of rows sampled to detect text columns early. The result is identical to the full scan. Default is None.
+            compact (bool, optional): Convert columns to compact dtypes. Default is False.
+
         Raises:
             ValueError: Dataset contains invalid column type.
+            ValueError: Compact dtypes are not supported for chunked datasets.
+            ValueError: Compact dtypes are not supported for the polars backend.
 
         Returns:
             None
         """
-        # Initialisation
-        information = {'columns': []}
-        column_types = set()
+        # Validate compact dtypes
+        if compact and self.data is None:
+            raise ValueError(
+                'Compact dtypes are not supported for chunked datasets')
+        if compact:
+            self._validate_backend('Compact dtypes')
+
+        # Profile columns frame by frame
+        if self._polars is not None:
+            profiles = self._polars.profile(self.data)
+        else:
+            profiles = {}
+            for frame in self._frames():
+                for column, profile in _profile_frame(frame, sample_size).items():
+                    if column in profiles:
+                        profile = _merge_profiles(profiles[column], profile)
+                    profiles[column] = profile
 
         # Identify dataset
-        for column in self.data.columns:
-            if self.data[column].dtype == 'object':
-                unique_values = self.data[column].unique()
-                max_str_length = max(len(str(value))
-                                     for value in unique_values)
-                column_info = {
-                    'column': column,
-                    'type': 'categorical' if max_str_length < 25 else 'text',
-                }
-                if max_str_length < 25:
-                    column_info['categories'] = unique_values.tolist()
-                information['columns'].append(column_info)
-                column_types.add(
-                    'categorical' if max_str_length < 25 else 'text')
-            elif self.data[column].dtype == 'datetime64[ns]':
-                information['columns'].append(
-                    {'column': column, 'type': 'time-series'})
-                column_types.add('time-series')
-            else:
-                information['columns'].append(
-                    {
-                        'column': column,
-                        'type': 'numerical',
-                        'min': self.data[column].min(),
-                        'max': self.data[column].max(),
-                    }
-                )
-                column_types.add('numerical')
-
-        # Determine the general type of the dataset
-        if 'time-series' in column_types:
-            information['type'] = 'time-series'
-        elif 'numerical' in column_types and len(column_types) == 1:
-            information['type'] = 'numerical'
-        elif 'categorical' in column_types and len(column_types) == 1:
-            information['type'] = 'categorical'
-        elif 'text' in column_types and len(column_types) == 1:
-            information['type'] = 'text'
-        else:
-            information['type'] = 'mixed'
+        information = _identify_profiles(profiles)
+
+        # Convert columns to compact dtypes
+        if compact:
+            dtypes = {}
+            for column, profile in profiles.items():
+                dtype = _compact_dtype(self.data[column], profile)
+                if dtype is not None:
+                    dtypes[column] = dtype
+            original = self.data
+            if dtypes:
+                self.data = self.data.astype(dtypes)
+
+            # Measure only the converted columns of the original dataset
+            after = int(self.data.memory_usage(deep=True).sum())
+            before = after
+            for column in dtypes:
+                before -= int(self.data[column].memory_usage(index=False, deep=True))
+                if dtypes[column] == 'category':
+                    before += _object_memory_usage(self.data[column])
+                else:
+                    before += int(original[column].memory_usage(index=False))
+            information['memory'] = {
+                'before': before, 'after': after, 'saved': before - after}
 
         # Store information
         self.information = information
@@ -172,7 +1322,7 @@ class Dataset:
         Returns:
             None
         """
-        print(f'Number of attributes: {len(self.data.columns)}')
+        print(f'Number of attributes: {len(self.information["columns"])}')
         print(f'Dataset type: {self.information["type"]}')
 
         for column in self.information['columns']:
@@ -183,6 +1333,12 @@ class Dataset:
             if column['type'] == 'text':
                 print(f'{column["column"]}: long text')
 
+        if 'memory' in self.information:
+            memory = self.information['memory']
+            print(
+                f'Memory usage: {memory["after"]} bytes ({memory["saved"]} bytes saved)')
+
+    @_cached
     def missing_values(self, method):
         """
         Handle missing values using the specified method.
@@ -200,50 +1356,137 @@ class Dataset:
         if method not in ['row', 'column', 'impute']:
             raise ValueError(f'Invalid method: {method}')
 
-        # Handle missing values
+        # Handle missing values, imputing numerical columns in place
+        self._record(self._fit_missing_values(method), copy=False)
+
+    def _fit_missing_values(self, method):
+        """
+        Fit the handling of missing values on the frames of the dataset.
+
+        Args:
+            method (str): Method for handling missing values ('row', 'column', 'impute').
+
+        Returns:
+            dict: Fitted step.
+        """
+        if self._polars is not None:
+            return self._polars.fit_missing_values(self.data, method)
+
+        if method == 'row':
+            return {'step': 'drop_rows'}
+
         if method == 'column':
-            self.data.dropna(axis=1, inplace=True)
-        elif method == 'row':
-            self.data.dropna(axis=0, inplace=True)
-        elif method == 'impute':
-            for column in self.data.columns:
-                if self.data[column].dtype == 'object':
-                    self.data[column].fillna(
-                        self.data[column].mode()[0], inplace=True)
-                elif self.data[column].dtype == 'datetime64[ns]' or self.data[column].dtype == 'category':
-                    self.data[column].fillna(
-                        self.data[column].mode()[0], inplace=True)
+            columns = []
+            for frame in self._frames():
+                for column in frame.columns[frame.isnull().any()]:
+                    if column not in columns:
+                        columns.append(column)
+            return {'step': 'drop_columns', 'columns': columns}
+
+        # Count values of non-numerical columns and sum numerical columns
+        counts, sums, sizes = {}, {}, {}
+        for frame in self._frames():
+            for column, dtype in frame.dtypes.items():
+                if dtype in ['object', 'datetime64[ns]', 'category']:
+                    value_counts = frame[column].value_counts()
+                    counts[column] = value_counts if column not in counts else counts[column].add(
+                        value_counts, fill_value=0)
+                    continue
+
+                # Reduce NumPy arrays directly, skipping missing floats
+                if isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+                    values = frame[column].to_numpy()
+                    present = ~np.isnan(values) if dtype.kind == 'f' else None
+                    total = values.sum(where=present) if present is not None else values.sum()
+                    size = int(present.sum()) if present is not None else len(values)
                 else:
-                    self.data[column].fillna(
-                        self.data[column].mean(), inplace=True)
-
-    def discretise(self, method, num_bins, columns):
+                    total, size = frame[column].sum(), frame[column].count()
+                sums[column] = sums.get(column, 0) + total
+                sizes[column] = sizes.get(column, 0) + size
+
+        # Impute with the mode or mean of each column
+        fill_values = {}
+        for column, value_counts in counts.items():
+            if len(value_counts) > 0:
+                modes = value_counts[value_counts == value_counts.max()]
+                fill_values[column] = modes.sort_index().index[0]
+        for column, total in sums.items():
+            if column not in counts and sizes[column] > 0:
+                fill_values[column] = total / sizes[column]
+        return {'step': 'impute', 'fill_values': fill_values}
+
+    @_cached
+    def discretise(self, method, num_bins, columns, n_jobs=None, rank_error=0.001):
         """
         Discretise the dataset using the specified method.
 
+        Datasets loaded in chunks support the equal width and equal frequency
+        methods. Bin edges of the equal frequency method are then computed
+        with a quantile sketch of each column, updated chunk by chunk. The
+        polars backend supports the equal width, equal frequency and 1D
+        k-means methods.
+
         Args:
             data (pd.DataFrame): Dataset.
-            method (str): Discretisation method ('equal_width', 'equal_frequency', 'kmeans').
+            method (str): Discretisation method ('equal_width', 'equal_frequency', 'kmeans', 'kmeans_1d').
             num_bins (int): Number of bins.
             columns (list): List of columns to discretise.
+            n_jobs (int, optional): Number of threads discretising columns in parallel. -1 uses all processors. Default is None (serial).
+            rank_error (float, optional): Normalised rank error of the quantile sketches of chunked datasets. Default is 0.001.
 
         Raises:
             ValueError: Invalid data type.
             ValueError: Invalid discretisation method.
             ValueError: Columns not specified.
             ValueError: Column type is not numerical.
+            ValueError: Discretisation method is not supported for chunked datasets.
+            ValueError: Discretisation method is not supported for the polars backend.
 
         Returns:
             None
         """
-        Discretisation.discretise(
-            data=self.data,
-            method=method,
-            num_bins=num_bins,
-            columns=columns,
-            information=self.information,
-        )
+        # Validate method, columns and column types
+        Discretisation.validate(method, columns, self.information)
+
+        # Fit discretisation chunk by chunk
+        if self._polars is not None:
+            bins = self._polars.fit_discretisation(
+                self.data, method, num_bins, columns)
+        elif self.data is None and self.chunksize is not None:
+            if method == 'equal_width':
+                moments = _column_moments(self.iter_chunks(), columns)
+                edges = {
+                    column: Discretisation.equal_width_bins(
+                        moments[column]['min'], moments[column]['max'], num_bins)
+                    for column in columns
+                }
+            elif method == 'equal_frequency':
+                sketches = {
+                    column: QuantileSketch(rank_error) for column in columns}
+                for chunk in self.iter_chunks():
+                    thread_map(
+                        lambda column: sketches[column].update(
+                            chunk[column].to_numpy(dtype=np.float64)),
+                        columns, n_jobs)
+                edges = {
+                    column: sketch.quantiles(np.linspace(0, 1, num_bins + 1))
+                    for column, sketch in sketches.items()
+                }
+            else:
+                raise ValueError(
+                    f'Discretisation method {method} is not supported for chunked datasets')
+            bins = {
+                column: {'method': method, 'bins': edges[column]}
+                for column in columns
+            }
+        else:
+            bins = Discretisation.fit(
+                self.data, method, num_bins, columns, n_jobs)
+
+        # Discretise data
+        self._record({'step': 'discretise', 'bins': bins})
 
+    @_cached
     def squash(self, threshold, similarity='euclidean'):
         """
         Squash the dataset using the specified threshold and similarity.
@@ -254,6 +1497,8 @@ class Dataset:
 
         Raises:
             ValueError: Invalid similarity measure.
+            ValueError: Squashing is not supported for the polars backend.
+            ValueError: Squashing is not supported for chunked datasets.
 
         Returns:
             None
@@ -261,16 +1506,25 @@ class Dataset:
         # Validate similarity
         if similarity not in ['euclidean', 'cosine']:
             raise ValueError(f'Invalid similarity measure: {similarity}')
+        self._validate_backend('Squashing')
+        if self.data is None:
+            raise ValueError('Squashing is not supported for chunked datasets')
 
         # Squash data
         self.data = Squash.squash(self.data, threshold, similarity)
 
-    def scale(self, method):
+    @_cached
+    def scale(self, method, dtype=None, copy=True):
         """
         Scale the dataset using the specified method.
 
+        Statistics of all numerical columns are computed in one reduction and
+        applied as one operation on the numerical block of the dataset.
+
         Args:
             method (str): Scaling method ('normalisation', 'standardisation').
+            dtype (str, optional): Floating point dtype of the scaled columns ('float64', 'float32'). Default is 'float64'.
+            copy (bool, optional): Scale a copy of the numerical columns instead of scaling them in place where possible. Default is True.
 
         Raises:
             ValueError: Invalid scaling method.
@@ -279,33 +1533,45 @@ class Dataset:
         if method not in ['normalisation', 'standardisation']:
             raise ValueError(f'Invalid scaling method: {method}')
 
-        # Scale data
-        for column in self.data.columns:
-            # Skip non-numerical columns
-            if self.data[column].dtype in ['datetime64[ns]', 'object']:
-                continue
+        # Fit scaling parameters chunk by chunk
+        if self._polars is not None:
+            parameters = self._polars.fit_scaling(self.data, method)
+        elif self.data is None and self.chunksize is not None:
+            parameters = _scaling_parameters(
+                _column_moments(self.iter_chunks()), method)
+        elif self._valid_moments():
+            parameters = _scaling_parameters(
+                {column: self._moments[column]
+                 for column in Scaling.numerical_columns(self.data)
+                 if column in self._moments},
+                method)
+        else:
+            parameters = Scaling.fit(self.data, method)
 
-            if method == 'normalisation':
-                self.data[column] = (
-                    self.data[column] - self.data[column].min()
-                ) / (self.data[column].max() - self.data[column].min())
-            elif method == 'standardisation':
-                self.data[column] = (
-                    self.data[column] - self.data[column].mean()
-                ) / self.data[column].std()
+        # Scale data
+        self._record(
+            {'step': 'scale', 'parameters': parameters, 'dtype': dtype}, copy)
 
-    def feature_selection(self, method, threshold, class_column):
+    @_cached
+    def feature_selection(self, method, threshold, class_column, n_jobs=None, sample_size=None):
         """
         Select features based on the specified threshold.
 
+        Only the correlations of the features with the class column are
+        computed, see :meth:`FeatureSelection.correlations`.
+
         Args:
             method (str): Feature selection method ('pearson', 'spearman', 'kendall').
             threshold (float): Threshold.
             class_column (str): Name of the column containing class labels.
+            n_jobs (int, optional): Number of threads correlating features in parallel. -1 uses all processors. Default is None (serial).
+            sample_size (int, optional): Number of rows sampled to compute the correlations. Default is None (all rows).
 
         Raises:
             ValueError: Invalid feature selection method.
             ValueError: Column is not numerical.
+            ValueError: Feature selection is not supported for the polars backend.
+            ValueError: Feature selection is not supported for chunked datasets.
 
         Returns:
             None
@@ -313,17 +1579,179 @@ class Dataset:
         # Validate method
         if method not in ['pearson', 'spearman', 'kendall']:
             raise ValueError(f'Invalid feature selection method: {method}')
+        self._validate_backend('Feature selection')
+        if self.data is None:
+            raise ValueError(
+                'Feature selection is not supported for chunked datasets')
 
         # Raise ValueError if column in self.data is not numerical
-        for column in self.data.columns:
-            if self.data[column].dtype not in ['int64', 'float64']:
+        for column, dtype in self.data.dtypes.items():
+            if not isinstance(dtype, np.dtype) or dtype.kind not in 'iuf':
                 raise ValueError(f'Column {column} is not numerical')
 
         # Calculate feature importance
-        feature_importance = self.data.corr(method=method)[class_column]
+        feature_importance = FeatureSelection.correlations(
+            self.data, class_column, method, n_jobs, sample_size)
 
         # Select features
-        self.data = self.data[feature_importance[feature_importance >= threshold].index]
+        self._record({
+            'step': 'select',
+            'columns': feature_importance[feature_importance >= threshold].index.tolist(),
+        })
+
+    def encode(self, columns=None):
+        """
+        Encode the dataset as transactions for association rule mining.
+
+        Args:
+            columns (list, optional): Columns to encode. Default is all columns.
+
+        Raises:
+            ValueError: Encoding is not supported for chunked datasets.
+            ValueError: Encoding is not supported for the polars backend.
+            ValueError: Datetime columns cannot be encoded.
+
+        Returns:
+            Transactions: Encoded transactions.
+        """
+        self._validate_backend('Encoding')
+        if self.data is None:
+            raise ValueError(
+                'Encoding is not supported for chunked datasets')
+        return Transactions(self.data, columns)
+
+    def lazy(self):
+        """
+        Start a deferred execution plan of preprocessing steps.
+
+        Preprocessing methods called on the returned lazy dataset are
+        recorded and executed on this dataset only by
+        :meth:`LazyDataset.collect`, after the plan is optimised.
+
+        Returns:
+            LazyDataset: Lazy dataset.
+        """
+        return LazyDataset(self)
+
+    def _time_index(self, datetime_column):
+        """
+        Return the sorted time index of the datetime column.
+
+        The index holds the positions of the rows sorted by the datetime
+        column, the sorted timestamps and their calendar components. It is
+        built once per datetime column and rebuilt only when the data
+        changes.
+
+        Args:
+            datetime_column (str): Name of the column containing datetime values.
+
+        Returns:
+            dict: Sorted positions, timestamps and calendar components.
+        """
+        values = self.data[datetime_column].to_numpy()
+        key = (id(self.data), len(self.data),
+               values.__array_interface__['data'][0])
+        index = self._time_indices.get(datetime_column)
+        if index is not None and index['key'] == key:
+            return index
+
+        # Sort timestamps once
+        order = np.argsort(values, kind='stable')
+        timestamps = pd.DatetimeIndex(values[order])
+        index = {
+            'key': key,
+            'order': order,
+            'timestamps': timestamps.to_numpy(),
+            'minute': timestamps.minute.to_numpy(),
+            'hour': timestamps.hour.to_numpy(),
+            'day': timestamps.day.to_numpy(),
+            'weekday': timestamps.weekday.to_numpy(),
+            'week': timestamps.isocalendar().week.to_numpy(dtype=float, na_value=np.nan),
+            'month': timestamps.month.to_numpy(),
+            'year': timestamps.year.to_numpy(),
+        }
+        self._time_indices[datetime_column] = index
+        return index
+
+    def filter_by_datetime(
+        self,
+        datetime_column,
+        start_date=None,
+        end_date=None,
+        minute=None,
+        hour=None,
+        day=None,
+        weekday=None,
+        week=None,
+        month=None,
+        year=None,
+    ):
+        """
+        Filter the dataset based on several datetime criteria at once.
+
+        Rows between the start date and end date are located with a binary
+        search in the sorted time index and the calendar components are
+        compared without sorting the dataset again.
+
+        Args:
+            datetime_column (str): Name of the column containing datetime values.
+            start_date (str, optional): Start date. Default is None.
+            end_date (str, optional): End date. Default is None.
+            minute (int, optional): Minute. Default is None.
+            hour (int, optional): Hour. Default is None.
+            day (int, optional): Day. Default is None.
+            weekday (int, optional): Weekday. Default is None.
+            week (int, optional): Week. Default is None.
+            month (int, optional): Month. Default is None.
+            year (int, optional): Year. Default is None.
+
+        Raises:
+            ValueError: Start date is greater than end date.
+            ValueError: Filtering is not supported for chunked datasets.
+
+        Returns:
+            pd.DataFrame | pl.DataFrame: Filtered dataset sorted by the datetime column.
+        """
+        if start_date is not None and end_date is not None and start_date > end_date:
+            raise ValueError(
+                f'Start date ({start_date}) is greater than end date ({end_date})'
+            )
+        if self.data is None:
+            raise ValueError('Filtering is not supported for chunked datasets')
+
+        if self._polars is not None:
+            return self._polars.filter_by_datetime(
+                self.data, datetime_column, start_date, end_date, minute=minute,
+                hour=hour, day=day, weekday=weekday, week=week, month=month, year=year)
+
+        index = self._time_index(datetime_column)
+
+        # Slice rows between dates
+        start, end = 0, len(index['order'])
+        if start_date is not None:
+            start = np.searchsorted(
+                index['timestamps'], pd.Timestamp(start_date).to_datetime64(), side='left')
+        if end_date is not None:
+            end = np.searchsorted(
+                index['timestamps'], pd.Timestamp(end_date).to_datetime64(), side='right')
+        end = max(start, end)
+
+        # Match calendar components
+        mask = np.ones(end - start, dtype=bool)
+        components = {
+            'minute': minute,
+            'hour': hour,
+            'day': day,
+            'weekday': weekday,
+            'week': week,
+            'month': month,
+            'year': year,
+        }
+        for component, value in components.items():
+            if value is not None:
+                mask &= index[component][start:end] == value
+
+        return self.data.iloc[index['order'][start:end][mask]]
 
     def filter_between_dates(
         self, start_date=None, end_date=None, datetime_column=None
@@ -338,6 +1766,7 @@ class Dataset:
 
         Raises:
             ValueError: Start date is greater than end date.
+            ValueError: Filtering is not supported for chunked datasets.
 
         Returns:
             None
@@ -349,14 +1778,8 @@ class Dataset:
                 )
 
             if datetime_column is not None:
-                # Sort dataset based on time-series
-                df = self.data.sort_values(by=datetime_column)
-
-                # Filter dataset based on start date and end date
-                return df[
-                    (self.data[datetime_column] >= start_date)
-                    & (self.data[datetime_column] <= end_date)
-                ]
+                return self.filter_by_datetime(
+                    datetime_column, start_date=start_date, end_date=end_date)
 
         return self.data
 
@@ -368,16 +1791,15 @@ class Dataset:
             minute (int): Minute.
             datetime_column (str): Name of the column containing datetime values.
 
+        Raises:
+            ValueError: Filtering is not supported for chunked datasets.
+
         Returns:
             None
         """
         if minute is not None:
             if datetime_column is not None:
-                # Sort dataset based on time-series
-                df = self.data.sort_values(by=datetime_column)
-
-                # Filter dataset based on minute
-                return df[df[datetime_column].dt.minute == minute]
+                return self.filter_by_datetime(datetime_column, minute=minute)
 
         return self.data
 
@@ -389,16 +1811,15 @@ class Dataset:
             hour (int): Hour.
             datetime_column (str): Name of the column containing datetime values.
 
+        Raises:
+            ValueError: Filtering is not supported for chunked datasets.
+
         Returns:
             None
         """
         if hour is not None:
             if datetime_column is not None:
-                # Sort dataset based on time-series
-                df = self.data.sort_values(by=datetime_column)
-
-                # Filter dataset based on hour
-                return df[df[datetime_column].dt.hour == hour]
+                return self.filter_by_datetime(datetime_column, hour=hour)
 
         return self.data
 
@@ -410,16 +1831,15 @@ class Dataset:
             day (int): Day.
             datetime_column (str): Name of the column containing datetime values.
 
+        Raises:
+            ValueError: Filtering is not supported for chunked datasets.
+
         Returns:
             None
         """
         if day is not None:
             if datetime_column is not None:
-                # Sort dataset based on time-series
-                df = self.data.sort_values(by=datetime_column)
-
-                # Filter dataset based on day
-                return df[df[datetime_column].dt.day == day]
+                return self.filter_by_datetime(datetime_column, day=day)
 
         return self.data
 
@@ -431,16 +1851,15 @@ class Dataset:
             weekday (int): Weekday.
             datetime_column (str): Name of the column containing datetime values.
 
+        Raises:
+            ValueError: Filtering is not supported for chunked datasets.
+
         Returns:
             None
         """
         if weekday is not None:
             if datetime_column is not None:
-                # Sort dataset based on time-series
-                df = self.data.sort_values(by=datetime_column)
-
-                # Filter dataset based on weekday
-                return df[df[datetime_column].dt.weekday == weekday]
+                return self.filter_by_datetime(datetime_column, weekday=weekday)
 
         return self.data
 
@@ -452,16 +1871,15 @@ class Dataset:
             week (int): Week.
             datetime_column (str): Name of the column containing datetime values.
 
+        Raises:
+            ValueError: Filtering is not supported for chunked datasets.
+
         Returns:
             None
         """
         if week is not None:
             if datetime_column is not None:
-                # Sort dataset based on time-series
-                df = self.data.sort_values(by=datetime_column)
-
-                # Filter dataset based on week
-                return df[df[datetime_column].dt.isocalendar().week == week]
+                return self.filter_by_datetime(datetime_column, week=week)
 
         return self.data
 
@@ -473,16 +1891,15 @@ class Dataset:
             month (int): Month.
             datetime_column (str): Name of the column containing datetime values.
 
+        Raises:
+            ValueError: Filtering is not supported for chunked datasets.
+
         Returns:
             None
         """
         if month is not None:
             if datetime_column is not None:
-                # Sort dataset based on time-series
-                df = self.data.sort_values(by=datetime_column)
-
-                # Filter dataset based on month
-                return df[df[datetime_column].dt.month == month]
+                return self.filter_by_datetime(datetime_column, month=month)
 
         return self.data
 
@@ -494,15 +1911,14 @@ class Dataset:
             year (int): Year.
             datetime_column (str): Name of the column containing datetime values.
 
+        Raises:
+            ValueError: Filtering is not supported for chunked datasets.
+
         Returns:
             None
         """
         if year is not None:
             if datetime_column is not None:
-                # Sort dataset based on time-series
-                df = self.data.sort_values(by=datetime_column)
-
-                # Filter dataset based on year
-                return df[df[datetime_column].dt.year == year]
+                return self.filter_by_datetime(datetime_column, year=year)
 
         return self.data
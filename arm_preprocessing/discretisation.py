@@ -1,6 +1,7 @@
+import contextlib
+import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
+from arm_preprocessing._parallel import thread_map, workers
 
 
 class Discretisation:
@@ -9,16 +10,17 @@ class Discretisation:
     """
 
     def discretise(
-        data, method="equal_width", num_bins=10, columns=[], information=None
+        data, method="equal_width", num_bins=10, columns=[], information=None, n_jobs=None
     ):
         """
         Discretise the dataset using the specified method.
 
         Args:
             data (pd.DataFrame): Dataset.
-            method (str): Discretisation method ('equal_width', 'equal_frequency', 'kmeans').
+            method (str): Discretisation method ('equal_width', 'equal_frequency', 'kmeans', 'kmeans_1d').
             num_bins (int): Number of bins.
             columns (list): List of columns to discretise.
+            n_jobs (int, optional): Number of threads discretising columns in parallel. -1 uses all processors. Default is None (serial).
 
         Raises:
             ValueError: Invalid data type.
@@ -33,8 +35,162 @@ class Discretisation:
         if not isinstance(data, pd.DataFrame):
             raise ValueError('Invalid data type')
 
+        # Validate method, columns and column types
+        Discretisation.validate(method, columns, information)
+
+        # Discretise data
+        bins = Discretisation.fit(data, method, num_bins, columns, n_jobs)
+        return Discretisation.transform(data, bins, n_jobs)
+
+    def fit(data, method, num_bins, columns, n_jobs=None):
+        """
+        Fit the discretisation of the specified columns.
+
+        Columns are fitted in parallel threads when ``n_jobs`` is specified.
+        Threads share the column arrays of the dataset, so no data is copied
+        between workers.
+
+        Args:
+            data (pd.DataFrame): Dataset.
+            method (str): Discretisation method ('equal_width', 'equal_frequency', 'kmeans', 'kmeans_1d').
+            num_bins (int): Number of bins.
+            columns (list): List of columns to discretise.
+            n_jobs (int, optional): Number of threads fitting columns in parallel. -1 uses all processors. Default is None (serial).
+
+        Returns:
+            dict: Fitted discretisation of each column, i.e. its method with bin edges or
+            standardisation parameters and cluster centres.
+        """
+        def fit_column(column):
+            return Discretisation._fit_column(data[column], method, num_bins)
+
+        # Limit k-means to one thread per column when columns run in parallel
+        limits = contextlib.nullcontext()
+        if method == 'kmeans' and workers(n_jobs, columns) > 1:
+            # threadpoolctl is not a declared dependency, but installed with scikit-learn
+            try:
+                from threadpoolctl import threadpool_limits
+                limits = threadpool_limits(limits=1)
+            except ImportError:
+                pass
+        with limits:
+            fitted = thread_map(fit_column, columns, n_jobs)
+        return dict(zip(columns, fitted))
+
+    def transform(data, bins, n_jobs=None):
+        """
+        Discretise the dataset using fitted discretisation.
+
+        Args:
+            data (pd.DataFrame): Dataset.
+            bins (dict): Fitted discretisation of each column as returned by :meth:`fit`.
+            n_jobs (int, optional): Number of threads discretising columns in parallel. -1 uses all processors. Default is None (serial).
+
+        Returns:
+            pd.DataFrame: Discretised dataset.
+        """
+        def transform_column(column):
+            return Discretisation._transform_column(data[column], bins[column])
+
+        columns = list(bins)
+        for column, values in zip(columns, thread_map(transform_column, columns, n_jobs)):
+            data[column] = values
+        return data
+
+    def _fit_column(values, method, num_bins):
+        """
+        Fit the discretisation of a single column.
+
+        Args:
+            values (pd.Series): Column to discretise.
+            method (str): Discretisation method ('equal_width', 'equal_frequency', 'kmeans', 'kmeans_1d').
+            num_bins (int): Number of bins.
+
+        Returns:
+            dict: Fitted discretisation of the column.
+        """
+        if method == 'equal_width':
+            return {
+                'method': method,
+                'bins': Discretisation.equal_width_bins(
+                    values.min(), values.max(), num_bins),
+            }
+        elif method == 'equal_frequency':
+            quantiles = np.linspace(0, 1, num_bins + 1)
+            return {
+                'method': method,
+                'bins': values.quantile(quantiles).to_numpy(),
+            }
+        elif method == 'kmeans_1d':
+            return {
+                'method': method,
+                'bins': Discretisation.kmeans_1d_bins(values.to_numpy(), num_bins),
+            }
+
+        # sklearn is only imported for k-means, as importing it takes a second
+        from sklearn.cluster import KMeans
+        from sklearn.preprocessing import StandardScaler
+
+        # Standardise data
+        scaler = StandardScaler()
+        standardised = scaler.fit_transform(values.values.reshape(-1, 1))
+
+        # Perform k-means clustering
+        kmeans = KMeans(n_clusters=num_bins, n_init='auto')
+        kmeans.fit(standardised)
+
+        return {
+            'method': method,
+            'mean': scaler.mean_[0],
+            'scale': scaler.scale_[0],
+            'centres': kmeans.cluster_centers_[:, 0],
+        }
+
+    def _transform_column(values, fitted):
+        """
+        Discretise a single column using its fitted discretisation.
+
+        Args:
+            values (pd.Series): Column to discretise.
+            fitted (dict): Fitted discretisation of the column.
+
+        Returns:
+            pd.Series | np.ndarray: Discretised column.
+        """
+        if fitted['method'] in ['equal_width', 'kmeans_1d']:
+            return pd.cut(values, bins=fitted['bins'])
+        elif fitted['method'] == 'equal_frequency':
+            return pd.cut(values, bins=fitted['bins'], include_lowest=True)
+
+        # Standardise data
+        standardised = (values.to_numpy() - fitted['mean']) / fitted['scale']
+
+        # Assign cluster labels of the nearest centres
+        labels = np.abs(
+            standardised[:, None] - fitted['centres'][None, :]).argmin(axis=1)
+        names = np.array(
+            [f'Cluster {label}' for label in range(len(fitted['centres']))], dtype=object)
+        return names[labels]
+
+    def validate(method, columns, information):
+        """
+        Validate the discretisation method and columns.
+
+        Args:
+            method (str): Discretisation method ('equal_width', 'equal_frequency', 'kmeans', 'kmeans_1d').
+            columns (list): List of columns to discretise.
+            information (dict): Information about the dataset.
+
+        Raises:
+            ValueError: Invalid discretisation method.
+            ValueError: Columns not specified.
+            ValueError: Column type is not numerical.
+
+        Returns:
+            None
+        """
         # Validate method
-        if method not in ['equal_width', 'equal_frequency', 'kmeans']:
+        if method not in ['equal_width', 'equal_frequency', 'kmeans', 'kmeans_1d']:
             raise ValueError(f'Invalid discretisation method: {method}')
 
         # Validate columns
@@ -42,6 +198,8 @@ class Discretisation:
             raise ValueError('Columns not specified')
 
         # Validate column type
+        if information is None:
+            return
         for column in columns:
             for column_info in information['columns']:
                 if (
@@ -50,24 +208,150 @@ class Discretisation:
                 ):
                     raise ValueError(f'Column {column} is not numerical')
 
-        # Discretise data
-        for column in columns:
-            if method == 'equal_width':
-                data[column] = pd.cut(data[column], bins=num_bins, labels=None)
-            elif method == 'equal_frequency':
-                data[column] = pd.qcut(data[column], q=num_bins, labels=None)
-            elif method == 'kmeans':
-                # Standardise data
-                scaler = StandardScaler()
-                data[column] = scaler.fit_transform(
-                    data[column].values.reshape(-1, 1))
-
-                # Perform k-means clustering
-                kmeans = KMeans(n_clusters=num_bins, n_init='auto')
-                kmeans.fit(data[column].values.reshape(-1, 1))
-
-                # Assign cluster labels
-                labels = [f'Cluster {label}' for label in kmeans.labels_]
-                data[column] = labels
+    def equal_width_bins(minimum, maximum, num_bins):
+        """
+        Compute equal width bin edges matching ``pd.cut`` with an integer
+        number of bins.
 
-        return data
+        Args:
+            minimum (float): Minimum value of the column.
+            maximum (float): Maximum value of the column.
+            num_bins (int): Number of bins.
+
+        Returns:
+            np.ndarray: Bin edges.
+        """
+        minimum, maximum = float(minimum), float(maximum)
+        if minimum == maximum:
+            minimum -= 0.001 * abs(minimum) if minimum != 0 else 0.001
+            maximum += 0.001 * abs(maximum) if maximum != 0 else 0.001
+            return np.linspace(minimum, maximum, num_bins + 1)
+
+        bins = np.linspace(minimum, maximum, num_bins + 1)
+        bins[0] -= (maximum - minimum) * 0.001
+        return bins
+
+    def kmeans_1d_bins(values, num_bins, max_groups=1024, max_iter=300):
+        """
+        Compute bin edges of one-dimensional k-means clustering.
+
+        The values are sorted once and compressed to their unique values with
+        counts. Optimal clusters are found by dynamic programming over at most
+        ``max_groups`` groups of neighbouring values, which is exact when the
+        column has no more unique values than ``max_groups``. The clusters are
+        then refined with Lloyd's iterations on all unique values, where every
+        iteration locates the midpoints between neighbouring centres with a
+        binary search and updates the centres from prefix sums. The result is
+        deterministic.
+
+        Args:
+            values (np.ndarray): Values of the column.
+            num_bins (int): Number of bins.
+            max_groups (int, optional): Maximum number of groups for dynamic programming. Default is 1024.
+            max_iter (int, optional): Maximum number of Lloyd's iterations. Default is 300.
+
+        Raises:
+            ValueError: Column contains no values.
+
+        Returns:
+            np.ndarray: Bin edges. The first edge is extended below the minimum as in ``pd.cut``.
+        """
+        # Compress sorted values to unique values with counts
+        values = np.asarray(values, dtype=float)
+        unique_values, counts = np.unique(
+            values[~np.isnan(values)], return_counts=True)
+        if len(unique_values) == 0:
+            raise ValueError('Column contains no values')
+        minimum, maximum = unique_values[0], unique_values[-1]
+        if len(unique_values) == 1:
+            return Discretisation.equal_width_bins(minimum, maximum, num_bins)
+        weights = np.concatenate([[0], np.cumsum(counts)])
+        sums = np.concatenate([[0], np.cumsum(counts * unique_values)])
+
+        # Group neighbouring values with roughly equal counts
+        if len(unique_values) > max_groups:
+            ranks = np.arange(1, max_groups) / max_groups * weights[-1]
+            splits = np.unique(np.clip(
+                np.searchsorted(weights[1:], ranks) + 1, 1, len(unique_values) - 1))
+            starts = np.concatenate([[0], splits])
+            ends = np.concatenate([splits, [len(unique_values)]])
+            group_weights = weights[ends] - weights[starts]
+
+            # Drop empty groups of heavily tied values
+            present = group_weights > 0
+            group_weights = group_weights[present].astype(float)
+            group_values = (sums[ends] - sums[starts])[present] / group_weights
+        else:
+            group_weights, group_values = counts.astype(float), unique_values
+
+        # Find optimal centres of the groups and refine them
+        centres = Discretisation._kmeans_1d_optimal(
+            group_values, group_weights, num_bins)
+        for _ in range(max_iter):
+            boundaries = (centres[:-1] + centres[1:]) / 2
+            splits = np.searchsorted(unique_values, boundaries, side='right')
+            starts = np.concatenate([[0], splits])
+            ends = np.concatenate([splits, [len(unique_values)]])
+            cluster_weights = weights[ends] - weights[starts]
+            cluster_sums = sums[ends] - sums[starts]
+            updated = np.where(
+                cluster_weights > 0, cluster_sums / np.maximum(cluster_weights, 1), centres)
+            if np.array_equal(updated, centres):
+                break
+            centres = updated
+        boundaries = (centres[:-1] + centres[1:]) / 2
+
+        # Extend the first edge below the minimum as in pd.cut
+        bins = np.concatenate([[minimum], boundaries, [maximum]])
+        bins[0] -= (maximum - minimum) * 0.001
+        return bins
+
+    def _kmeans_1d_optimal(values, weights, num_clusters):
+        """
+        Compute optimal centres of weighted one-dimensional k-means clustering
+        of sorted values by dynamic programming.
+
+        Args:
+            values (np.ndarray): Sorted values.
+            weights (np.ndarray): Weights of the values.
+            num_clusters (int): Number of clusters.
+
+        Returns:
+            np.ndarray: Sorted centres.
+        """
+        size = len(values)
+        num_clusters = min(num_clusters, size)
+
+        # Within-cluster sum of squares of values start..end from prefix sums
+        shifted = values - np.average(values, weights=weights)
+        total_weights = np.concatenate([[0], np.cumsum(weights)])
+        total_sums = np.concatenate([[0], np.cumsum(weights * shifted)])
+        total_squares = np.concatenate(
+            [[0], np.cumsum(weights * shifted ** 2)])
+        start, end = np.triu_indices(size)
+        costs = np.full((size, size), np.inf)
+        cluster_sums = total_sums[end + 1] - total_sums[start]
+        costs[start, end] = (
+            total_squares[end + 1] - total_squares[start]
+            - cluster_sums ** 2 / (total_weights[end + 1] - total_weights[start])
+        )
+
+        # Minimal costs of the first values split into clusters
+        minimal = costs[0]
+        first = []
+        for _ in range(1, num_clusters):
+            candidates = np.full((size, size), np.inf)
+            candidates[1:] = minimal[:-1, None] + costs[1:]
+            first.append(candidates.argmin(axis=0))
+            minimal = candidates.min(axis=0)
+
+        # Recover the clusters from the last value backwards
+        centres = []
+        end = size - 1
+        for starts in reversed(first):
+            start = starts[end]
+            centres.append(np.average(
+                values[start:end + 1], weights=weights[start:end + 1]))
+            end = start - 1
+        centres.append(np.average(values[:end + 1], weights=weights[:end + 1]))
+        return np.array(centres[::-1])
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+from arm_preprocessing._parallel import thread_map
+
+
+class FeatureSelection:
+    """
+    FeatureSelection class.
+    """
+
+    def correlations(data, class_column, method, n_jobs=None, sample_size=None):
+        """
+        Compute the correlation of every column with the class column.
+
+        Only the correlations with the class column are computed instead of
+        the full correlation matrix. Pearson and Spearman correlations of
+        columns without missing values are computed at once on the rank
+        transformed block of the dataset, while Kendall's tau is computed in
+        O(n log n) per column. Missing values are dropped pairwise, as in
+        :meth:`pandas.DataFrame.corr`.
+
+        Args:
+            data (pd.DataFrame): Numerical dataset.
+            class_column (str): Name of the column containing class labels.
+            method (str): Correlation method ('pearson', 'spearman', 'kendall').
+            n_jobs (int, optional): Number of threads correlating columns in parallel. -1 uses all processors. Default is None (serial).
+            sample_size (int, optional): Number of rows sampled to compute the correlations. Default is None (all rows).
+
+        Raises:
+            ValueError: Invalid correlation method.
+
+        Returns:
+            pd.Series: Correlation of each column with the class column.
+        """
+        # Validate method
+        if method not in ['pearson', 'spearman', 'kendall']:
+            raise ValueError(f'Invalid correlation method: {method}')
+
+        # Sample rows
+        if sample_size is not None and len(data) > sample_size:
+            positions = np.random.default_rng(0).choice(
+                len(data), sample_size, replace=False)
+            data = data.iloc[np.sort(positions)]
+
+        values = data.to_numpy(dtype=np.float64)
+        target = data[class_column].to_numpy(dtype=np.float64)
+        present = ~np.isnan(values)
+        target_present = ~np.isnan(target)
+        result = np.full(values.shape[1], np.nan)
+
+        # Correlate columns without missing values at once
+        complete = np.zeros(values.shape[1], dtype=bool)
+        if method != 'kendall' and target_present.all():
+            complete = present.all(axis=0)
+            if complete.any():
+                result[complete] = FeatureSelection._correlate(
+                    values[:, complete], target, method)
+
+        # Correlate remaining columns one by one without missing pairs
+        def correlate(position):
+            mask = present[:, position] & target_present
+            if mask.sum() < 2:
+                return np.nan
+            if method == 'kendall':
+                from scipy.stats import kendalltau
+                return kendalltau(values[mask, position], target[mask])[0]
+            return FeatureSelection._correlate(
+                values[mask, position][:, None], target[mask], method)[0]
+
+        remaining = np.flatnonzero(~complete).tolist()
+        result[remaining] = thread_map(correlate, remaining, n_jobs)
+        return pd.Series(result, index=data.columns)
+
+    def _correlate(values, target, method):
+        """
+        Compute Pearson or Spearman correlations of the columns of an array
+        without missing values with the target.
+
+        Args:
+            values (np.ndarray): Array with one column per dataset column.
+            target (np.ndarray): Values of the class column.
+            method (str): Correlation method ('pearson', 'spearman').
+
+        Returns:
+            np.ndarray: Correlation of each column.
+        """
+        if len(target) < 2:
+            return np.full(values.shape[1], np.nan)
+        if method == 'spearman':
+            from scipy.stats import rankdata
+            values, target = rankdata(values, axis=0), rankdata(target)
+        values = values - values.mean(axis=0)
+        target = target - target.mean()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            correlations = (target @ values) / np.sqrt(
+                np.einsum('ij,ij->j', values, values) * (target @ target))
+        return np.clip(correlations, -1, 1)
@@ -0,0 +1,351 @@
+import numpy as np
+import pandas as pd
+from arm_preprocessing.discretisation import Discretisation
+from arm_preprocessing.scaling import Scaling
+
+
+class LazyDataset:
+    """
+    Deferred execution plan of preprocessing steps of a dataset.
+
+    Preprocessing methods called on a lazy dataset are not executed. They
+    are recorded in a logical plan, which is optimised and executed on the
+    dataset by :meth:`collect`. The optimiser applies two rules:
+
+    - Feature selection is moved before scaling, as the correlations are
+      invariant to scaling. Columns removed by the feature selection are
+      then neither scaled nor discretised.
+    - Scaling followed by discretisation is fused into one pass, where the
+      discretised columns are scaled, fitted and discretised without
+      storing their scaled values in the dataset.
+
+    The result is the same as calling the methods on the dataset one by one,
+    and the fitted steps are recorded in the pipeline of the dataset.
+
+    Args:
+        dataset (Dataset): Dataset to preprocess.
+
+    Attributes:
+        dataset (Dataset): Dataset to preprocess.
+        plan (list): Logical plan, i.e. the recorded operations with their arguments.
+
+    Example:
+        >>> dataset.lazy().missing_values('impute').scale('normalisation').discretise(
+        ...     'equal_width', 5, ['Height']).collect()
+    """
+
+    def __init__(self, dataset):
+        """
+        Initialise a LazyDataset instance.
+
+        Args:
+            dataset (Dataset): Dataset to preprocess.
+        """
+        self.dataset = dataset
+        self.plan = []
+
+    def missing_values(self, method):
+        """
+        Record the handling of missing values, see :meth:`Dataset.missing_values`.
+
+        Args:
+            method (str): Method for handling missing values ('row', 'column', 'impute').
+
+        Raises:
+            ValueError: Invalid method.
+
+        Returns:
+            LazyDataset: The lazy dataset.
+        """
+        # Validate method
+        if method not in ['row', 'column', 'impute']:
+            raise ValueError(f'Invalid method: {method}')
+
+        return self._append('missing_values', method=method)
+
+    def discretise(self, method, num_bins, columns, n_jobs=None, rank_error=0.001):
+        """
+        Record the discretisation of columns, see :meth:`Dataset.discretise`.
+
+        Args:
+            method (str): Discretisation method ('equal_width', 'equal_frequency', 'kmeans', 'kmeans_1d').
+            num_bins (int): Number of bins.
+            columns (list): List of columns to discretise.
+            n_jobs (int, optional): Number of threads discretising columns in parallel. -1 uses all processors. Default is None (serial).
+            rank_error (float, optional): Normalised rank error of the quantile sketches of chunked datasets. Default is 0.001.
+
+        Raises:
+            ValueError: Invalid discretisation method.
+            ValueError: Columns not specified.
+
+        Returns:
+            LazyDataset: The lazy dataset.
+        """
+        # Validate method and columns
+        Discretisation.validate(method, columns, None)
+
+        return self._append(
+            'discretise', method=method, num_bins=num_bins, columns=list(columns),
+            n_jobs=n_jobs, rank_error=rank_error)
+
+    def squash(self, threshold, similarity='euclidean'):
+        """
+        Record the squashing of the dataset, see :meth:`Dataset.squash`.
+
+        Args:
+            threshold (float): Threshold.
+            similarity (str): Similarity measure ('euclidean', 'cosine').
+
+        Raises:
+            ValueError: Invalid similarity measure.
+
+        Returns:
+            LazyDataset: The lazy dataset.
+        """
+        # Validate similarity
+        if similarity not in ['euclidean', 'cosine']:
+            raise ValueError(f'Invalid similarity measure: {similarity}')
+
+        return self._append('squash', threshold=threshold, similarity=similarity)
+
+    def scale(self, method, dtype=None, copy=True):
+        """
+        Record the scaling of the dataset, see :meth:`Dataset.scale`.
+
+        Args:
+            method (str): Scaling method ('normalisation', 'standardisation').
+            dtype (str, optional): Floating point dtype of the scaled columns ('float64', 'float32'). Default is 'float64'.
+            copy (bool, optional): Scale a copy of the numerical columns instead of scaling them in place where possible. Default is True.
+
+        Raises:
+            ValueError: Invalid scaling method.
+
+        Returns:
+            LazyDataset: The lazy dataset.
+        """
+        # Validate method
+        if method not in ['normalisation', 'standardisation']:
+            raise ValueError(f'Invalid scaling method: {method}')
+
+        return self._append('scale', method=method, dtype=dtype, copy=copy)
+
+    def feature_selection(self, method, threshold, class_column, n_jobs=None, sample_size=None):
+        """
+        Record the feature selection, see :meth:`Dataset.feature_selection`.
+
+        Args:
+            method (str): Feature selection method ('pearson', 'spearman', 'kendall').
+            threshold (float): Threshold.
+            class_column (str): Name of the column containing class labels.
+            n_jobs (int, optional): Number of threads correlating features in parallel. -1 uses all processors. Default is None (serial).
+            sample_size (int, optional): Number of rows sampled to compute the correlations. Default is None (all rows).
+
+        Raises:
+            ValueError: Invalid feature selection method.
+
+        Returns:
+            LazyDataset: The lazy dataset.
+        """
+        # Validate method
+        if method not in ['pearson', 'spearman', 'kendall']:
+            raise ValueError(f'Invalid feature selection method: {method}')
+
+        return self._append(
+            'feature_selection', method=method, threshold=threshold,
+            class_column=class_column, n_jobs=n_jobs, sample_size=sample_size)
+
+    def optimise(self):
+        """
+        Optimise the logical plan.
+
+        Returns:
+            list: Optimised plan. Fused scaling and discretisation is the
+            'scale_discretise' operation with the arguments of both operations.
+        """
+        plan = [dict(operation) for operation in self.plan]
+
+        # Move feature selection before scaling to float64
+        if self._selection_commutes():
+            position = 1
+            while position < len(plan):
+                previous, operation = plan[position - 1], plan[position]
+                if (
+                    operation['operation'] == 'feature_selection'
+                    and previous['operation'] == 'scale'
+                    and previous['arguments']['dtype'] in [None, 'float64']
+                ):
+                    plan[position - 1], plan[position] = operation, previous
+                    position = max(1, position - 1)
+                else:
+                    position += 1
+
+        # Fuse scaling followed by discretisation of loaded pandas datasets,
+        # unless the result of every step is cached
+        if not isinstance(self.dataset.data, pd.DataFrame) or self.dataset.result_cache is not None:
+            return plan
+        optimised = []
+        for operation in plan:
+            if (
+                operation['operation'] == 'discretise'
+                and len(optimised) > 0
+                and optimised[-1]['operation'] == 'scale'
+            ):
+                optimised[-1] = {
+                    'operation': 'scale_discretise',
+                    'arguments': {
+                        'scale': optimised[-1]['arguments'],
+                        'discretise': operation['arguments'],
+                    },
+                }
+            else:
+                optimised.append(operation)
+        return optimised
+
+    def explain(self):
+        """
+        Describe the optimised plan.
+
+        Returns:
+            list: One line per operation of the optimised plan.
+        """
+        lines = []
+        for operation in self.optimise():
+            if operation['operation'] == 'scale_discretise':
+                arguments = [
+                    f'{name}({LazyDataset._format_arguments(operation["arguments"][name])})'
+                    for name in ['scale', 'discretise']
+                ]
+                lines.append(f'scale_discretise({", ".join(arguments)})')
+            else:
+                lines.append(
+                    f'{operation["operation"]}({LazyDataset._format_arguments(operation["arguments"])})')
+        return lines
+
+    def collect(self):
+        """
+        Optimise and execute the plan on the dataset. The plan is cleared.
+
+        Raises:
+            ValueError: Preprocessing step is invalid for the dataset.
+
+        Returns:
+            Dataset: The preprocessed dataset.
+        """
+        plan = self.optimise()
+        self.plan = []
+        for operation in plan:
+            if operation['operation'] == 'scale_discretise':
+                LazyDataset._scale_discretise(
+                    self.dataset, operation['arguments']['scale'],
+                    operation['arguments']['discretise'])
+            else:
+                getattr(self.dataset, operation['operation'])(
+                    **operation['arguments'])
+        return self.dataset
+
+    def _append(self, operation, **arguments):
+        """
+        Append an operation to the logical plan.
+
+        Args:
+            operation (str): Name of the Dataset method.
+            **arguments: Arguments of the method.
+
+        Returns:
+            LazyDataset: The lazy dataset.
+        """
+        self.plan.append({'operation': operation, 'arguments': arguments})
+        return self
+
+    def _selection_commutes(self):
+        """
+        Check whether feature selection gives the same result before scaling.
+
+        Scaling subtracts an offset and divides by a non-negative factor,
+        which changes no Pearson, Spearman or Kendall correlation. Boolean
+        columns are however only accepted by feature selection once scaling
+        has converted them to floats.
+
+        Returns:
+            bool: Feature selection commutes with scaling.
+        """
+        data = self.dataset.data
+        if not isinstance(data, pd.DataFrame):
+            return False
+        return not any(
+            isinstance(dtype, np.dtype) and dtype.kind == 'b' for dtype in data.dtypes)
+
+    def _scale_discretise(dataset, scale, discretise):
+        """
+        Scale and discretise a loaded dataset in one pass.
+
+        The discretised columns are scaled into temporary arrays, from which
+        their bins are fitted and their intervals computed, so only the other
+        numerical columns are scaled in the dataset.
+
+        Args:
+            dataset (Dataset): Loaded dataset.
+            scale (dict): Arguments of :meth:`Dataset.scale`.
+            discretise (dict): Arguments of :meth:`Dataset.discretise`.
+
+        Raises:
+            ValueError: Invalid discretisation method.
+            ValueError: Columns not specified.
+            ValueError: Column type is not numerical.
+
+        Returns:
+            None
+        """
+        # Validate method, columns and column types
+        Discretisation.validate(
+            discretise['method'], discretise['columns'], dataset.information)
+
+        data = dataset.data
+        parameters = Scaling.fit(data, scale['method'])
+        columns = discretise['columns']
+        fused = [column for column in columns if column in parameters]
+
+        # Scale the remaining numerical columns
+        remaining = {
+            column: value for column, value in parameters.items() if column not in fused}
+        if scale['copy']:
+            data = data.copy(deep=False)
+        data = Scaling.transform(data, remaining, scale['dtype'], scale['copy'])
+
+        # Fit and discretise the scaled columns without storing them
+        dtype = np.dtype(scale['dtype'] if scale['dtype'] is not None else np.float64)
+        scaled = {}
+        for column in fused:
+            offset, factor = parameters[column]
+            values = dataset.data[column].to_numpy(dtype=dtype, copy=True)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                values -= dtype.type(offset)
+                values /= dtype.type(factor)
+            scaled[column] = pd.Series(values, index=data.index, name=column)
+        sources = pd.DataFrame(
+            {column: scaled[column] if column in scaled else data[column] for column in columns},
+            index=data.index)
+        bins = Discretisation.fit(
+            sources, discretise['method'], discretise['num_bins'], columns,
+            discretise['n_jobs'])
+        sources = Discretisation.transform(sources, bins, discretise['n_jobs'])
+        for column in columns:
+            data[column] = sources[column]
+        dataset.data = data
+
+        # Record both steps for replaying
+        dataset.pipeline.append(
+            {'step': 'scale', 'parameters': parameters, 'dtype': scale['dtype']})
+        dataset.pipeline.append({'step': 'discretise', 'bins': bins})
+
+    def _format_arguments(arguments):
+        """
+        Format the arguments of an operation.
+
+        Args:
+            arguments (dict): Arguments.
+
+        Returns:
+            str: Arguments separated by commas.
+        """
+        return ', '.join(f'{name}={value!r}' for name, value in arguments.items())
@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+from arm_preprocessing.discretisation import Discretisation
+from arm_preprocessing.scaling import Scaling
+
+
+class Pipeline:
+    """
+    Sequence of fitted preprocessing steps.
+
+    Every preprocessing step applied to a :class:`~arm_preprocessing.dataset.Dataset`
+    is recorded together with its fitted parameters (fill values, scaling
+    parameters, bin edges, cluster centres, selected columns), so the same
+    preprocessing can be replayed on new data without refitting. Squashing is
+    not recorded as it depends on the rows of the dataset.
+
+    Each step is a dictionary with the ``step`` key ('drop_rows',
+    'drop_columns', 'impute', 'scale', 'discretise', 'select') and the
+    fitted parameters of the step.
+
+    Args:
+        steps (list, optional): Fitted steps. Default is an empty list.
+
+    Attributes:
+        steps (list): Fitted steps.
+    """
+
+    def __init__(self, steps=None):
+        """
+        Initialise a Pipeline instance.
+
+        Args:
+            steps (list, optional): Fitted steps. Default is an empty list.
+        """
+        self.steps = list(steps) if steps is not None else []
+
+    def __len__(self):
+        return len(self.steps)
+
+    def append(self, step):
+        """
+        Append a fitted step to the pipeline.
+
+        Args:
+            step (dict): Fitted step.
+
+        Returns:
+            None
+        """
+        self.steps.append(step)
+
+    def transform(self, data, copy=True):
+        """
+        Apply the fitted steps to the data.
+
+        Args:
+            data (pd.DataFrame): Data to transform.
+            copy (bool, optional): Transform a copy of the data instead of modifying it. Default is True.
+
+        Raises:
+            ValueError: Invalid data type.
+            ValueError: Invalid step.
+
+        Returns:
+            pd.DataFrame: Transformed data.
+        """
+        # Validate data
+        if not isinstance(data, pd.DataFrame):
+            raise ValueError('Invalid data type')
+
+        if copy:
+            data = data.copy()
+        for step in self.steps:
+            data = Pipeline.apply_step(data, step, copy=False)
+        return data
+
+    def apply_step(data, step, copy=True):
+        """
+        Apply a single fitted step to the data.
+
+        Args:
+            data (pd.DataFrame): Data to transform. Modified in place where possible.
+            step (dict): Fitted step.
+            copy (bool, optional): Impute and scale a copy of the numerical columns instead of modifying them in place where possible. Default is True.
+
+        Raises:
+            ValueError: Invalid step.
+
+        Returns:
+            pd.DataFrame: Transformed data.
+        """
+        if step['step'] == 'drop_rows':
+            return data.dropna(axis=0)
+        elif step['step'] == 'drop_columns':
+            return data.drop(
+                columns=[column for column in step['columns'] if column in data.columns])
+        elif step['step'] == 'impute':
+            return Pipeline.impute(data, step['fill_values'], copy)
+        elif step['step'] == 'scale':
+            return Scaling.transform(data, step['parameters'], step.get('dtype'), copy)
+        elif step['step'] == 'discretise':
+            return Discretisation.transform(data, step['bins'])
+        elif step['step'] == 'select':
+            return data[step['columns']]
+        raise ValueError(f'Invalid step: {step["step"]}')
+
+    def impute(data, fill_values, copy=True):
+        """
+        Fill missing values of the columns with their fill values.
+
+        Floating point columns with numerical fill values are filled on their
+        NumPy arrays, in place when ``copy`` is False, and integer and boolean
+        columns, which cannot hold missing values, are skipped. The remaining
+        columns, including categorical columns read as floats because a chunk
+        holds none of their values, are filled with one
+        :meth:`pandas.DataFrame.fillna` call.
+
+        Args:
+            data (pd.DataFrame): Data to impute.
+            fill_values (dict): Fill value of each column.
+            copy (bool, optional): Impute a copy of the numerical columns instead of imputing them in place where possible. Default is True.
+
+        Returns:
+            pd.DataFrame: Imputed data.
+        """
+        if copy:
+            data = data.copy(deep=False)
+        others = {}
+        for column, value in fill_values.items():
+            if column not in data.columns:
+                continue
+            dtype = data[column].dtype
+            if not isinstance(dtype, np.dtype) or dtype.kind not in 'biuf':
+                others[column] = value
+            elif dtype.kind == 'f' and not isinstance(value, (int, float, np.number)):
+                # Categorical columns without values in a chunk are read as floats
+                others[column] = value
+            elif dtype.kind == 'f':
+                values = data[column].to_numpy()
+                missing = np.isnan(values)
+                if not missing.any():
+                    continue
+                if copy or not values.flags.writeable:
+                    values = values.copy()
+                    values[missing] = value
+                    data[column] = values
+                else:
+                    values[missing] = value
+        if not others:
+            return data
+        if copy:
+            return data.fillna(others)
+        data.fillna(others, inplace=True)
+        return data
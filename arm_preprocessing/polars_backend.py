@@ -0,0 +1,570 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+from arm_preprocessing.discretisation import Discretisation
+
+
+class PolarsBackend:
+    """
+    Polars implementation of the Dataset operations.
+
+    Columns are profiled, fitted and transformed with Polars expressions,
+    which are evaluated for all columns at once by the multithreaded Polars
+    engine. Files are scanned lazily, so only the selected columns and rows
+    of Parquet and Feather files are read. The fitted steps have the same
+    format as the steps of the pandas implementation and the profiles match
+    the profiles of :meth:`Dataset.identify_dataset`.
+    """
+
+    # Strings read as missing values by pandas.read_csv
+    NA_VALUES = [
+        '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+        '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+        'nan', 'null',
+    ]
+
+    # Number of rows from which the dtypes of CSV columns are inferred
+    INFER_SCHEMA_LENGTH = 10000
+
+    def read(filename, format, datetime_columns=None, columns=None, filters=None):
+        """
+        Read a dataset file.
+
+        Args:
+            filename (str): Path to the file.
+            format (str): Format of the file ('csv', 'txt', 'json', 'parquet', 'feather').
+            datetime_columns (list | str, optional): Columns combined into one datetime column, or a single column parsed as datetime. Default is None.
+            columns (list, optional): Columns to read. Default is all columns.
+            filters (list, optional): Row filters in the disjunctive normal form of :func:`pandas.read_parquet`. Default is None.
+
+        Returns:
+            pl.DataFrame: Data.
+        """
+        if format == 'csv' or format == 'txt':
+            # Infer dtypes from the first rows, or all rows if later rows do not match
+            try:
+                return PolarsBackend._parse_datetimes(pl.scan_csv(
+                    filename, null_values=PolarsBackend.NA_VALUES,
+                    infer_schema_length=PolarsBackend.INFER_SCHEMA_LENGTH), datetime_columns).collect()
+            except pl.exceptions.ComputeError:
+                frame = pl.scan_csv(
+                    filename, null_values=PolarsBackend.NA_VALUES, infer_schema_length=None)
+        elif format == 'json':
+            frame = pl.read_json(filename).lazy()
+        elif format == 'parquet':
+            frame = pl.scan_parquet(filename)
+        elif format == 'feather':
+            frame = pl.scan_ipc(filename)
+
+        # Project and filter while scanning
+        if columns is not None:
+            frame = frame.select(columns)
+        if filters is not None:
+            frame = frame.filter(PolarsBackend._filter_expression(filters))
+        return PolarsBackend._parse_datetimes(frame, datetime_columns).collect()
+
+    def from_records(records):
+        """
+        Build a dataset from records.
+
+        Args:
+            records (list): Records as dictionaries.
+
+        Returns:
+            pl.DataFrame: Data.
+        """
+        return pl.from_dicts(records) if len(records) > 0 else pl.DataFrame()
+
+    def concat(frames):
+        """
+        Concatenate datasets read from several files. Missing columns are
+        filled with null values and dtypes are widened where needed.
+
+        Args:
+            frames (list): Datasets.
+
+        Returns:
+            pl.DataFrame: Concatenated dataset.
+        """
+        return pl.concat(frames, how='diagonal_relaxed', rechunk=True)
+
+    def write(data, target_format, filename):
+        """
+        Write the dataset to a file.
+
+        Args:
+            data (pl.DataFrame): Dataset.
+            target_format (str): Target format ('csv', 'json', 'parquet', 'feather').
+            filename (str): Path to the file.
+
+        Returns:
+            None
+        """
+        if target_format == 'csv':
+            data.write_csv(filename)
+        elif target_format == 'json':
+            data.write_json(filename)
+        elif target_format == 'parquet':
+            data.write_parquet(filename)
+        elif target_format == 'feather':
+            data.write_ipc(filename)
+
+    def profile(data):
+        """
+        Profile all columns of the dataset in one query.
+
+        Args:
+            data (pl.DataFrame): Dataset.
+
+        Returns:
+            dict: Profile of each column, i.e. its kind with its unique values or min/max values.
+        """
+        kinds = {
+            column: PolarsBackend._kind(dtype, data[column].null_count())
+            for column, dtype in data.schema.items()
+        }
+
+        # Aggregate all columns at once
+        expressions = []
+        for position, (column, kind) in enumerate(kinds.items()):
+            if kind == 'object':
+                expressions.extend([
+                    pl.col(column).unique(maintain_order=True).implode().alias(f'{position}_values'),
+                    pl.col(column).cast(pl.String).str.len_chars().max().alias(f'{position}_length'),
+                ])
+            elif kind == 'numerical':
+                expressions.extend([
+                    pl.col(column).min().alias(f'{position}_min'),
+                    pl.col(column).max().alias(f'{position}_max'),
+                ])
+        aggregates = data.lazy().select(expressions).collect().row(0, named=True) if expressions else {}
+
+        profiles = {}
+        for position, (column, kind) in enumerate(kinds.items()):
+            if kind == 'object':
+                length = aggregates[f'{position}_length']
+                text = length is not None and length >= 25
+                values = None if text else np.array([
+                    np.nan if value is None else value
+                    for value in aggregates[f'{position}_values']], dtype=object)
+                profiles[column] = {'kind': 'object', 'values': values, 'text': text}
+            elif kind == 'datetime':
+                profiles[column] = {'kind': 'datetime'}
+            else:
+                minimum, maximum = aggregates[f'{position}_min'], aggregates[f'{position}_max']
+                profiles[column] = {
+                    'kind': 'numerical',
+                    'min': np.nan if minimum is None else minimum,
+                    'max': np.nan if maximum is None else maximum,
+                }
+        return profiles
+
+    def fit_missing_values(data, method):
+        """
+        Fit the handling of missing values. Null values and NaN values of
+        floating point columns are missing.
+
+        Args:
+            data (pl.DataFrame): Dataset.
+            method (str): Method for handling missing values ('row', 'column', 'impute').
+
+        Returns:
+            dict: Fitted step.
+        """
+        if method == 'row':
+            return {'step': 'drop_rows'}
+
+        if method == 'column':
+            missing = data.select([
+                PolarsBackend._missing(column, dtype).any()
+                for column, dtype in data.schema.items()
+            ]).row(0, named=True) if data.width > 0 else {}
+            return {
+                'step': 'drop_columns',
+                'columns': [column for column, value in missing.items() if value],
+            }
+
+        # Impute with the smallest mode of categorical columns and the mean of numerical columns
+        expressions = []
+        for column, dtype in data.schema.items():
+            if PolarsBackend._kind(dtype, data[column].null_count()) == 'numerical':
+                values = pl.col(column).fill_nan(None) if dtype.is_float() else pl.col(column)
+                expressions.append(values.mean().alias(column))
+            else:
+                expressions.append(
+                    pl.col(column).drop_nulls().mode().sort().first().alias(column))
+        fill_values = data.lazy().select(expressions).collect().row(
+            0, named=True) if expressions else {}
+        return {
+            'step': 'impute',
+            'fill_values': {
+                column: value for column, value in fill_values.items() if value is not None
+            },
+        }
+
+    def fit_scaling(data, method):
+        """
+        Compute the scaling parameters of all numerical columns in one query.
+
+        Args:
+            data (pl.DataFrame): Dataset.
+            method (str): Scaling method ('normalisation', 'standardisation').
+
+        Returns:
+            dict: Offset and factor of each numerical column.
+        """
+        columns = [
+            column for column, dtype in data.schema.items()
+            if dtype.is_numeric() or dtype == pl.Boolean
+        ]
+        if len(columns) == 0 or data.height == 0:
+            return {}
+
+        expressions = []
+        for column in columns:
+            values = pl.col(column).cast(pl.Float64).fill_nan(None)
+            if method == 'normalisation':
+                expressions.extend([
+                    values.min().alias(f'{column}_offset'),
+                    (values.max() - values.min()).alias(f'{column}_factor'),
+                ])
+            else:
+                expressions.extend([
+                    values.mean().alias(f'{column}_offset'),
+                    values.std(ddof=1).alias(f'{column}_factor'),
+                ])
+        aggregates = data.lazy().select(expressions).collect().row(0, named=True)
+        return {
+            column: tuple(
+                np.nan if aggregates[f'{column}_{name}'] is None else aggregates[f'{column}_{name}']
+                for name in ['offset', 'factor'])
+            for column in columns
+        }
+
+    def fit_discretisation(data, method, num_bins, columns):
+        """
+        Fit the bin edges of the specified columns.
+
+        Args:
+            data (pl.DataFrame): Dataset.
+            method (str): Discretisation method ('equal_width', 'equal_frequency', 'kmeans_1d').
+            num_bins (int): Number of bins.
+            columns (list): List of columns to discretise.
+
+        Raises:
+            ValueError: Discretisation method is not supported.
+
+        Returns:
+            dict: Fitted discretisation of each column.
+        """
+        # Validate method
+        if method not in ['equal_width', 'equal_frequency', 'kmeans_1d']:
+            raise ValueError(
+                f'Discretisation method {method} is not supported for the polars backend')
+
+        if method == 'equal_width':
+            aggregates = data.lazy().select([
+                expression
+                for position, column in enumerate(columns)
+                for expression in [
+                    pl.col(column).min().alias(f'{position}_min'),
+                    pl.col(column).max().alias(f'{position}_max'),
+                ]
+            ]).collect().row(0, named=True)
+            return {
+                column: {
+                    'method': method,
+                    'bins': Discretisation.equal_width_bins(
+                        aggregates[f'{position}_min'], aggregates[f'{position}_max'], num_bins),
+                }
+                for position, column in enumerate(columns)
+            }
+
+        # Compute quantiles and k-means on the present values as in pandas
+        bins = {}
+        for column in columns:
+            values = data[column].cast(pl.Float64).fill_nan(None).drop_nulls().to_numpy()
+            if method == 'equal_frequency':
+                edges = np.percentile(values, np.linspace(0, 1, num_bins + 1) * 100)
+            else:
+                edges = Discretisation.kmeans_1d_bins(values, num_bins)
+            bins[column] = {'method': method, 'bins': edges}
+        return bins
+
+    def apply_step(data, step):
+        """
+        Apply a single fitted step to the dataset.
+
+        Args:
+            data (pl.DataFrame): Dataset.
+            step (dict): Fitted step.
+
+        Raises:
+            ValueError: Invalid step.
+
+        Returns:
+            pl.DataFrame: Transformed dataset.
+        """
+        if step['step'] == 'drop_rows':
+            if data.width == 0:
+                return data
+            return data.filter(pl.all_horizontal([
+                ~PolarsBackend._missing(column, dtype) for column, dtype in data.schema.items()
+            ]))
+        elif step['step'] == 'drop_columns':
+            return data.drop([column for column in step['columns'] if column in data.columns])
+        elif step['step'] == 'impute':
+            return data.with_columns(PolarsBackend._impute_expressions(data, step['fill_values']))
+        elif step['step'] == 'scale':
+            dtype = pl.Float32 if step.get('dtype') in ['float32', np.float32] else pl.Float64
+            return data.with_columns([
+                ((pl.col(column).cast(dtype) - pl.lit(offset, dtype=dtype))
+                 / pl.lit(factor, dtype=dtype)).alias(column)
+                for column, (offset, factor) in step['parameters'].items()
+                if column in data.columns
+            ])
+        elif step['step'] == 'discretise':
+            return data.with_columns([
+                PolarsBackend._discretise_expression(column, fitted)
+                for column, fitted in step['bins'].items()
+            ])
+        elif step['step'] == 'select':
+            return data.select(step['columns'])
+        raise ValueError(f'Invalid step: {step["step"]}')
+
+    def filter_by_datetime(data, datetime_column, start_date=None, end_date=None, **components):
+        """
+        Filter the dataset based on several datetime criteria at once.
+
+        Args:
+            data (pl.DataFrame): Dataset.
+            datetime_column (str): Name of the column containing datetime values.
+            start_date (str, optional): Start date. Default is None.
+            end_date (str, optional): End date. Default is None.
+            **components: Calendar components ('minute', 'hour', 'day', 'weekday', 'week', 'month', 'year') and their values.
+
+        Returns:
+            pl.DataFrame: Filtered dataset sorted by the datetime column.
+        """
+        timestamps = pl.col(datetime_column)
+        condition = timestamps.is_not_null()
+        if start_date is not None:
+            condition &= timestamps >= pd.Timestamp(start_date).to_pydatetime()
+        if end_date is not None:
+            condition &= timestamps <= pd.Timestamp(end_date).to_pydatetime()
+        extractors = {
+            'minute': timestamps.dt.minute(),
+            'hour': timestamps.dt.hour(),
+            'day': timestamps.dt.day(),
+            'weekday': timestamps.dt.weekday() - 1,
+            'week': timestamps.dt.week(),
+            'month': timestamps.dt.month(),
+            'year': timestamps.dt.year(),
+        }
+        for component, value in components.items():
+            if value is not None:
+                condition &= extractors[component] == value
+        return data.lazy().filter(condition).sort(
+            datetime_column, maintain_order=True).collect()
+
+    def to_pandas(data, steps):
+        """
+        Convert the dataset to pandas. Missing strings are converted to NaN
+        and discretised columns to ordered categorical columns of intervals,
+        as returned by :func:`pandas.cut`.
+
+        Args:
+            data (pl.DataFrame): Dataset.
+            steps (list): Fitted steps applied to the dataset.
+
+        Returns:
+            pd.DataFrame: Dataset.
+        """
+        frame = data.to_pandas()
+
+        # Missing strings are NaN in pandas
+        for column in frame.columns:
+            if frame[column].dtype == 'object' and data[column].null_count() > 0:
+                frame[column] = frame[column].fillna(np.nan)
+
+        for step in steps:
+            if step['step'] != 'discretise':
+                continue
+            for column, fitted in step['bins'].items():
+                if column in data.columns and isinstance(data.schema[column], pl.Enum):
+                    codes = data[column].to_physical().cast(pl.Int64).fill_null(-1).to_numpy()
+                    frame[column] = pd.Categorical.from_codes(
+                        codes, PolarsBackend._intervals(fitted), ordered=True)
+        return frame
+
+    def _kind(dtype, null_count):
+        """
+        Classify a Polars dtype as in :meth:`Dataset.identify_dataset`.
+
+        Args:
+            dtype (pl.DataType): Dtype of the column.
+            null_count (int): Number of null values of the column.
+
+        Returns:
+            str: Kind of the column ('object', 'datetime', 'numerical').
+        """
+        if isinstance(dtype, pl.Datetime):
+            return 'datetime'
+
+        # Boolean columns with missing values are object columns in pandas
+        if dtype.is_numeric() or (dtype == pl.Boolean and null_count == 0):
+            return 'numerical'
+        return 'object'
+
+    def _missing(column, dtype):
+        """
+        Build the expression finding missing values of a column.
+
+        Args:
+            column (str): Name of the column.
+            dtype (pl.DataType): Dtype of the column.
+
+        Returns:
+            pl.Expr: True for missing values.
+        """
+        if dtype.is_float():
+            return pl.col(column).is_null() | pl.col(column).is_nan()
+        return pl.col(column).is_null()
+
+    def _impute_expressions(data, fill_values):
+        """
+        Build the expressions filling missing values of the columns.
+
+        Integer columns with missing values are converted to floats before
+        being filled with their mean, as pandas stores them as floats.
+
+        Args:
+            data (pl.DataFrame): Dataset.
+            fill_values (dict): Fill value of each column.
+
+        Returns:
+            list: Expressions.
+        """
+        expressions = []
+        for column, value in fill_values.items():
+            if column not in data.columns or data[column].null_count() == 0 and not (
+                    data.schema[column].is_float() and data[column].is_nan().any()):
+                continue
+            dtype = data.schema[column]
+            values = pl.col(column)
+            if dtype.is_integer() and isinstance(value, float):
+                values = values.cast(pl.Float64)
+            if dtype.is_float():
+                values = values.fill_nan(value)
+            expressions.append(values.fill_null(value).alias(column))
+        return expressions
+
+    def _intervals(fitted):
+        """
+        Compute the intervals of fitted bins as labelled by :func:`pandas.cut`.
+
+        Args:
+            fitted (dict): Fitted discretisation of a column.
+
+        Raises:
+            ValueError: Bin edges are not unique.
+
+        Returns:
+            pd.IntervalIndex: Intervals.
+        """
+        return pd.cut(
+            pd.Series([], dtype=np.float64), bins=fitted['bins'],
+            include_lowest=fitted['method'] == 'equal_frequency').cat.categories
+
+    def _discretise_expression(column, fitted):
+        """
+        Build the expression discretising a column into the intervals of
+        :func:`pandas.cut`. Values outside the bins are missing.
+
+        Args:
+            column (str): Name of the column.
+            fitted (dict): Fitted discretisation of the column.
+
+        Returns:
+            pl.Expr: Expression of an enum column with the interval labels.
+        """
+        labels = [str(interval) for interval in PolarsBackend._intervals(fitted)]
+        edges = np.asarray(fitted['bins'], dtype=np.float64).copy()
+
+        # Equal frequency bins include their lowest edge
+        if fitted['method'] == 'equal_frequency':
+            edges[0] = np.nextafter(edges[0], -np.inf)
+
+        # Intervals are closed on the right
+        codes = pl.lit(pl.Series(edges)).search_sorted(
+            pl.col(column).cast(pl.Float64), side='left').cast(pl.Int64) - 1
+        return codes.replace_strict(
+            list(range(len(labels))), labels, default=None,
+            return_dtype=pl.Enum(labels)).alias(column)
+
+    def _filter_expression(filters):
+        """
+        Convert row filters in disjunctive normal form to an expression.
+
+        Args:
+            filters (list): List of (column, operator, value) tuples combined with AND, or list of such lists combined with OR.
+
+        Raises:
+            ValueError: Invalid filter operator.
+
+        Returns:
+            pl.Expr: Filter expression.
+        """
+        if len(filters) > 0 and isinstance(filters[0], tuple):
+            filters = [filters]
+        disjunction = None
+        for conjunction in filters:
+            expression = pl.lit(True)
+            for column, operator, value in conjunction:
+                values = pl.col(column)
+                if operator in ['=', '==']:
+                    condition = values == value
+                elif operator == '!=':
+                    condition = values != value
+                elif operator == '<':
+                    condition = values < value
+                elif operator == '<=':
+                    condition = values <= value
+                elif operator == '>':
+                    condition = values > value
+                elif operator == '>=':
+                    condition = values >= value
+                elif operator == 'in':
+                    condition = values.is_in(list(value))
+                elif operator == 'not in':
+                    condition = ~values.is_in(list(value))
+                else:
+                    raise ValueError(f'Invalid filter operator: {operator}')
+                expression &= condition
+            disjunction = expression if disjunction is None else disjunction | expression
+        return disjunction
+
+    def _parse_datetimes(frame, datetime_columns):
+        """
+        Parse datetime columns as :func:`pandas.read_csv` with ``parse_dates``.
+
+        Args:
+            frame (pl.LazyFrame): Dataset.
+            datetime_columns (list | str): Columns combined into one datetime column inserted first, or a single column parsed in place.
+
+        Returns:
+            pl.LazyFrame: Dataset with parsed datetime columns.
+        """
+        if datetime_columns is None or len(datetime_columns) == 0:
+            return frame
+        if isinstance(datetime_columns, str):
+            return frame.with_columns(pl.col(datetime_columns).cast(pl.String).str.to_datetime(
+                time_unit='ns'))
+
+        name = '_'.join(datetime_columns)
+        combined = pl.concat_str(
+            [pl.col(column).cast(pl.String) for column in datetime_columns], separator=' '
+        ).str.to_datetime(time_unit='ns').alias(name)
+        others = [
+            column for column in frame.collect_schema().names() if column not in datetime_columns]
+        return frame.select([combined] + others)
@@ -0,0 +1,199 @@
+import functools
+import inspect
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+
+class Profiler:
+    """
+    Record the wall time, shape, memory and copies of Dataset method calls.
+
+    While the profiler is active, every public method call on the profiled
+    datasets is recorded. Calls made by other methods of the same dataset,
+    e.g. :meth:`Dataset.filter_by_datetime` called by
+    :meth:`Dataset.filter_by_hour`, are part of the outer call.
+
+    Each record contains the method name, the start time, the wall time in
+    seconds, the number of rows and columns and the memory usage in bytes of
+    the dataset before the call and of the result after the call (the
+    returned DataFrame or the dataset itself), the memory delta, the number
+    of NumPy and categorical columns whose data was copied and, if memory
+    tracing is enabled, the peak memory allocated during the call.
+
+    Args:
+        datasets (Dataset | list): Dataset or datasets to profile.
+        callback (Callable, optional): Function called with every record. Default is None.
+        trace_memory (bool, optional): Trace the peak memory of every call with tracemalloc, which slows down allocations. Default is False.
+
+    Attributes:
+        records (list): Records of the method calls.
+
+    Example:
+        >>> with Profiler(dataset) as profiler:
+        ...     dataset.missing_values(method='impute')
+        ...     dataset.scale(method='normalisation')
+        >>> profiler.to_frame()
+    """
+
+    # Generators and printing methods are not profiled
+    EXCLUDED = ['iter_chunks', 'dataset_statistics']
+
+    def __init__(self, datasets, callback=None, trace_memory=False):
+        """
+        Initialise a Profiler instance.
+
+        Args:
+            datasets (Dataset | list): Dataset or datasets to profile.
+            callback (Callable, optional): Function called with every record. Default is None.
+            trace_memory (bool, optional): Trace the peak memory of every call with tracemalloc. Default is False.
+        """
+        self.datasets = datasets if isinstance(datasets, list) else [datasets]
+        self.callback = callback
+        self.trace_memory = trace_memory
+        self.records = []
+        self._depth = 0
+
+    def __enter__(self):
+        """
+        Start profiling the datasets.
+
+        Returns:
+            Profiler: The profiler.
+        """
+        for dataset in self.datasets:
+            for name, method in inspect.getmembers(type(dataset), inspect.isfunction):
+                if name.startswith('_') or name in Profiler.EXCLUDED:
+                    continue
+                setattr(dataset, name, self._wrap(
+                    dataset, name, method.__get__(dataset)))
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Stop profiling the datasets.
+
+        Returns:
+            bool: False, exceptions are not suppressed.
+        """
+        for dataset in self.datasets:
+            for name in list(vars(dataset)):
+                if getattr(getattr(dataset, name), '_profiled', False):
+                    delattr(dataset, name)
+        return False
+
+    def to_frame(self):
+        """
+        Return the records as a DataFrame with one row per method call.
+
+        Returns:
+            pd.DataFrame: Records.
+        """
+        return pd.DataFrame(self.records, columns=[
+            'method', 'start', 'wall_time', 'rows_in', 'columns_in', 'rows_out',
+            'columns_out', 'memory_in', 'memory_out', 'memory_delta', 'copies',
+            'peak_memory'])
+
+    def _wrap(self, dataset, name, method):
+        """
+        Wrap a bound method of a dataset so its calls are recorded.
+
+        Args:
+            dataset (Dataset): Profiled dataset.
+            name (str): Name of the method.
+            method (Callable): Bound method.
+
+        Returns:
+            Callable: Wrapped method.
+        """
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            # Record only the outermost call
+            if self._depth > 0:
+                return method(*args, **kwargs)
+
+            before = dataset.data
+            buffers = Profiler._buffers(before)
+            tracing = self.trace_memory and not tracemalloc.is_tracing()
+            if tracing:
+                tracemalloc.start()
+            self._depth += 1
+            start = time.time()
+            counter = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                wall_time = time.perf_counter() - counter
+                self._depth -= 1
+                peak_memory = None
+                if tracing:
+                    peak_memory = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+
+            after = result if isinstance(result, pd.DataFrame) else dataset.data
+            record = {
+                'method': name,
+                'start': start,
+                'wall_time': wall_time,
+                'rows_in': None if before is None else before.shape[0],
+                'columns_in': None if before is None else before.shape[1],
+                'rows_out': None if after is None else after.shape[0],
+                'columns_out': None if after is None else after.shape[1],
+                'memory_in': Profiler._memory(before),
+                'memory_out': Profiler._memory(after),
+                'memory_delta': Profiler._memory(after) - Profiler._memory(before),
+                'copies': sum(
+                    1 for column, buffer in Profiler._buffers(after).items()
+                    if buffers.get(column) != buffer),
+                'peak_memory': peak_memory,
+            }
+            self.records.append(record)
+            if self.callback is not None:
+                self.callback(record)
+            return result
+
+        wrapper._profiled = True
+        return wrapper
+
+    def _memory(data):
+        """
+        Compute the shallow memory usage of a dataset.
+
+        Args:
+            data (pd.DataFrame | pl.DataFrame | None): Dataset.
+
+        Returns:
+            int: Memory usage in bytes, 0 if there is no data.
+        """
+        if data is None:
+            return 0
+        if not isinstance(data, pd.DataFrame):
+            return int(data.estimated_size())
+        return int(data.memory_usage(index=True, deep=False).sum())
+
+    def _buffers(data):
+        """
+        Find the address of the data of every column with a NumPy or
+        categorical dtype.
+
+        Args:
+            data (pd.DataFrame | pl.DataFrame | None): Dataset.
+
+        Returns:
+            dict: Address of the first value of each column, empty for Polars datasets.
+        """
+        if not isinstance(data, pd.DataFrame):
+            return {}
+        buffers = {}
+        for position, (column, dtype) in enumerate(data.dtypes.items()):
+            if len(data) == 0:
+                break
+            if isinstance(dtype, np.dtype):
+                values = data.iloc[:, position].to_numpy()
+            elif isinstance(dtype, pd.CategoricalDtype):
+                values = data.iloc[:, position].array.codes
+            else:
+                continue
+            buffers[column] = values.__array_interface__['data'][0]
+        return buffers
@@ -0,0 +1,171 @@
+import math
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch of a numerical column (KLL sketch).
+
+    Values are kept in a hierarchy of compactors, where a value at level
+    ``h`` represents ``2 ** h`` values of the column. A full compactor is
+    sorted and every other value is promoted to the next level, so the
+    memory usage grows only logarithmically with the number of values.
+    Sketches can be updated chunk by chunk and merged across workers. The
+    capacity is sized with a union bound over the ``1 / rank_error``
+    quantiles distinguishable at the rank error, so the ranks of all
+    returned quantiles differ from the requested ranks by at most
+    ``rank_error`` times the number of values with a probability of about
+    ``1 - FAILURE_PROBABILITY``, also for merged sketches. The minimum and
+    maximum are exact.
+
+    Args:
+        rank_error (float, optional): Normalised rank error. Default is 0.001.
+        seed (int, optional): Seed of the random compaction offsets. Default is 0.
+
+    Attributes:
+        FAILURE_PROBABILITY (float): Probability of exceeding the rank error at any quantile.
+        k (int): Capacity of the largest compactor.
+        count (int): Number of values.
+        min (float): Minimum value.
+        max (float): Maximum value.
+    """
+
+    FAILURE_PROBABILITY = 0.01
+
+    def __init__(self, rank_error=0.001, seed=0):
+        """
+        Initialise a QuantileSketch instance.
+
+        Args:
+            rank_error (float, optional): Normalised rank error. Default is 0.001.
+            seed (int, optional): Seed of the random compaction offsets. Default is 0.
+
+        Raises:
+            ValueError: Invalid rank error.
+        """
+        # Validate rank error
+        if not 0 < rank_error < 1:
+            raise ValueError(f'Invalid rank error: {rank_error}')
+
+        # Bound the rank error of all quantiles at once
+        quantiles = 1 / rank_error
+        self.k = max(8, math.ceil(math.sqrt(
+            math.log(2 * quantiles / QuantileSketch.FAILURE_PROBABILITY)) / rank_error))
+        self.count = 0
+        self.min = np.nan
+        self.max = np.nan
+        self._levels = [np.empty(0)]
+        self._random_state = np.random.default_rng(seed)
+
+    def update(self, values):
+        """
+        Add values to the sketch. Missing values are ignored.
+
+        Args:
+            values (array-like): Values.
+
+        Returns:
+            QuantileSketch: The updated sketch.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Merge another sketch into the sketch.
+
+        Args:
+            other (QuantileSketch): Sketch of other values of the column.
+
+        Returns:
+            QuantileSketch: The merged sketch.
+        """
+        if other.count == 0:
+            return self
+        self.count += other.count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, values in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], values])
+        self._compress()
+        return self
+
+    def quantiles(self, quantiles):
+        """
+        Compute approximate quantiles of the values.
+
+        Args:
+            quantiles (array-like): Quantiles between 0 and 1.
+
+        Returns:
+            np.ndarray: Values at the quantiles, NaN if the sketch is empty.
+        """
+        quantiles = np.asarray(quantiles, dtype=np.float64)
+        if self.count == 0:
+            return np.full(quantiles.shape, np.nan)
+
+        # Weight values by the number of values they represent
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(len(level), 2 ** height, dtype=np.float64)
+            for height, level in enumerate(self._levels)
+        ])
+        order = np.argsort(values, kind='stable')
+        values, ranks = values[order], np.cumsum(weights[order])
+
+        # Smallest value whose rank reaches the quantile
+        positions = np.searchsorted(ranks, quantiles * ranks[-1], side='left')
+        result = values[np.minimum(positions, len(values) - 1)]
+        result[quantiles <= 0] = self.min
+        result[quantiles >= 1] = self.max
+        return result
+
+    def _capacity(self, height):
+        """
+        Compute the capacity of the compactor at the given level.
+
+        Args:
+            height (int): Level of the compactor.
+
+        Returns:
+            int: Capacity of the compactor.
+        """
+        depth = len(self._levels) - height - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        """
+        Compact full compactors until all compactors are within their capacity.
+
+        Returns:
+            None
+        """
+        while True:
+            full = [
+                height for height, level in enumerate(self._levels)
+                if len(level) > self._capacity(height)
+            ]
+            if len(full) == 0:
+                return
+            height = full[0]
+            if height + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+
+            # Promote every other sorted value, keeping one value of odd compactors
+            level = np.sort(self._levels[height])
+            remainder = level[-1:] if len(level) % 2 else level[:0]
+            level = level[:len(level) - len(remainder)]
+            promoted = level[self._random_state.integers(2)::2]
+            self._levels[height] = remainder
+            self._levels[height + 1] = np.concatenate(
+                [self._levels[height + 1], promoted])
@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+
+
+class Scaling:
+    """
+    Scaling class.
+    """
+
+    def scale(data, method, dtype=None, copy=True):
+        """
+        Scale the numerical columns of the dataset using the specified method.
+
+        Args:
+            data (pd.DataFrame): Dataset.
+            method (str): Scaling method ('normalisation', 'standardisation').
+            dtype (str, optional): Floating point dtype of the scaled columns ('float64', 'float32'). Default is 'float64'.
+            copy (bool, optional): Scale a copy of the numerical columns instead of scaling them in place where possible. Default is True.
+
+        Raises:
+            ValueError: Invalid scaling method.
+
+        Returns:
+            pd.DataFrame: Scaled dataset.
+        """
+        parameters = Scaling.fit(data, method)
+        return Scaling.transform(data, parameters, dtype, copy)
+
+    def numerical_columns(data):
+        """
+        Find the numerical columns of the dataset.
+
+        Args:
+            data (pd.DataFrame): Dataset.
+
+        Returns:
+            list: Numerical columns.
+        """
+        return [
+            column for column, dtype in data.dtypes.items()
+            if isinstance(dtype, np.dtype) and dtype.kind in 'biuf'
+        ]
+
+    def fit(data, method):
+        """
+        Compute the scaling parameters of all numerical columns with one
+        reduction over the numerical block of the dataset.
+
+        Args:
+            data (pd.DataFrame): Dataset.
+            method (str): Scaling method ('normalisation', 'standardisation').
+
+        Raises:
+            ValueError: Invalid scaling method.
+
+        Returns:
+            dict: Offset and factor of each numerical column.
+        """
+        # Validate method
+        if method not in ['normalisation', 'standardisation']:
+            raise ValueError(f'Invalid scaling method: {method}')
+
+        columns = Scaling.numerical_columns(data)
+        if len(columns) == 0 or len(data) == 0:
+            return {}
+
+        # Reduce the numerical block at once or column by column
+        values = Scaling._block(data, columns, None, writeable=False)
+        blocks = [values] if values is not None else [
+            data[column].to_numpy()[:, None] for column in columns]
+        offsets, factors = [], []
+        for block in blocks:
+            offset, factor = Scaling._reduce(block, method)
+            offsets.extend(offset)
+            factors.extend(factor)
+        return {
+            column: (offset, factor)
+            for column, offset, factor in zip(columns, offsets, factors)
+        }
+
+    def _reduce(values, method):
+        """
+        Compute the scaling parameters of the columns of a two-dimensional array.
+
+        Args:
+            values (np.ndarray): Array with one column per dataset column.
+            method (str): Scaling method ('normalisation', 'standardisation').
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Offsets and factors of the columns.
+        """
+        missing = values.dtype.kind == 'f' and np.isnan(values).any()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if method == 'normalisation':
+                reduce_min = np.nanmin if missing else np.min
+                reduce_max = np.nanmax if missing else np.max
+                offsets = reduce_min(values, axis=0).astype(np.float64)
+                factors = reduce_max(values, axis=0) - offsets
+            else:
+                reduce_mean = np.nanmean if missing else np.mean
+                offsets = reduce_mean(values, axis=0, dtype=np.float64)
+                counts = len(values) - \
+                    np.isnan(values).sum(axis=0) if missing else len(values)
+
+                # Sum squared deviations in row blocks to bound temporary memory
+                squares = np.zeros(values.shape[1])
+                for start in range(0, len(values), 65536):
+                    deviations = values[start:start + 65536] - offsets
+                    if missing:
+                        deviations = np.nan_to_num(deviations, copy=False)
+                    squares += np.einsum('ij,ij->j', deviations, deviations)
+                factors = np.sqrt(squares / (counts - 1))
+        return offsets, factors
+
+    def transform(data, parameters, dtype=None, copy=True):
+        """
+        Scale the dataset using the scaling parameters in one operation on
+        the numerical block of the dataset.
+
+        When ``copy`` is False and the dataset consists only of the scaled
+        columns stored in one array of the target dtype, the array is scaled
+        in place without copying. Columns of datasets with other columns are
+        scaled in place one by one after being converted to the target dtype.
+
+        Args:
+            data (pd.DataFrame): Dataset.
+            parameters (dict): Offset and factor of each column as returned by :meth:`fit`.
+            dtype (str, optional): Floating point dtype of the scaled columns ('float64', 'float32'). Default is 'float64'.
+            copy (bool, optional): Scale a copy of the numerical columns instead of scaling them in place where possible. Default is True.
+
+        Returns:
+            pd.DataFrame: Scaled dataset.
+        """
+        columns = [column for column in parameters if column in data.columns]
+        if len(columns) == 0:
+            return data
+        dtype = np.dtype(dtype if dtype is not None else np.float64)
+        offsets = np.array([parameters[column][0] for column in columns])
+        factors = np.array([parameters[column][1] for column in columns])
+
+        offsets, factors = offsets.astype(dtype), factors.astype(dtype)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Scale the numerical block at once
+            if columns == list(data.columns):
+                values = Scaling._block(
+                    data, columns, dtype, writeable=True) if not copy else None
+                in_place = values is not None
+                if not in_place:
+                    values = data.to_numpy(dtype=dtype, copy=True)
+                values -= offsets
+                values /= factors
+                if in_place:
+                    return data
+                return pd.DataFrame(values, index=data.index, columns=columns)
+
+            # Scale columns of mixed datasets one by one
+            for column, offset, factor in zip(columns, offsets, factors):
+                values = data[column].to_numpy(dtype=dtype, copy=True)
+                values -= offset
+                values /= factor
+                data[column] = values
+        return data
+
+    def _block(data, columns, dtype, writeable):
+        """
+        Return the columns of the dataset as a view of the two-dimensional
+        array storing them.
+
+        Args:
+            data (pd.DataFrame): Dataset.
+            columns (list): Columns.
+            dtype (np.dtype): Dtype of the array. None keeps the dtype of the columns.
+            writeable (bool): Require a writeable view.
+
+        Returns:
+            np.ndarray | None: Array with one column per dataset column, or None
+            if the columns are not stored in one array of the dtype.
+        """
+        if list(data.columns) != columns:
+            return None
+        values = data.to_numpy(dtype=dtype, copy=False)
+        if not np.shares_memory(values, data[columns[0]].to_numpy()):
+            return None
+        if writeable and not values.flags.writeable:
+            return None
+        return values
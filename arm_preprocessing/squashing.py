@@ -1,4 +1,6 @@
-from niaarm import Dataset, squash
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_float_dtype, is_integer_dtype
 
 
 class Squash:
@@ -10,14 +12,212 @@ class Squash:
         """
         Squash the dataset using the specified threshold and similarity.
 
+        Transactions are visited in order and every transaction that has not
+        been squashed yet is merged with all later unsquashed transactions
+        whose similarity is at least the threshold. Merged transactions are
+        replaced by the mean of numerical and the mode of categorical
+        features, as in NiaARM. Candidate transactions are found with a k-d
+        tree in a space where the similarity threshold is a Euclidean radius,
+        so transactions are not compared pairwise.
+
         Args:
             dataset (pd.DataFrame): Dataset to squash.
             threshold (float): Similarity threshold. Should be between 0 and 1.
             similarity (str): Similarity measure ('euclidean', 'cosine').
 
+        Raises:
+            ValueError: Invalid similarity measure.
+
         Returns:
             pd.DataFrame: Squashed dataset.
         """
-        # Squash data
-        squashed = squash(Dataset(dataset), threshold, similarity)
-        return squashed.transactions
+        # Validate similarity
+        if similarity not in ['euclidean', 'cosine']:
+            raise ValueError(f'Invalid similarity measure: {similarity}')
+
+        # Encode features
+        transactions = dataset.copy()
+        for column in transactions.columns:
+            if is_bool_dtype(transactions[column]):
+                transactions[column] = transactions[column].astype(int)
+        numerical = [
+            column for column in transactions.columns
+            if is_float_dtype(transactions[column]) or is_integer_dtype(transactions[column])
+        ]
+        categorical = [
+            column for column in transactions.columns if column not in numerical]
+        for column in categorical:
+            transactions[column] = transactions[column].astype('category')
+
+        # Embed transactions and squash them
+        if similarity == 'euclidean':
+            points, radius, similarities = Squash._euclidean(
+                transactions, numerical, categorical, threshold)
+        else:
+            points, radius, similarities = Squash._cosine(
+                transactions, threshold)
+        groups = Squash._group(points, radius, similarities, threshold)
+        return Squash._aggregate(transactions, groups, numerical, categorical)
+
+    def _euclidean(transactions, numerical, categorical, threshold):
+        """
+        Embed transactions for the euclidean similarity.
+
+        Numerical features are divided by their range and categorical features
+        are one-hot encoded with weight ``1 / (sqrt(2) * categories)``, so the
+        Euclidean distance of the embedded transactions equals the weighted
+        distance of NiaARM and the similarity threshold becomes the radius
+        ``1 - threshold``.
+
+        Args:
+            transactions (pd.DataFrame): Transactions.
+            numerical (list): Numerical features.
+            categorical (list): Categorical features.
+            threshold (float): Similarity threshold.
+
+        Returns:
+            tuple[np.ndarray, float, Callable]: Embedded transactions, radius and exact similarity function.
+        """
+        parts = []
+        num_data = transactions[numerical].to_numpy(dtype=float)
+        ranges = np.nanmax(num_data, axis=0) - np.nanmin(num_data, axis=0) if numerical else np.empty(0)
+        num_weights = np.divide(1.0, ranges ** 2, out=np.zeros(len(ranges)), where=ranges > 0)
+        parts.append(np.nan_to_num(num_data * np.sqrt(num_weights)))
+
+        cat_codes = np.empty((len(transactions), len(categorical)), dtype=np.int64)
+        cat_weights = np.empty(len(categorical))
+        for i, column in enumerate(categorical):
+            categories = len(transactions[column].cat.categories)
+            codes = transactions[column].cat.codes.to_numpy()
+            cat_codes[:, i] = codes
+            cat_weights[i] = 1 / categories ** 2 if categories > 0 else 0
+            one_hot = np.zeros((len(transactions), categories))
+            present = codes >= 0
+            one_hot[np.flatnonzero(present), codes[present]
+                    ] = np.sqrt(cat_weights[i] / 2)
+            parts.append(one_hot)
+
+        def similarities(reference, targets):
+            distance = np.zeros(len(targets))
+            if categorical:
+                # Missing categories always differ, as in NiaARM
+                differs = (cat_codes[reference] != cat_codes[targets]) | (
+                    cat_codes[targets] < 0) | (cat_codes[reference] < 0)
+                distance += np.sum(differs * cat_weights, axis=1)
+            if numerical:
+                differences = num_data[reference] - num_data[targets]
+                distance += np.sum(differences ** 2 * num_weights, axis=1)
+            return 1 - np.sqrt(distance)
+
+        return np.hstack(parts), 1 - threshold, similarities
+
+    def _cosine(transactions, threshold):
+        """
+        Embed transactions for the cosine similarity.
+
+        Transactions are one-hot encoded and normalised, so the cosine
+        similarity threshold becomes the Euclidean radius
+        ``sqrt(2 - 2 * threshold)``.
+
+        Args:
+            transactions (pd.DataFrame): Transactions.
+            threshold (float): Similarity threshold.
+
+        Returns:
+            tuple[np.ndarray, float, Callable]: Embedded transactions, radius and exact similarity function.
+        """
+        one_hot = pd.get_dummies(transactions).to_numpy(dtype=np.float64)
+        norms = np.linalg.norm(one_hot, axis=1)
+        points = np.nan_to_num(np.divide(
+            one_hot, norms[:, None], out=np.zeros_like(one_hot), where=norms[:, None] > 0))
+
+        def similarities(reference, targets):
+            dots = one_hot[targets] @ one_hot[reference]
+            return dots / (norms[targets] * norms[reference])
+
+        return points, np.sqrt(max(0.0, 2 - 2 * threshold)), similarities
+
+    def _group(points, radius, similarities, threshold):
+        """
+        Assign transactions to squashed groups.
+
+        Candidates within the radius are found with a k-d tree and confirmed
+        with the exact similarity, so the groups are the same as when every
+        transaction is compared to all remaining transactions.
+
+        Args:
+            points (np.ndarray): Embedded transactions.
+            radius (float): Radius corresponding to the similarity threshold.
+            similarities (Callable): Exact similarity of a transaction to other transactions.
+            threshold (float): Similarity threshold.
+
+        Returns:
+            np.ndarray: Group of each transaction, numbered in order of appearance.
+        """
+        from scipy.spatial import cKDTree
+        num_transactions = len(points)
+        groups = np.full(num_transactions, -1, dtype=np.int64)
+        tree = cKDTree(points) if radius >= 0 and num_transactions > 0 else None
+        group = 0
+        for position in range(num_transactions):
+            if groups[position] >= 0:
+                continue
+            groups[position] = group
+            if tree is not None:
+                candidates = np.asarray(tree.query_ball_point(
+                    points[position], radius * (1 + 1e-9) + 1e-12), dtype=np.int64)
+                candidates = candidates[(candidates > position) & (
+                    groups[candidates] < 0)]
+                if len(candidates) > 0:
+                    candidates = np.sort(candidates)
+                    similar = candidates[similarities(
+                        position, candidates) >= threshold]
+                    groups[similar] = group
+            group += 1
+        return groups
+
+    def _aggregate(transactions, groups, numerical, categorical):
+        """
+        Replace every group of transactions with the mean of numerical and
+        the mode of categorical features.
+
+        Args:
+            transactions (pd.DataFrame): Transactions.
+            groups (np.ndarray): Group of each transaction.
+            numerical (list): Numerical features.
+            categorical (list): Categorical features.
+
+        Returns:
+            pd.DataFrame: Squashed transactions.
+        """
+        squashed = {}
+        means = transactions[numerical].groupby(groups).mean()
+        for column in transactions.columns:
+            if column in numerical:
+                values = means[column].to_numpy()
+                if is_integer_dtype(transactions[column]):
+                    values = np.round(values)
+                    if categorical:
+                        values = values.astype(np.int64)
+                squashed[column] = values
+                continue
+
+            # Most frequent category of each group, the first one in case of ties
+            codes = transactions[column].cat.codes.to_numpy()
+            present = codes >= 0
+            counts = pd.DataFrame(
+                {'group': groups[present], 'code': codes[present]}
+            ).value_counts().reset_index(name='count')
+            modes = counts.sort_values(
+                ['group', 'count', 'code'], ascending=[True, False, True]
+            ).drop_duplicates('group')
+            mode_codes = np.full(groups.max() + 1 if len(groups) else 0, -1)
+            mode_codes[modes['group'].to_numpy()] = modes['code'].to_numpy()
+            values = pd.Categorical.from_codes(
+                mode_codes, categories=transactions[column].cat.categories)
+            squashed[column] = np.asarray(values, dtype=object)
+
+        squashed = pd.DataFrame(squashed, columns=transactions.columns)
+        for column in categorical:
+            squashed[column] = squashed[column].astype('category')
+        return squashed
@@ -1,8 +1,238 @@
+from collections.abc import Mapping
+import numpy as np
 import pandas as pd
 
+
 class TimeSeries:
-    def __init__(self, df):
+    """
+    Time series split into time intervals.
+
+    Args:
+        df (pd.DataFrame): Dataset.
+        datetime_column (str, optional): Name of the column containing datetime values. Default is 'date_time'.
+
+    Attributes:
+        df (pd.DataFrame): Dataset.
+        datetime_column (str): Name of the column containing datetime values.
+    """
+
+    def __init__(self, df, datetime_column='date_time'):
+        """
+        Initialise a TimeSeries instance.
+
+        Args:
+            df (pd.DataFrame): Dataset.
+            datetime_column (str, optional): Name of the column containing datetime values. Default is 'date_time'.
+        """
         self.df = df
+        self.datetime_column = datetime_column
 
     def filter_intervals(self, freq):
-        return {n: g for n, g in self.df.groupby(pd.Grouper(key='date_time', freq=freq))}
+        """
+        Split the dataset into time intervals of the specified frequency.
+
+        The intervals are the groups of ``groupby(pd.Grouper(freq=freq))``,
+        including empty intervals. They are located in one pass over the
+        sorted timestamps, and the rows of an interval are only selected when
+        the interval is accessed. Intervals of datasets sorted by the datetime
+        column are slices of the dataset.
+
+        Args:
+            freq (str): Frequency of the intervals, e.g. '1min' or '1D'.
+
+        Returns:
+            TimeWindows: Intervals by their labels.
+        """
+        return TimeWindows(
+            self.df, *TimeSeries._bins(self.df[self.datetime_column], freq))
+
+    def iter_intervals(self, freq):
+        """
+        Iterate over the time intervals of the specified frequency.
+
+        Args:
+            freq (str): Frequency of the intervals, e.g. '1min' or '1D'.
+
+        Yields:
+            tuple[pd.Timestamp, pd.DataFrame]: Label and rows of every interval.
+        """
+        yield from self.filter_intervals(freq).items()
+
+    @staticmethod
+    def stream_intervals(chunks, freq, datetime_column='date_time'):
+        """
+        Iterate over the time intervals of a dataset read in chunks, e.g. by
+        :meth:`Dataset.iter_chunks`.
+
+        Only the rows of the last interval of a chunk are kept in memory until
+        the next chunk shows whether the interval continues. The chunks must be
+        sorted by the datetime column.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Chunks of the dataset.
+            freq (str): Frequency of the intervals, e.g. '1min' or '1D'.
+            datetime_column (str, optional): Name of the column containing datetime values. Default is 'date_time'.
+
+        Raises:
+            ValueError: Chunks are not sorted by the datetime column.
+
+        Yields:
+            tuple[pd.Timestamp, pd.DataFrame]: Label and rows of every interval.
+        """
+        pending, label, origin = None, None, None
+        for chunk in chunks:
+            if pending is not None:
+                chunk = pd.concat([pending, chunk])
+
+            # Anchor intervals of all chunks at the first day of the dataset
+            timestamps = chunk[datetime_column]
+            if origin is None and timestamps.notna().any():
+                origin = timestamps.min().normalize()
+            windows = TimeWindows(
+                chunk, *TimeSeries._bins(timestamps, freq, origin))
+            if len(windows) == 0:
+                continue
+
+            # Validate order
+            if label is not None and windows.labels[0] < label:
+                raise ValueError(
+                    'Chunks are not sorted by the datetime column')
+
+            # Keep the last interval until the next chunk
+            for position in range(len(windows) - 1):
+                yield windows.labels[position], windows.window(position)
+            label = windows.labels[-1]
+            pending = windows.window(len(windows) - 1)
+
+        if pending is not None:
+            yield label, pending
+
+    @staticmethod
+    def _bins(timestamps, freq, origin='start_day'):
+        """
+        Locate the rows of every time interval.
+
+        Args:
+            timestamps (pd.Series): Datetime values.
+            freq (str): Frequency of the intervals.
+            origin (pd.Timestamp | str, optional): Origin of the intervals of fixed frequencies. Default is 'start_day'.
+
+        Returns:
+            tuple[pd.DatetimeIndex, np.ndarray, np.ndarray | None]: Labels of the
+            intervals, offsets of the intervals in the time order and positions
+            of the rows in time order, or None if the rows are in order.
+        """
+        index = pd.DatetimeIndex(timestamps)
+        positions = np.flatnonzero(~index.isna())
+
+        # Sort timestamps once and count the rows of every interval
+        ordered = positions[np.argsort(index.asi8[positions], kind='stable')]
+        counts = pd.Series(0, index=index[ordered]).resample(
+            freq, origin=origin).size()
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts.to_numpy(), out=offsets[1:])
+
+        # Rows of intervals are ordered by time, as in groupby
+        order = ordered
+        if len(order) == len(index) and np.array_equal(order, np.arange(len(index))):
+            order = None
+        return counts.index, offsets, order
+
+
+class TimeWindows(Mapping):
+    """
+    Read-only mapping of interval labels to the rows of the intervals.
+
+    The rows of an interval are selected from the dataset only when the
+    interval is accessed, so iterating over the intervals holds at most one
+    interval in memory.
+
+    Args:
+        data (pd.DataFrame): Dataset.
+        labels (pd.DatetimeIndex): Labels of the intervals.
+        offsets (np.ndarray): Offsets of the intervals in the time order.
+        order (np.ndarray, optional): Positions of the rows in time order. Default is None (rows are in order).
+
+    Attributes:
+        data (pd.DataFrame): Dataset.
+        labels (pd.DatetimeIndex): Labels of the intervals.
+        offsets (np.ndarray): Offsets of the intervals in the time order.
+        order (np.ndarray): Positions of the rows in time order, None if the rows are in order.
+    """
+
+    def __init__(self, data, labels, offsets, order=None):
+        """
+        Initialise a TimeWindows instance.
+
+        Args:
+            data (pd.DataFrame): Dataset.
+            labels (pd.DatetimeIndex): Labels of the intervals.
+            offsets (np.ndarray): Offsets of the intervals in the time order.
+            order (np.ndarray, optional): Positions of the rows in time order. Default is None (rows are in order).
+        """
+        self.data = data
+        self.labels = labels
+        self.offsets = offsets
+        self.order = order
+
+    def __getitem__(self, label):
+        try:
+            position = self.labels.get_loc(label)
+        except (KeyError, TypeError, ValueError):
+            raise KeyError(label) from None
+        return self.window(position)
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def bounds(self, label):
+        """
+        Find the range of positions of an interval in the time order.
+
+        Args:
+            label (pd.Timestamp | str): Label of the interval.
+
+        Raises:
+            KeyError: Invalid label.
+
+        Returns:
+            tuple[int, int]: Start and end positions.
+        """
+        position = self.labels.get_loc(label)
+        return int(self.offsets[position]), int(self.offsets[position + 1])
+
+    def positions(self, label):
+        """
+        Find the positions of the rows of an interval in the dataset.
+
+        Args:
+            label (pd.Timestamp | str): Label of the interval.
+
+        Raises:
+            KeyError: Invalid label.
+
+        Returns:
+            np.ndarray | slice: Positions of the rows.
+        """
+        start, end = self.bounds(label)
+        if self.order is None:
+            return slice(start, end)
+        return self.order[start:end]
+
+    def window(self, position):
+        """
+        Select the rows of the interval at the specified position.
+
+        Args:
+            position (int): Position of the interval.
+
+        Returns:
+            pd.DataFrame: Rows of the interval, a slice of the dataset if the rows are in order.
+        """
+        start, end = self.offsets[position], self.offsets[position + 1]
+        if self.order is None:
+            return self.data.iloc[start:end]
+        return self.data.iloc[self.order[start:end]]
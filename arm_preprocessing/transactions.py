@@ -0,0 +1,222 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+
+
+class Transactions:
+    """
+    Compact encoding of a preprocessed dataset for association rule mining.
+
+    Categorical, boolean and discretised (interval) columns are integer-coded,
+    and every category of such a column is an item. Numerical columns are kept
+    as floating point arrays with their min/max values. Transactions are
+    available as a sparse one-hot matrix and as packed bitsets, so the support
+    of an itemset is counted with bitwise AND and popcount.
+
+    Args:
+        data (pd.DataFrame): Preprocessed dataset.
+        columns (list, optional): Columns to encode. Default is all columns.
+
+    Raises:
+        ValueError: Datetime columns cannot be encoded.
+
+    Attributes:
+        num_transactions (int): Number of transactions.
+        features (list): Metadata of each encoded column, i.e. its type with its categories or min/max values.
+        codes (np.ndarray): Category code of each transaction in each categorical column, -1 for missing values.
+        numerical (np.ndarray): Values of each transaction in each numerical column.
+        items (list): Items as (column, category) tuples, in the order of the matrix and bitset columns.
+    """
+
+    def __init__(self, data, columns=None):
+        """
+        Initialise a Transactions instance.
+
+        Args:
+            data (pd.DataFrame): Preprocessed dataset.
+            columns (list, optional): Columns to encode. Default is all columns.
+
+        Raises:
+            ValueError: Datetime columns cannot be encoded.
+        """
+        columns = list(data.columns) if columns is None else list(columns)
+        self.num_transactions = len(data)
+        self.features = []
+        self.items = []
+        codes, numerical = [], []
+        for column in columns:
+            series = data[column]
+
+            # Validate column type
+            if is_datetime64_any_dtype(series):
+                raise ValueError(f'Datetime column cannot be encoded: {column}')
+
+            if is_numeric_dtype(series) and not is_bool_dtype(series) and not isinstance(
+                    series.dtype, pd.CategoricalDtype):
+                values = series.to_numpy(dtype=np.float64)
+                self.features.append({
+                    'column': column,
+                    'type': 'numerical',
+                    'dtype': series.dtype,
+                    'min': np.nanmin(values) if len(values) > 0 else np.nan,
+                    'max': np.nanmax(values) if len(values) > 0 else np.nan,
+                })
+                numerical.append(values)
+                continue
+
+            # Integer-code categories in the order of their categorical dtype
+            categorical = series if isinstance(
+                series.dtype, pd.CategoricalDtype) else series.astype('category')
+            categories = categorical.cat.categories.tolist()
+            self.features.append({
+                'column': column,
+                'type': 'categorical',
+                'categories': categories,
+                'ordered': categorical.cat.ordered,
+                'offset': len(self.items),
+            })
+            self.items.extend((column, category) for category in categories)
+            codes.append(categorical.cat.codes.to_numpy().astype(np.int32))
+
+        self.codes = np.column_stack(codes) if codes else np.empty(
+            (self.num_transactions, 0), dtype=np.int32)
+        self.numerical = np.column_stack(numerical) if numerical else np.empty(
+            (self.num_transactions, 0))
+        self._item_indices = {item: index for index, item in enumerate(self.items)}
+        self._matrix = None
+        self._bitsets = None
+
+    def to_sparse(self):
+        """
+        Build the sparse one-hot transaction matrix with one row per
+        transaction and one column per item. The matrix is built once.
+
+        Returns:
+            scipy.sparse.csr_matrix: Boolean transaction matrix.
+        """
+        if self._matrix is None:
+            offsets = np.array([
+                feature['offset'] for feature in self.features
+                if feature['type'] == 'categorical'], dtype=np.int64)
+            present = self.codes >= 0
+
+            # Rows are filled in order, so column indices are sorted within rows
+            from scipy.sparse import csr_matrix
+            indices = (self.codes + offsets)[present]
+            indptr = np.zeros(self.num_transactions + 1, dtype=np.int64)
+            np.cumsum(present.sum(axis=1), out=indptr[1:])
+            self._matrix = csr_matrix(
+                (np.ones(len(indices), dtype=bool), indices, indptr),
+                shape=(self.num_transactions, len(self.items)))
+        return self._matrix
+
+    def to_bitsets(self):
+        """
+        Pack the transactions containing each item into bitsets, where bit
+        ``i % 64`` of word ``i // 64`` is set if transaction ``i`` contains the
+        item. The bitsets are packed once.
+
+        Returns:
+            np.ndarray: Array of shape (items, words) of dtype uint64.
+        """
+        if self._bitsets is None:
+            num_words = (self.num_transactions + 63) // 64
+            bitsets = np.zeros((len(self.items), num_words * 8), dtype=np.uint8)
+            position = 0
+            for column_codes, feature in zip(self.codes.T, (
+                    feature for feature in self.features if feature['type'] == 'categorical')):
+                num_categories = len(feature['categories'])
+                one_hot = column_codes == np.arange(num_categories)[:, None]
+                packed = np.packbits(one_hot, axis=1, bitorder='little')
+                bitsets[position:position + num_categories, :packed.shape[1]] = packed
+                position += num_categories
+            self._bitsets = bitsets.view(np.uint64)
+        return self._bitsets
+
+    def item_index(self, column, category):
+        """
+        Find the index of an item.
+
+        Args:
+            column (str): Column of the item.
+            category (object): Category of the item.
+
+        Raises:
+            ValueError: Invalid item.
+
+        Returns:
+            int: Index of the item in the matrix and bitset columns.
+        """
+        index = self._item_indices.get((column, category))
+        if index is None:
+            raise ValueError(f'Invalid item: {column}={category}')
+        return index
+
+    def count(self, itemset):
+        """
+        Count the transactions containing all items of the itemset.
+
+        Args:
+            itemset (list): Items as (column, category) tuples.
+
+        Raises:
+            ValueError: Invalid item.
+
+        Returns:
+            int: Number of transactions containing the itemset.
+        """
+        if len(itemset) == 0:
+            return self.num_transactions
+        indices = [self.item_index(column, category) for column, category in itemset]
+        words = np.bitwise_and.reduce(self.to_bitsets()[indices], axis=0)
+        return Transactions._popcount(words)
+
+    def support(self, itemset):
+        """
+        Compute the support of the itemset.
+
+        Args:
+            itemset (list): Items as (column, category) tuples.
+
+        Raises:
+            ValueError: Invalid item.
+
+        Returns:
+            float: Fraction of transactions containing the itemset.
+        """
+        if self.num_transactions == 0:
+            return 0.0
+        return self.count(itemset) / self.num_transactions
+
+    def to_frame(self):
+        """
+        Decode the transactions to a dataset with categorical columns, which
+        NiaARM and other miners use without converting the columns again.
+
+        Returns:
+            pd.DataFrame: Dataset with one column per encoded column.
+        """
+        columns = {}
+        codes = iter(self.codes.T)
+        numerical = iter(self.numerical.T)
+        for feature in self.features:
+            if feature['type'] == 'categorical':
+                columns[feature['column']] = pd.Categorical.from_codes(
+                    next(codes), categories=feature['categories'], ordered=feature['ordered'])
+            else:
+                columns[feature['column']] = next(numerical).astype(feature['dtype'])
+        return pd.DataFrame(columns)
+
+    def _popcount(words):
+        """
+        Count the set bits of an array of words.
+
+        Args:
+            words (np.ndarray): Array of dtype uint64.
+
+        Returns:
+            int: Number of set bits.
+        """
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(words).sum(dtype=np.int64))
+        return int(np.unpackbits(words.view(np.uint8)).sum(dtype=np.int64))
@@ -0,0 +1,264 @@
+"""
+Benchmarks of the Dataset preprocessing steps on synthetic datasets.
+
+Every benchmark is timed on a fresh copy of the dataset and reports the
+minimum and median wall time of the repeats and the peak memory allocated
+during one additional run traced with tracemalloc. Results are written as
+JSON together with the versions of the libraries, so they can be compared
+across releases with ``--compare``.
+
+Usage (from the root of the repository):
+    python -m benchmarks.benchmark --rows 100000 --output results.json
+    python -m benchmarks.benchmark --rows 100000 --compare results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+import arm_preprocessing
+from arm_preprocessing.dataset import Dataset
+
+
+def generate_dataset(rows, numerical=8, categorical=4, categories=10, missing=0.05, seed=0):
+    """
+    Generate a synthetic dataset with numerical, categorical and datetime columns.
+
+    Args:
+        rows (int): Number of rows.
+        numerical (int, optional): Number of numerical columns. Default is 8.
+        categorical (int, optional): Number of categorical columns. Default is 4.
+        categories (int, optional): Number of categories of each categorical column. Default is 10.
+        missing (float, optional): Fraction of missing values in each column except the first and the datetime column. Default is 0.05.
+        seed (int, optional): Random seed. Default is 0.
+
+    Returns:
+        pd.DataFrame: Synthetic dataset.
+    """
+    random_state = np.random.default_rng(seed)
+    columns = {}
+    for i in range(numerical):
+        if i % 2 == 0:
+            columns[f'numerical_{i}'] = random_state.normal(i, 1 + i, rows)
+        else:
+            columns[f'numerical_{i}'] = random_state.integers(0, 1000, rows).astype(float)
+    names = np.array([f'category_{i}' for i in range(categories)], dtype=object)
+    for i in range(categorical):
+        columns[f'categorical_{i}'] = names[random_state.integers(0, categories, rows)]
+    data = pd.DataFrame(columns)
+
+    # Insert missing values
+    for column in data.columns[1:]:
+        data.loc[random_state.random(rows) < missing, column] = np.nan
+
+    # Add timestamps every minute
+    data['timestamp'] = pd.date_range('2020-01-01', periods=rows, freq='min')
+    return data
+
+
+def loaded(data, numerical_only=False, complete=False):
+    """
+    Create a setup function returning a dataset holding a copy of the data.
+
+    Args:
+        data (pd.DataFrame): Synthetic dataset.
+        numerical_only (bool, optional): Keep only numerical columns. Default is False.
+        complete (bool, optional): Drop rows with missing values. Default is False.
+
+    Returns:
+        Callable: Setup function.
+    """
+    if numerical_only:
+        data = data.select_dtypes('number')
+    if complete:
+        data = data.dropna().reset_index(drop=True)
+
+    def setup():
+        dataset = Dataset()
+        dataset.data = data.copy()
+        dataset.identify_dataset()
+        return dataset
+    return setup
+
+
+# Dependencies imported only by the code paths needing them
+DEFERRED_MODULES = ['sklearn', 'scipy', 'niaarm',
+                    'sport_activities_features', 'threadpoolctl', 'polars']
+
+
+def import_package():
+    """
+    Import the Dataset class in a fresh interpreter.
+
+    Returns:
+        list: Deferred modules imported together with the package.
+    """
+    code = (
+        'import sys; from arm_preprocessing.dataset import Dataset; '
+        f'print(",".join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], check=True, capture_output=True, text=True,
+        cwd=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')).stdout.strip()
+    return output.split(',') if output else []
+
+
+def benchmarks(data, filename, squash_rows):
+    """
+    Define the benchmarks.
+
+    Args:
+        data (pd.DataFrame): Synthetic dataset.
+        filename (str): Path to the dataset saved as CSV without extension.
+        squash_rows (int): Number of rows of the squashed dataset.
+
+    Returns:
+        dict: Setup and benchmarked function of each benchmark.
+    """
+    numerical = [column for column in data.columns if column.startswith('numerical')]
+    full = loaded(data)
+    complete = loaded(data, complete=True)
+    numerical_only = loaded(data, numerical_only=True, complete=True)
+    squash_data = loaded(data.drop(columns=['timestamp']).head(squash_rows), complete=True)
+    return {
+        'import': (lambda: None, lambda _: import_package()),
+        'load': (
+            lambda: Dataset(filename, format='csv'),
+            lambda dataset: dataset.load()),
+        'identify_dataset': (full, lambda dataset: dataset.identify_dataset()),
+        'missing_values_row': (full, lambda dataset: dataset.missing_values('row')),
+        'missing_values_column': (full, lambda dataset: dataset.missing_values('column')),
+        'missing_values_impute': (full, lambda dataset: dataset.missing_values('impute')),
+        'scale_normalisation': (full, lambda dataset: dataset.scale('normalisation')),
+        'scale_standardisation': (full, lambda dataset: dataset.scale('standardisation')),
+        'discretise_equal_width': (complete, lambda dataset: dataset.discretise(
+            'equal_width', 10, numerical)),
+        'discretise_equal_frequency': (complete, lambda dataset: dataset.discretise(
+            'equal_frequency', 10, numerical)),
+        'discretise_kmeans': (complete, lambda dataset: dataset.discretise(
+            'kmeans', 10, numerical)),
+        'discretise_kmeans_1d': (complete, lambda dataset: dataset.discretise(
+            'kmeans_1d', 10, numerical)),
+        'squash_euclidean': (squash_data, lambda dataset: dataset.squash(0.9, 'euclidean')),
+        'squash_cosine': (squash_data, lambda dataset: dataset.squash(0.9, 'cosine')),
+        'feature_selection_pearson': (numerical_only, lambda dataset: dataset.feature_selection(
+            'pearson', 0.1, 'numerical_0')),
+        'feature_selection_spearman': (numerical_only, lambda dataset: dataset.feature_selection(
+            'spearman', 0.1, 'numerical_0')),
+        'feature_selection_kendall': (numerical_only, lambda dataset: dataset.feature_selection(
+            'kendall', 0.1, 'numerical_0')),
+        'filter_between_dates': (full, lambda dataset: dataset.filter_between_dates(
+            pd.Timestamp('2020-01-02'), pd.Timestamp('2020-02-01'), 'timestamp')),
+        'filter_by_minute': (full, lambda dataset: dataset.filter_by_minute(30, 'timestamp')),
+        'filter_by_hour': (full, lambda dataset: dataset.filter_by_hour(12, 'timestamp')),
+        'filter_by_day': (full, lambda dataset: dataset.filter_by_day(15, 'timestamp')),
+        'filter_by_weekday': (full, lambda dataset: dataset.filter_by_weekday(2, 'timestamp')),
+        'filter_by_week': (full, lambda dataset: dataset.filter_by_week(10, 'timestamp')),
+        'filter_by_month': (full, lambda dataset: dataset.filter_by_month(2, 'timestamp')),
+        'filter_by_year': (full, lambda dataset: dataset.filter_by_year(2020, 'timestamp')),
+    }
+
+
+def measure(setup, function, repeat):
+    """
+    Measure the wall time and peak memory of a benchmark.
+
+    Args:
+        setup (Callable): Function returning the input of the benchmark. Not measured.
+        function (Callable): Benchmarked function.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict: Minimum and median wall time in seconds and peak memory in bytes.
+    """
+    times = []
+    for _ in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        function(argument)
+        times.append(time.perf_counter() - start)
+
+    # Trace memory in a separate run, as tracing slows down allocations
+    argument = setup()
+    tracemalloc.start()
+    function(argument)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'min': min(times), 'median': statistics.median(times), 'peak_memory': peak}
+
+
+def main(arguments=None):
+    """
+    Run the benchmarks and print the results.
+
+    Args:
+        arguments (list, optional): Command line arguments. Default is ``sys.argv[1:]``.
+
+    Returns:
+        dict: Results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--rows', type=int, default=100000, help='number of rows')
+    parser.add_argument('--numerical', type=int, default=8, help='number of numerical columns')
+    parser.add_argument('--categorical', type=int, default=4, help='number of categorical columns')
+    parser.add_argument('--categories', type=int, default=10, help='number of categories per column')
+    parser.add_argument('--missing', type=float, default=0.05, help='fraction of missing values')
+    parser.add_argument('--squash-rows', type=int, default=2000, help='number of squashed rows')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timed runs')
+    parser.add_argument('--filter', default='', help='run only benchmarks containing this text')
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='compare with results in this JSON file')
+    arguments = parser.parse_args(arguments)
+
+    data = generate_dataset(
+        arguments.rows, arguments.numerical, arguments.categorical,
+        arguments.categories, arguments.missing)
+    previous = {}
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            previous = json.load(file)['benchmarks']
+
+    results = {
+        'environment': {
+            'arm_preprocessing': arm_preprocessing.__version__,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+        },
+        'parameters': {
+            key: value for key, value in vars(arguments).items()
+            if key not in ['output', 'compare', 'filter']
+        },
+        'benchmarks': {},
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'dataset')
+        data.to_csv(f'{filename}.csv', index=False)
+        for name, (setup, function) in benchmarks(data, filename, arguments.squash_rows).items():
+            if arguments.filter not in name:
+                continue
+            result = measure(setup, function, arguments.repeat)
+            results['benchmarks'][name] = result
+
+            line = f'{name:<30} {result["min"]:>10.4f} s {result["peak_memory"] / 2 ** 20:>10.1f} MiB'
+            if name in previous:
+                line += f' {previous[name]["min"] / result["min"]:>8.2f}x'
+            print(line, flush=True)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main()
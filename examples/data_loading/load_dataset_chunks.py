@@ -0,0 +1,24 @@
+"""
+Example demonstrates how to load and preprocess
+a dataset in chunks without reading it into memory
+"""
+
+from arm_preprocessing.dataset import Dataset
+
+# Initialise dataset with filename and format
+dataset = Dataset('datasets/Abalone', format='csv')
+
+# Load dataset in chunks of 1000 rows
+dataset.load(chunksize=1000)
+
+# Print dataset information (columns, categories, min/max values, etc.)
+dataset.dataset_statistics()
+
+# Fit preprocessing steps on the chunks
+dataset.missing_values(method='impute')
+dataset.scale(method='normalisation')
+dataset.discretise(method='equal_width', num_bins=5, columns=['Height'])
+
+# Iterate over the preprocessed chunks
+for chunk in dataset.iter_chunks():
+    print(chunk.head())
@@ -0,0 +1,22 @@
+"""
+Example demonstrates how to convert
+a dataset to a Parquet file and load
+only a part of it
+"""
+
+from arm_preprocessing.dataset import Dataset
+
+# Initialise dataset with filename and format
+dataset = Dataset('datasets/sportydatagen', format='csv')
+dataset.load()
+
+# Convert dataset to Parquet format
+dataset.convert(target_format='parquet', output_filename='sportydatagen')
+
+# Load only two columns of rows with more than 400 calories
+dataset = Dataset('sportydatagen', format='parquet')
+dataset.load(columns=['duration', 'calories'],
+             filters=[('calories', '>', 400)])
+
+# Print dataset information (columns, categories, min/max values, etc.)
+dataset.dataset_statistics()
@@ -5,11 +5,14 @@ a dataset from a TCX directory
 
 from arm_preprocessing.dataset import Dataset
 
-# Initialise dataset with path to TCX directory and format
-dataset = Dataset('datasets/tcx', format='tcx')
+# Worker processes import the script, so load only in the main process
+if __name__ == '__main__':
+    # Initialise dataset with path to TCX directory and format
+    dataset = Dataset('datasets/tcx', format='tcx')
 
-# Load dataset
-dataset.load()
+    # Load dataset, parsing files in parallel processes and caching parsed
+    # files so subsequent loads only parse new or changed files
+    dataset.load(n_jobs=-1, cache=True)
 
-# Print dataset information (columns, categories, min/max values, etc.)
-dataset.dataset_statistics()
+    # Print dataset information (columns, categories, min/max values, etc.)
+    dataset.dataset_statistics()
@@ -37,7 +37,7 @@ algo = DifferentialEvolution(
     population_size=50, differential_weight=0.5, crossover_probability=0.9)
 metrics = ('support', 'confidence')
 rules, run_time = niaarm.get_rules(
-    niaarm.Dataset(dataset.data), algo, metrics, max_iters=30, logging=True)
+    niaarm.Dataset(dataset.encode().to_frame()), algo, metrics, max_iters=30, logging=True)
 
 # Results
 print(rules)
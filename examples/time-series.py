@@ -5,8 +5,14 @@ dataset = Dataset('datasets/measures2', format='txt',
                   datetime_columns=['date', 'time'])
 dataset.load()
 
-series = TimeSeries(dataset.data)
+series = TimeSeries(dataset.data, datetime_column='date_time')
 
+# Intervals are selected only when they are accessed
 filters = series.filter_intervals('1Min')
+for label, interval in filters.items():
+    print(label, len(interval))
 
-print(filters)
+# Stream intervals of a dataset read in chunks
+dataset.load(chunksize=10)
+for label, interval in TimeSeries.stream_intervals(dataset.iter_chunks(), '1Min', 'date_time'):
+    print(label, len(interval))
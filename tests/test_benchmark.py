@@ -0,0 +1,43 @@
+import importlib.util
+import json
+
+spec = importlib.util.spec_from_file_location(
+    'benchmark', 'benchmarks/benchmark.py')
+benchmark = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(benchmark)
+
+
+def test_generate_dataset():
+    # Test generating a synthetic dataset
+    data = benchmark.generate_dataset(
+        1000, numerical=3, categorical=2, categories=5)
+    assert data.shape == (1000, 6)
+    assert data['categorical_0'].nunique() == 5
+    assert data['numerical_1'].isna().any()
+    assert data['timestamp'].dtype == 'datetime64[ns]'
+
+
+def test_run_benchmarks(tmp_path):
+    # Test running benchmarks and writing results
+    output = tmp_path / 'results.json'
+    benchmark.main(['--rows', '500', '--repeat', '1', '--squash-rows', '100',
+                    '--filter', 'discretise', '--output', str(output)])
+    with open(output) as file:
+        results = json.load(file)
+    assert set(results['benchmarks']) == {
+        'discretise_equal_width', 'discretise_equal_frequency',
+        'discretise_kmeans', 'discretise_kmeans_1d'}
+    assert all(result['min'] > 0 and result['peak_memory'] > 0
+               for result in results['benchmarks'].values())
+
+    # Compare with previous results
+    results = benchmark.main(['--rows', '500', '--repeat', '1',
+                              '--filter', 'filter_by_hour', '--compare', str(output)])
+    assert list(results['benchmarks']) == ['filter_by_hour']
+
+
+def test_import_package():
+    # Test importing the package without deferred dependencies
+    assert benchmark.import_package() == []
+    results = benchmark.main(['--rows', '500', '--repeat', '1', '--filter', 'import'])
+    assert list(results['benchmarks']) == ['import']
@@ -0,0 +1,103 @@
+import os
+import shutil
+import sys
+import pytest
+import pandas as pd
+
+from arm_preprocessing.cache import ResultCache
+from arm_preprocessing.dataset import Dataset
+
+
+def preprocess(dataset, num_bins=5):
+    # Preprocess the Abalone dataset
+    dataset.load()
+    dataset.missing_values(method='impute')
+    dataset.scale(method='normalisation')
+    dataset.discretise(
+        method='equal_frequency', num_bins=num_bins, columns=['Height'])
+    return dataset
+
+
+def test_result_cache(tmp_path):
+    # Test serving unchanged steps from the cache
+    pytest.importorskip('pyarrow')
+    shutil.copy('datasets/Abalone.csv', tmp_path / 'Abalone.csv')
+    filename = str(tmp_path / 'Abalone')
+    expected = preprocess(Dataset(filename))
+    cache = ResultCache(str(tmp_path / 'cache'))
+    first = preprocess(Dataset(filename, result_cache=cache))
+    assert len(cache) == 4
+    pd.testing.assert_frame_equal(first.data, expected.data)
+
+    second = preprocess(Dataset(filename, result_cache=cache))
+    assert len(cache) == 4
+    pd.testing.assert_frame_equal(second.data, expected.data)
+    assert second.information == expected.information
+    assert [step['step'] for step in second.pipeline.steps] == [
+        'impute', 'scale', 'discretise']
+    raw = pd.read_csv('datasets/Abalone.csv').head(50)
+    pd.testing.assert_frame_equal(
+        second.transform(raw), expected.transform(raw))
+
+    # Only the changed step is computed
+    preprocess(Dataset(filename, result_cache=cache), num_bins=4)
+    assert len(cache) == 5
+
+    # Changed input files are loaded again
+    with open(tmp_path / 'Abalone.csv', 'a') as file:
+        file.write('M,0.5,0.4,0.1,0.5,0.2,0.1,0.1,9\n')
+    changed = preprocess(Dataset(filename, result_cache=cache))
+    assert len(cache) == 9
+    assert len(changed.data) == len(expected.data) + 1
+
+    # Data replaced outside of cached steps is not cached
+    changed.data = changed.data.head(10)
+    changed.missing_values(method='row')
+    assert len(cache) == 9
+
+
+def test_result_cache_eviction(tmp_path):
+    # Test evicting the least recently used results
+    pytest.importorskip('pyarrow')
+    cache = ResultCache(str(tmp_path), max_size=1)
+    preprocess(Dataset('datasets/Abalone', result_cache=cache))
+    assert len(cache) == 0
+    assert cache.size() == 0
+
+    cache = ResultCache(str(tmp_path), max_size=1 << 30)
+    preprocess(Dataset('datasets/Abalone', result_cache=cache))
+    size = cache.size()
+    cache.max_size = size - 1
+    cache.get(next(iter(cache._index['entries'])))
+    Dataset('datasets/Abalone', result_cache=cache).load(compact=True)
+    assert 0 < cache.size() <= size - 1
+    assert len(os.listdir(tmp_path)) == len(cache) + 1
+
+    cache.clear()
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        ResultCache(str(tmp_path), max_size=0)
+
+
+def test_result_cache_in_place_changes(tmp_path):
+    # Test breaking the chain when columns are dropped in place
+    pytest.importorskip('pyarrow')
+    cache = ResultCache(str(tmp_path))
+    dataset = Dataset('datasets/Abalone', result_cache=cache)
+    dataset.load()
+    dataset.data.drop('Sex', axis=1, inplace=True)
+    dataset.scale(method='normalisation')
+    assert len(cache) == 1
+
+    dataset = Dataset('datasets/Abalone', result_cache=cache)
+    dataset.load()
+    dataset.scale(method='normalisation')
+    assert 'Sex' in dataset.data.columns
+    assert len(cache) == 2
+
+
+def test_result_cache_requires_pyarrow(tmp_path, monkeypatch):
+    # Test a clear error when pyarrow is not installed
+    monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    with pytest.raises(ValueError, match='arrow'):
+        ResultCache(str(tmp_path))
@@ -0,0 +1,71 @@
+import json
+import pytest
+import pandas as pd
+
+from arm_preprocessing.cli import main, read_specification, run
+
+
+SPECIFICATION = {
+    'steps': [
+        {'step': 'missing_values', 'method': 'impute'},
+        {'step': 'scale', 'method': 'normalisation'},
+        {'step': 'discretise', 'method': 'equal_width',
+            'num_bins': 5, 'columns': ['Height']},
+        {'step': 'convert', 'target_format': 'csv',
+            'output_filename': '{name}-preprocessed'},
+    ],
+}
+
+
+def test_run():
+    # Test preprocessing datasets serially and in parallel processes
+    paths = ['datasets/Abalone.csv', 'datasets/Abalone', 'datasets/missing']
+    for n_jobs in [None, 2]:
+        results = run(paths, dict(SPECIFICATION, steps=SPECIFICATION['steps'][:3]), n_jobs=n_jobs)
+        assert [result['dataset'] for result in results] == paths
+        assert [method for method, _ in results[0]['steps']] == [
+            'load', 'missing_values', 'scale', 'discretise']
+        assert results[1]['error'] is None
+        assert results[2]['error'].startswith('FileNotFoundError')
+
+    # Every job of duplicate datasets has its own result
+    for n_jobs in [None, 2]:
+        completed = []
+        results = run(['datasets/Abalone'] * 2, dict(SPECIFICATION, steps=[]),
+                      n_jobs=n_jobs, callback=completed.append)
+        assert sorted(map(id, results)) == sorted(map(id, completed))
+
+
+def test_main(tmp_path, capsys):
+    # Test the command with a JSON specification
+    specification = tmp_path / 'specification.json'
+    specification.write_text(json.dumps(
+        dict(SPECIFICATION, datasets=['datasets/Abalone'])))
+    assert main([str(specification), '-o', str(tmp_path / 'output')]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith('datasets/Abalone\t')
+    df = pd.read_csv(tmp_path / 'output' / 'Abalone-preprocessed.csv')
+    assert df['Height'].str.startswith('(').all()
+
+    # Failed jobs are reported in the exit status
+    assert main([str(specification), 'datasets/measures2.txt',
+                '-o', str(tmp_path / 'output')]) == 1
+
+
+def test_read_specification(tmp_path):
+    # Test reading YAML specifications and validating steps
+    pytest.importorskip('yaml')
+    specification = tmp_path / 'specification.yaml'
+    specification.write_text(
+        'format: txt\nsteps:\n  - step: scale\n    method: standardisation\n')
+    assert read_specification(str(specification)) == {
+        'format': 'txt',
+        'steps': [{'step': 'scale', 'method': 'standardisation'}],
+    }
+
+    specification.write_text('steps:\n  - step: encode\n')
+    with pytest.raises(ValueError):
+        read_specification(str(specification))
+    specification.write_text('format: csv\n')
+    with pytest.raises(ValueError):
+        read_specification(str(specification))
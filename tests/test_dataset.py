@@ -1,4 +1,5 @@
 import os
+import shutil
 import pytest
 import pandas as pd
 from datetime import datetime
@@ -110,6 +111,16 @@ def test_identify_dataset_categorical():
     assert dataset.information['type'] == 'categorical'
 
 
+def test_identify_dataset_sampled():
+    # Test identifying dataset with sampled text detection
+    for filename, format in [('datasets/artm_test_dataset', 'json'), ('datasets/Abalone', 'csv')]:
+        dataset = Dataset(filename, format=format)
+        dataset.load()
+        information = dataset.information
+        dataset.identify_dataset(sample_size=3)
+        assert dataset.information == information
+
+
 def test_missing_values_impute():
     # Test imputing missing values
     dataset = Dataset('examples/missing_values/data', format='csv')
@@ -168,6 +179,29 @@ def test_feature_scaling_standardisation():
         assert dataset.data[column].std() == pytest.approx(1, abs=0.01)
 
 
+def test_feature_scaling_float32():
+    # Test feature scaling to single precision
+    dataset = Dataset('datasets/Abalone', format='csv')
+    dataset.load()
+    dataset.scale(method='normalisation', dtype='float32')
+    assert dataset.data['Length'].dtype == 'float32'
+    assert dataset.data['Rings'].dtype == 'float32'
+    assert dataset.data['Length'].min() >= 0
+    assert dataset.data['Length'].max() <= 1
+
+
+def test_feature_scaling_in_place():
+    # Test feature scaling without copying numerical columns
+    dataset = Dataset('datasets/sportydatagen', format='csv')
+    dataset.load()
+    values = dataset.data.to_numpy(dtype='float64')
+    dataset.data = pd.DataFrame(values, columns=dataset.data.columns)
+    dataset.scale(method='standardisation', copy=False)
+    assert values.mean(axis=0) == pytest.approx(0, abs=1e-9)
+    for column in dataset.data.columns:
+        assert dataset.data[column].std() == pytest.approx(1, abs=0.01)
+
+
 def test_feature_scaling_invalid_method():
     # Test invalid method handling
     dataset = Dataset('datasets/Abalone', format='csv')
@@ -176,6 +210,115 @@ def test_feature_scaling_invalid_method():
         dataset.scale(method='invalid_method')
 
 
+def test_load_chunked_identify_dataset():
+    # Test identifying a dataset loaded in chunks
+    dataset = Dataset(
+        'datasets/measures2', format='txt', datetime_columns=['date', 'time']
+    )
+    dataset.load()
+    chunked = Dataset(
+        'datasets/measures2', format='txt', datetime_columns=['date', 'time']
+    )
+    chunked.load(chunksize=7)
+    assert chunked.data is None
+    assert chunked.information == dataset.information
+
+
+def test_load_chunked_missing_category(tmp_path):
+    # Test identifying a categorical column without values in a chunk
+    for values in [[None, None, 'a', 'b', 'c', 'a'], ['a', 'b', 'c', None, None, None]]:
+        pd.DataFrame({'x': range(6), 'c': values}).to_csv(
+            tmp_path / 'data.csv', index=False)
+        dataset = Dataset(str(tmp_path / 'data'), format='csv')
+        dataset.load()
+        chunked = Dataset(str(tmp_path / 'data'), format='csv')
+        chunked.load(chunksize=2)
+        assert str(chunked.information) == str(dataset.information)
+
+
+def test_load_chunked_invalid_chunksize():
+    # Test invalid chunk size handling
+    dataset = Dataset('datasets/nursery', format='csv')
+    with pytest.raises(ValueError, match='Invalid chunk size'):
+        dataset.load(chunksize=0)
+
+
+def test_chunked_unsupported_operations():
+    # Test operations requiring the loaded dataset fail for chunked datasets
+    dataset = Dataset('datasets/measures2', format='txt',
+                      datetime_columns=['date', 'time'])
+    dataset.load(chunksize=7)
+    with pytest.raises(ValueError, match='not supported for chunked datasets'):
+        dataset.squash(threshold=0.99)
+    with pytest.raises(ValueError, match='not supported for chunked datasets'):
+        dataset.feature_selection(
+            method='pearson', threshold=0.5, class_column='temperature')
+    with pytest.raises(ValueError, match='not supported for chunked datasets'):
+        dataset.filter_by_datetime('date_time', hour=16)
+    with pytest.raises(ValueError, match='not supported for chunked datasets'):
+        dataset.filter_by_week(week=37, datetime_column='date_time')
+    with pytest.raises(ValueError, match='not supported for chunked datasets'):
+        dataset.encode()
+
+
+def test_missing_values_impute_chunked():
+    # Test imputing missing values chunk by chunk
+    dataset = Dataset('examples/missing_values/data', format='csv')
+    dataset.load()
+    dataset.missing_values(method='impute')
+    chunked = Dataset('examples/missing_values/data', format='csv')
+    chunked.load(chunksize=2)
+    chunked.missing_values(method='impute')
+    df = pd.concat(chunked.iter_chunks(), ignore_index=True)
+    pd.testing.assert_frame_equal(df, dataset.data)
+
+
+def test_missing_values_impute_chunked_missing_category(tmp_path):
+    # Test imputing a categorical column without values in a chunk
+    pd.DataFrame({
+        'x': [1.0, 2.0, None, 4.0, 5.0, 6.0],
+        'c': ['a', 'b', 'a', None, None, None],
+    }).to_csv(tmp_path / 'data.csv', index=False)
+    dataset = Dataset(str(tmp_path / 'data'), format='csv')
+    dataset.load()
+    dataset.missing_values(method='impute')
+    chunked = Dataset(str(tmp_path / 'data'), format='csv')
+    chunked.load(chunksize=3)
+    chunked.missing_values(method='impute')
+    df = pd.concat(chunked.iter_chunks(), ignore_index=True)
+    pd.testing.assert_frame_equal(df, dataset.data)
+    assert chunked.transform(pd.DataFrame(
+        {'x': [None], 'c': [None]}, dtype=float))['c'].tolist() == ['a']
+
+
+def test_filter_after_impute_datetime():
+    # Test filtering by dates after missing timestamps are imputed in place
+    dataset = Dataset()
+    dataset.data = pd.DataFrame({
+        't': pd.to_datetime(['2022-01-01 10:00', None, '2022-01-01 10:30',
+                             '2022-01-01 11:00', None]),
+        'x': [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+    dataset.identify_dataset()
+    assert len(dataset.filter_by_hour(10, 't')) == 2
+    dataset.missing_values(method='impute')
+    assert dataset.data['t'].notna().all()
+    assert len(dataset.filter_by_hour(10, 't')) == 4
+
+
+def test_feature_scaling_chunked():
+    # Test feature scaling chunk by chunk
+    for method in ['normalisation', 'standardisation']:
+        dataset = Dataset('datasets/Abalone', format='csv')
+        dataset.load()
+        dataset.scale(method=method)
+        chunked = Dataset('datasets/Abalone', format='csv')
+        chunked.load(chunksize=1000)
+        chunked.scale(method=method)
+        df = pd.concat(chunked.iter_chunks(), ignore_index=True)
+        pd.testing.assert_frame_equal(df, dataset.data)
+
+
 def test_feature_selection_numerical():
     # Test feature selection for numerical dataset
     dataset = Dataset('datasets/sportydatagen', format='csv')
@@ -394,3 +537,358 @@ def test_filter_by_year():
     # No filtering when datetime_column is None
     dataset.filter_by_year(year=year_to_filter)
     assert df.equals(dataset.data)
+
+
+def test_filter_by_datetime():
+    # Test filtering by several datetime criteria at once
+    dataset = Dataset(
+        'datasets/measures2', format='txt', datetime_columns=['date', 'time']
+    )
+    dataset.load()
+
+    df = dataset.filter_by_datetime(
+        'date_time',
+        start_date=datetime(2022, 1, 1),
+        end_date=datetime(2023, 1, 1),
+        hour=16,
+        minute=40,
+    )
+    assert len(df) == 8
+    assert all(df['date_time'].dt.hour == 16)
+    assert all(df['date_time'].dt.minute == 40)
+    assert df['date_time'].is_monotonic_increasing
+
+    # Time index is rebuilt when data changes
+    dataset.data = dataset.data.iloc[:10]
+    df = dataset.filter_by_datetime('date_time', hour=16)
+    assert len(df) == 10
+
+    # Raise ValueError for start_date > end_date
+    with pytest.raises(ValueError):
+        dataset.filter_by_datetime(
+            'date_time', start_date=datetime(2023, 1, 1), end_date=datetime(2022, 1, 1))
+
+
+def test_load_tcx_cache(tmp_path, monkeypatch):
+    # Test loading TCX data in parallel with a cache of parsed files
+    for name in ['first', 'second', 'third']:
+        shutil.copy('datasets/tcx/dead_end.tcx', tmp_path / f'{name}.tcx')
+    dataset = Dataset(str(tmp_path), format='tcx')
+    dataset.load(n_jobs=2, cache=True)
+    assert len(dataset.data) == 3
+    assert (tmp_path / '.arm_preprocessing_cache.json').exists()
+    expected = dataset.data
+
+    # Unchanged files are not parsed again
+    def fail(path):
+        raise AssertionError(f'Parsed cached file: {path}')
+    monkeypatch.setattr('arm_preprocessing.dataset._tcx_metrics', fail)
+    dataset.load(cache=True)
+    pd.testing.assert_frame_equal(dataset.data, expected)
+
+    # Only new files are parsed
+    parsed = []
+    monkeypatch.setattr(
+        'arm_preprocessing.dataset._tcx_metrics',
+        lambda path: parsed.append(path) or {'distance': 1.0})
+    with open(tmp_path / 'fourth.tcx', 'w') as file:
+        file.write('<TrainingCenterDatabase/>')
+    dataset.load(cache=True)
+    assert len(dataset.data) == 4
+    assert parsed == [str(tmp_path / 'fourth.tcx')]
+
+    # Raise TypeError for metrics not serialisable to the cache
+    monkeypatch.setattr(
+        'arm_preprocessing.dataset._tcx_metrics', lambda path: {'start': object()})
+    with open(tmp_path / 'fifth.tcx', 'w') as file:
+        file.write('<TrainingCenterDatabase></TrainingCenterDatabase>')
+    with pytest.raises(TypeError):
+        dataset.load(cache=True)
+
+
+def test_convert_load_parquet(tmp_path):
+    # Test converting data to Parquet format and loading it
+    pytest.importorskip('pyarrow')
+    dataset = Dataset('datasets/measures2', format='txt',
+                      datetime_columns=['date', 'time'])
+    dataset.load()
+    dataset.data['mp'] = dataset.data['mp'].astype('category')
+    dataset.convert(target_format='parquet',
+                    output_filename=str(tmp_path / 'data'))
+
+    loaded = Dataset(str(tmp_path / 'data'), format='parquet')
+    loaded.load()
+    pd.testing.assert_frame_equal(loaded.data, dataset.data)
+    assert loaded.information['type'] == dataset.information['type']
+
+    # Read only the requested columns and rows
+    loaded.load(columns=['date_time', 'temperature'],
+                filters=[('temperature', '>', 20)])
+    expected = dataset.data.loc[dataset.data['temperature'] > 20, [
+        'date_time', 'temperature']].reset_index(drop=True)
+    pd.testing.assert_frame_equal(loaded.data, expected)
+
+    # Read in chunks
+    chunks = list(Dataset(str(tmp_path / 'data'), format='parquet').iter_chunks(100))
+    assert sum(len(chunk) for chunk in chunks) == len(dataset.data)
+
+
+def test_convert_load_feather(tmp_path):
+    # Test converting data to Feather format and loading it
+    pytest.importorskip('pyarrow')
+    dataset = Dataset('datasets/nursery', format='csv')
+    dataset.load()
+    dataset.convert(target_format='feather',
+                    output_filename=str(tmp_path / 'data'))
+
+    loaded = Dataset(str(tmp_path / 'data'), format='feather')
+    loaded.load(columns=['Parents', 'Health'],
+                filters=[('Health', '==', 'priority')])
+    expected = dataset.data.loc[dataset.data['Health'] == 'priority', [
+        'Parents', 'Health']].reset_index(drop=True)
+    pd.testing.assert_frame_equal(loaded.data, expected)
+
+    # Read in chunks
+    loaded.load(chunksize=1000)
+    chunks = list(loaded.iter_chunks())
+    assert len(chunks) == 13
+    pd.testing.assert_frame_equal(pd.concat(chunks), dataset.data)
+
+    # Raise ValueError for column projection of text files
+    with pytest.raises(ValueError):
+        dataset.load(columns=['Parents'])
+
+
+def test_identify_dataset_compact():
+    # Test converting columns to compact dtypes
+    dataset = Dataset('datasets/Abalone', format='csv')
+    dataset.load(compact=True)
+    assert dataset.data['Sex'].dtype == 'category'
+    assert dataset.data['Rings'].dtype == 'int8'
+    assert dataset.data['Length'].dtype == 'float64'
+    assert dataset.information['memory']['saved'] > 0
+    assert dataset.information['memory']['after'] == dataset.data.memory_usage(
+        deep=True).sum()
+
+    # Information and values are unchanged
+    expected = Dataset('datasets/Abalone', format='csv')
+    expected.load()
+    assert dataset.information['columns'] == expected.information['columns']
+    pd.testing.assert_frame_equal(
+        dataset.data.astype(expected.data.dtypes), expected.data)
+
+    # Raise ValueError for chunked datasets
+    with pytest.raises(ValueError):
+        dataset.load(chunksize=1000, compact=True)
+
+
+def test_polars_backend():
+    # Test preprocessing with the polars backend
+    pytest.importorskip('polars')
+    expected = Dataset('datasets/Abalone', format='csv')
+    expected.load()
+    dataset = Dataset('datasets/Abalone', format='csv', backend='polars')
+    dataset.load()
+    assert dataset.information == expected.information
+
+    for current in [expected, dataset]:
+        current.missing_values(method='impute')
+        current.scale(method='standardisation')
+        current.discretise(method='equal_frequency',
+                           num_bins=5, columns=['Height'])
+        current.discretise(method='equal_width',
+                           num_bins=5, columns=['Diameter'])
+    pd.testing.assert_frame_equal(dataset.to_pandas(), expected.data)
+    assert [step['step'] for step in dataset.pipeline.steps] == [
+        step['step'] for step in expected.pipeline.steps]
+
+    # Raise ValueError for unsupported operations
+    with pytest.raises(ValueError):
+        dataset.discretise(method='kmeans', num_bins=5, columns=['Length'])
+    with pytest.raises(ValueError):
+        dataset.feature_selection(
+            method='pearson', threshold=0.5, class_column='Rings')
+    with pytest.raises(ValueError):
+        dataset.load(chunksize=1000)
+    with pytest.raises(ValueError):
+        Dataset('datasets/Abalone', format='csv', backend='invalid')
+
+
+@pytest.mark.parametrize('steps', [
+    [],
+    [('missing_values', {'method': 'impute'})],
+    [('scale', {'method': 'normalisation'})],
+    [('missing_values', {'method': 'impute'}),
+     ('scale', {'method': 'standardisation'})],
+    [('discretise', {'method': 'equal_frequency', 'num_bins': 5, 'columns': ['Length', 'Height']})],
+    [('missing_values', {'method': 'impute'}),
+     ('discretise', {'method': 'kmeans_1d', 'num_bins': 5, 'columns': ['Length', 'Height']})],
+])
+def test_polars_backend_parity(tmp_path, steps):
+    # Test the polars backend preprocesses and transforms data as pandas
+    pl = pytest.importorskip('polars')
+    raw = pd.read_csv('datasets/Abalone.csv')
+    raw.loc[::7, 'Length'] = None
+    raw.loc[::11, 'Sex'] = None
+    raw.to_csv(tmp_path / 'abalone.csv', index=False)
+    expected = Dataset(str(tmp_path / 'abalone'), format='csv')
+    expected.load()
+    dataset = Dataset(str(tmp_path / 'abalone'), format='csv', backend='polars')
+    dataset.load()
+
+    for method, arguments in steps:
+        getattr(expected, method)(**arguments)
+        getattr(dataset, method)(**arguments)
+    pd.testing.assert_frame_equal(dataset.to_pandas(), expected.data)
+
+    # Transform new data with the fitted steps
+    new = pd.read_csv(tmp_path / 'abalone.csv').head(50)
+    transformed = dataset._polars.to_pandas(
+        dataset.transform(pl.from_pandas(new)), dataset.pipeline.steps)
+    pd.testing.assert_frame_equal(transformed, expected.transform(new))
+
+
+def test_polars_backend_filter_by_datetime():
+    # Test filtering by dates with the polars backend
+    pytest.importorskip('polars')
+    expected = Dataset('datasets/measures2', format='txt',
+                       datetime_columns=['date', 'time'])
+    expected.load()
+    dataset = Dataset('datasets/measures2', format='txt',
+                      datetime_columns=['date', 'time'], backend='polars')
+    dataset.load()
+    assert dataset.information == expected.information
+
+    for criteria in [
+        {'hour': 16},
+        {'week': 37, 'minute': 40},
+        {'start_date': '2022-09-14 16:40', 'end_date': '2022-09-15'},
+    ]:
+        df = dataset.filter_by_datetime('date_time', **criteria).to_pandas()
+        pd.testing.assert_frame_equal(
+            df, expected.filter_by_datetime('date_time', **criteria).reset_index(drop=True))
+
+
+def test_load_partitions(tmp_path):
+    # Test loading a dataset split into several files
+    expected = pd.read_csv('datasets/Abalone.csv')
+    for part, start in enumerate(range(0, len(expected), 1500)):
+        expected.iloc[start:start + 1500].to_csv(
+            tmp_path / f'part-{part}.csv', index=False)
+
+    for filename in [str(tmp_path), str(tmp_path / 'part-*')]:
+        dataset = Dataset(filename, format='csv')
+        dataset.load(n_jobs=2)
+        pd.testing.assert_frame_equal(dataset.data, expected)
+        assert [partition['stop'] for partition in dataset.partitions] == [
+            1500, 3000, len(expected)]
+    assert dataset.partitions[0] == {
+        'file': str(tmp_path / 'part-0.csv'), 'start': 0, 'stop': 1500}
+
+    # Partitions keep their remaining rows
+    dataset.missing_values(method='row')
+    dataset.data = dataset.data[dataset.data['Rings'] > 10]
+    partitions = list(dataset.iter_partitions())
+    assert [file for file, _ in partitions] == [
+        partition['file'] for partition in dataset.partitions]
+    pd.testing.assert_frame_equal(
+        partitions[1][1], dataset.data.loc[1500:2999])
+
+    # Chunks are numbered across files
+    chunks = list(Dataset(str(tmp_path), format='csv').iter_chunks(1000))
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+    with pytest.raises(ValueError):
+        Dataset(str(tmp_path / 'missing-*'), format='csv').load()
+
+
+def test_append(tmp_path):
+    # Test appending batches of a streaming feed
+    expected = Dataset('datasets/measures2', format='txt',
+                       datetime_columns=['date', 'time'])
+    expected.load()
+    pd.read_csv('datasets/measures2.txt').head(20).to_csv(
+        tmp_path / 'measures.txt', index=False)
+    dataset = Dataset(str(tmp_path / 'measures'), format='txt',
+                      datetime_columns=['date', 'time'])
+    dataset.load()
+    dataset.append(expected.data.iloc[20:30].reset_index(drop=True))
+    dataset.append(expected.data.iloc[30:].reset_index(drop=True))
+    assert dataset.information == expected.information
+    pd.testing.assert_frame_equal(dataset.data, expected.data)
+
+    # Scaling parameters are fitted from the maintained moments
+    dataset.append(expected.data.head(5))
+    expected.data = pd.concat(
+        [expected.data, expected.data.head(5)], ignore_index=True)
+    dataset.scale(method='standardisation')
+    expected.scale(method='standardisation')
+    pd.testing.assert_frame_equal(dataset.data, expected.data)
+
+    with pytest.raises(ValueError):
+        dataset.append(expected.data.drop(columns=['soil']))
+    with pytest.raises(ValueError):
+        Dataset('datasets/Abalone').append(expected.data)
+
+
+def test_append_scale_bool(tmp_path):
+    # Test scaling boolean columns from the maintained moments
+    raw = pd.DataFrame({'value': [float(i) for i in range(20)],
+                        'flag': [i % 3 == 0 for i in range(20)]})
+    raw.head(10).to_csv(tmp_path / 'flags.csv', index=False)
+    for method in ['normalisation', 'standardisation']:
+        dataset = Dataset(str(tmp_path / 'flags'), format='csv')
+        dataset.load(compact=True)
+        memory = dataset.information['memory']
+        dataset.append(raw.iloc[10:])
+        assert dataset.information['memory'] == memory
+        dataset.scale(method=method)
+
+        expected = Dataset(str(tmp_path / 'flags'), format='csv')
+        expected.load()
+        expected.data = raw
+        expected.scale(method=method)
+        pd.testing.assert_frame_equal(dataset.data, expected.data)
+
+
+def test_append_preprocessed():
+    # Test appending rows to a compact and discretised dataset
+    raw = pd.read_csv('datasets/Abalone.csv')
+    raw.loc[4000, 'Sex'] = 'U'
+    dataset = Dataset('datasets/Abalone', format='csv')
+    dataset.load(compact=True)
+    dataset.data = dataset.data.head(3000)
+    dataset.identify_dataset()
+    dataset.discretise(
+        method='equal_width', num_bins=5, columns=['Height'])
+    dtypes = dataset.data.dtypes
+    dataset.append(raw.iloc[3000:])
+
+    assert (dataset.data.dtypes.drop('Sex') == dtypes.drop('Sex')).all()
+    assert list(dataset.data.index) == list(range(len(raw)))
+    assert dataset.data['Sex'].cat.categories.tolist() == ['F', 'I', 'M', 'U']
+    columns = {column['column']: column for column in dataset.information['columns']}
+    assert columns['Sex']['categories'] == ['M', 'F', 'I', 'U']
+    assert columns['Rings']['max'] == raw['Rings'].max()
+
+    # Discretised columns are identified as by identify_dataset
+    expected = Dataset('datasets/Abalone', format='csv')
+    expected.data = dataset.data.copy()
+    expected.identify_dataset()
+    assert dataset.information == expected.information
+
+
+def test_append_modified_scale():
+    # Test scaling a dataset modified after appending rows
+    raw = pd.read_csv('datasets/Abalone.csv')
+    dataset = Dataset('datasets/Abalone', format='csv')
+    dataset.load()
+    dataset.data = dataset.data.head(3000)
+    dataset.append(raw.iloc[3000:])
+    dataset.data['Length'] = dataset.data['Length'] * 100
+    dataset.append(raw.head(10))
+    dataset.data['Diameter'] = dataset.data['Diameter'] * 100
+    dataset.scale(method='normalisation')
+    assert dataset.data['Length'].min() == 0
+    assert dataset.data['Length'].max() == 1
+    assert dataset.data['Diameter'].max() == 1
@@ -1,7 +1,11 @@
 import re
+import sys
 import pytest
+import numpy as np
+import pandas as pd
 
 from arm_preprocessing.dataset import Dataset
+from arm_preprocessing.discretisation import Discretisation
 
 
 def test_discretise_equal_width():
@@ -33,6 +37,109 @@ def test_discretise_kmeans():
         re.compile(r'^Cluster \d+$')))
 
 
+def test_discretise_kmeans_1d():
+    # Test one-dimensional k-means discretisation
+    dataset = Dataset('datasets/measures2', format='txt')
+    dataset.load()
+    dataset.discretise(method='kmeans_1d', num_bins=5, columns=['temperature'])
+    assert dataset.data['temperature'].value_counts().shape[0] == 5
+    assert dataset.data['temperature'].dtype == 'category'
+
+    # Deterministic bins
+    repeated = Dataset('datasets/measures2', format='txt')
+    repeated.load()
+    repeated.discretise(method='kmeans_1d', num_bins=5,
+                        columns=['temperature'])
+    pd.testing.assert_series_equal(
+        repeated.data['temperature'], dataset.data['temperature'])
+
+
+def test_kmeans_1d_bins_optimal():
+    # Test optimal clusters of well separated values
+    values = [1.0, 1.1, 1.2, 5.0, 5.1, 9.0, 9.2, 9.4]
+    bins = Discretisation.kmeans_1d_bins(values, 3)
+    assert bins[1:-1] == pytest.approx([(1.1 + 5.05) / 2, (5.05 + 9.2) / 2])
+    assert bins[-1] == 9.4
+
+
+def test_kmeans_1d_bins_grouped_ties():
+    # Test grouping more unique values than max_groups with heavy ties
+    for seed in [55, 107, 174, 178]:
+        values = np.random.default_rng(seed).integers(0, 3001, 5000)
+        assert len(np.unique(values)) > 1024
+        bins = Discretisation.kmeans_1d_bins(values, 5)
+        assert not np.isnan(bins).any()
+        assert (np.diff(bins) > 0).all()
+
+
+def test_discretise_parallel():
+    # Test discretising columns in parallel threads
+    columns = ['temperature', 'humidity', 'light']
+    for method in ['equal_width', 'equal_frequency']:
+        dataset = Dataset('datasets/measures2', format='txt')
+        dataset.load()
+        dataset.discretise(method=method, num_bins=5, columns=columns)
+        parallel = Dataset('datasets/measures2', format='txt')
+        parallel.load()
+        parallel.discretise(method=method, num_bins=5,
+                            columns=columns, n_jobs=2)
+        pd.testing.assert_frame_equal(parallel.data, dataset.data)
+
+    # K-means clusters of each column
+    dataset = Dataset('datasets/measures2', format='txt')
+    dataset.load()
+    dataset.discretise(method='kmeans', num_bins=5,
+                       columns=columns, n_jobs=-1)
+    for column in columns:
+        assert dataset.data[column].value_counts().shape[0] == 5
+
+
+def test_discretise_kmeans_parallel_without_threadpoolctl(monkeypatch):
+    # Test k-means in parallel threads without limiting their thread pools
+    monkeypatch.setitem(sys.modules, 'threadpoolctl', None)
+    columns = ['temperature', 'humidity']
+    dataset = Dataset('datasets/measures2', format='txt')
+    dataset.load()
+    dataset.discretise(method='kmeans', num_bins=5, columns=columns, n_jobs=2)
+    for column in columns:
+        assert dataset.data[column].value_counts().shape[0] == 5
+
+
+def test_discretise_equal_width_chunked():
+    # Test equal width discretisation chunk by chunk
+    dataset = Dataset('datasets/sportydatagen', format='csv')
+    dataset.load()
+    dataset.discretise(method='equal_width', num_bins=5, columns=['calories'])
+    chunked = Dataset('datasets/sportydatagen', format='csv')
+    chunked.load(chunksize=50)
+    chunked.discretise(method='equal_width', num_bins=5, columns=['calories'])
+    df = pd.concat(chunked.iter_chunks(), ignore_index=True)
+    pd.testing.assert_series_equal(df['calories'], dataset.data['calories'])
+
+
+def test_discretise_equal_frequency_chunked():
+    # Test equal frequency discretisation with quantile sketches
+    dataset = Dataset('datasets/measures2', format='txt')
+    dataset.load(chunksize=10)
+    dataset.discretise(method='equal_frequency', num_bins=4,
+                       columns=['temperature', 'humidity'], n_jobs=2, rank_error=0.01)
+    df = pd.concat(dataset.iter_chunks(), ignore_index=True)
+    for column in ['temperature', 'humidity']:
+        assert df[column].notna().all()
+        counts = df[column].value_counts(normalize=True)
+        assert len(counts) == 4
+        assert counts.min() > 0.15
+
+
+def test_discretise_chunked_unsupported_method():
+    # Test unsupported discretisation method for chunked datasets
+    dataset = Dataset('datasets/measures2', format='txt')
+    dataset.load(chunksize=10)
+    with pytest.raises(ValueError, match='not supported for chunked datasets'):
+        dataset.discretise(method='kmeans',
+                           num_bins=5, columns=['temperature'])
+
+
 def test_discretise_invalid_method():
     # Test invalid discretisation method
     dataset = Dataset('datasets/measures2', format='txt')
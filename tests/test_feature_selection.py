@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from arm_preprocessing.dataset import Dataset
+from arm_preprocessing.feature_selection import FeatureSelection
+
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman', 'kendall'])
+def test_correlations_match_pandas(method):
+    # Test correlations with the class column against the full correlation matrix
+    data = pd.read_csv('datasets/Abalone.csv').drop(columns=['Sex'])
+    data.iloc[::5, -1] = np.nan
+    data.iloc[::3, 2] = np.nan
+    data['Constant'] = 1.0
+    correlations = FeatureSelection.correlations(
+        data, 'Rings', method, n_jobs=2)
+    pd.testing.assert_series_equal(
+        correlations, data.corr(method=method)['Rings'], check_names=False)
+
+
+def test_correlations_sample():
+    # Test correlations of sampled rows
+    data = pd.read_csv('datasets/Abalone.csv').drop(columns=['Sex'])
+    correlations = FeatureSelection.correlations(
+        data, 'Rings', 'kendall', sample_size=1000)
+    expected = data.corr(method='kendall')['Rings']
+    assert np.abs(correlations - expected).max() < 0.1
+
+    # Raise ValueError for invalid methods
+    with pytest.raises(ValueError):
+        FeatureSelection.correlations(data, 'Rings', 'invalid_method')
+
+
+def test_feature_selection_compact():
+    # Test feature selection of columns with compact dtypes
+    dataset = Dataset('datasets/sportydatagen', format='csv')
+    dataset.load(compact=True)
+    dataset.feature_selection(
+        method='spearman', threshold=0.15, class_column='calories')
+    assert 'calories' in dataset.data.columns
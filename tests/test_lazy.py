@@ -0,0 +1,74 @@
+import pytest
+import pandas as pd
+
+from arm_preprocessing.dataset import Dataset
+
+
+def preprocess(dataset):
+    # Preprocess the Abalone dataset eagerly or lazily
+    dataset.missing_values(method='impute')
+    dataset.scale(method='standardisation')
+    dataset.feature_selection(
+        method='spearman', threshold=0.62, class_column='Rings')
+    return dataset.discretise(
+        method='equal_frequency', num_bins=5, columns=['Height', 'Diameter'])
+
+
+def test_lazy_collect_matches_eager():
+    # Test collecting the optimised plan
+    eager = Dataset('datasets/Abalone', format='csv')
+    eager.load()
+    eager.data.drop('Sex', axis=1, inplace=True)
+    raw = eager.data.copy()
+    preprocess(eager)
+
+    dataset = Dataset('datasets/Abalone', format='csv')
+    dataset.load()
+    dataset.data.drop('Sex', axis=1, inplace=True)
+    lazy = dataset.lazy()
+    assert preprocess(lazy) is lazy
+    assert dataset.data.equals(raw)
+
+    # Feature selection is moved before scaling, which is fused with discretisation
+    plan = lazy.explain()
+    assert [line.split('(')[0] for line in plan] == [
+        'missing_values', 'feature_selection', 'scale_discretise']
+
+    assert lazy.collect() is dataset
+    assert lazy.plan == []
+    pd.testing.assert_frame_equal(dataset.data, eager.data)
+    assert list(dataset.data.columns) == [
+        'Diameter', 'Height', 'Whole weight', 'Shell weight', 'Rings']
+    assert [step['step'] for step in dataset.pipeline.steps] == [
+        'impute', 'select', 'scale', 'discretise']
+    pd.testing.assert_frame_equal(
+        dataset.transform(raw.head(50)), eager.transform(raw.head(50)))
+
+
+def test_lazy_chunked():
+    # Test collecting the plan of a chunked dataset without optimisations
+    dataset = Dataset('datasets/Abalone', format='csv')
+    dataset.load(chunksize=1000)
+    lazy = dataset.lazy().scale(method='normalisation').discretise(
+        method='equal_width', num_bins=5, columns=['Height'])
+    assert [line.split('(')[0] for line in lazy.explain()] == [
+        'scale', 'discretise']
+    lazy.collect()
+    df = next(dataset.iter_chunks())
+    assert df['Height'].dtype == 'category'
+
+
+def test_lazy_invalid_operations():
+    # Test validating operations when they are recorded
+    dataset = Dataset('datasets/Abalone', format='csv')
+    with pytest.raises(ValueError):
+        dataset.lazy().scale(method='invalid')
+    with pytest.raises(ValueError):
+        dataset.lazy().discretise(method='equal_width', num_bins=5, columns=[])
+
+    # Column types are validated on collection
+    dataset.load()
+    lazy = dataset.lazy().scale(method='normalisation').discretise(
+        method='equal_width', num_bins=5, columns=['Sex'])
+    with pytest.raises(ValueError):
+        lazy.collect()
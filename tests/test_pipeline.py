@@ -0,0 +1,77 @@
+import pytest
+import pandas as pd
+
+from arm_preprocessing.dataset import Dataset
+from arm_preprocessing.pipeline import Pipeline
+
+
+def test_pipeline_records_steps():
+    # Test recording fitted steps
+    dataset = Dataset('datasets/Abalone', format='csv')
+    dataset.load()
+    dataset.missing_values(method='impute')
+    dataset.scale(method='normalisation')
+    dataset.discretise(method='equal_width', num_bins=5, columns=['Height'])
+    assert [step['step'] for step in dataset.pipeline.steps] == [
+        'impute', 'scale', 'discretise']
+
+
+def test_pipeline_transform_new_data():
+    # Test replaying fitted steps on new data without refitting
+    dataset = Dataset('datasets/Abalone', format='csv')
+    dataset.load()
+    raw = dataset.data.copy()
+    dataset.scale(method='standardisation')
+    dataset.discretise(method='equal_frequency',
+                       num_bins=5, columns=['Diameter'])
+    dataset.discretise(method='kmeans', num_bins=5, columns=['Shell weight'])
+
+    # Transform the whole dataset
+    df = dataset.transform(raw)
+    pd.testing.assert_frame_equal(df, dataset.data)
+
+    # Transform a batch with identical bins
+    batch = dataset.transform(raw.iloc[:100])
+    pd.testing.assert_frame_equal(batch, dataset.data.iloc[:100])
+
+    # Input data is not modified
+    pd.testing.assert_frame_equal(raw, pd.read_csv('datasets/Abalone.csv'))
+
+
+def test_pipeline_feature_selection():
+    # Test replaying feature selection
+    dataset = Dataset('datasets/sportydatagen', format='csv')
+    dataset.load()
+    raw = dataset.data.copy()
+    dataset.feature_selection(
+        method='pearson', threshold=0.15, class_column='calories')
+    assert list(dataset.transform(raw).columns) == list(dataset.data.columns)
+
+
+def test_pipeline_invalid_step():
+    # Test invalid step handling
+    pipeline = Pipeline([{'step': 'invalid_step'}])
+    with pytest.raises(ValueError, match='Invalid step'):
+        pipeline.transform(pd.DataFrame({'a': [1, 2]}))
+
+
+def test_pipeline_impute_new_data():
+    # Test replaying imputation with stored fill values
+    dataset = Dataset('examples/missing_values/data', format='csv')
+    dataset.load()
+    raw = dataset.data.copy()
+    dataset.missing_values(method='impute')
+    fill_values = dataset.pipeline.steps[0]['fill_values']
+    assert fill_values['Age'] == raw['Age'].mean()
+    assert fill_values['Name'] == 'Jane'
+
+    # Impute a batch with the fill values of the whole dataset
+    batch = dataset.transform(raw.iloc[3:])
+    pd.testing.assert_frame_equal(batch, dataset.data.iloc[3:])
+    assert batch.notna().all().all()
+
+    # Input data is not modified unless imputed in place
+    pd.testing.assert_frame_equal(
+        raw, pd.read_csv('examples/missing_values/data.csv'))
+    Pipeline.impute(raw, fill_values, copy=False)
+    pd.testing.assert_frame_equal(raw, dataset.data)
@@ -0,0 +1,50 @@
+import pandas as pd
+
+from arm_preprocessing.dataset import Dataset
+from arm_preprocessing.profiling import Profiler
+
+
+def test_profiler_records_calls():
+    # Test recording method calls
+    dataset = Dataset('datasets/Abalone', format='csv')
+    events = []
+    with Profiler(dataset, callback=events.append, trace_memory=True) as profiler:
+        dataset.load()
+        dataset.missing_values(method='impute')
+        dataset.scale(method='normalisation')
+        dataset.data.drop('Sex', axis=1, inplace=True)
+        dataset.feature_selection(
+            method='pearson', threshold=0.5, class_column='Rings')
+        dataset.discretise(method='equal_width', num_bins=5, columns=['Height'])
+
+    df = profiler.to_frame()
+    assert df['method'].tolist() == [
+        'load', 'missing_values', 'scale', 'feature_selection', 'discretise']
+    assert events == profiler.records
+    assert (df['wall_time'] > 0).all()
+    assert (df['peak_memory'] > 0).all()
+
+    # Shapes, memory and copies
+    load, impute, scale, selection, discretise = profiler.records
+    assert load['rows_in'] is None and load['rows_out'] == 4177
+    assert load['memory_in'] == 0 and load['memory_delta'] > 0
+    assert impute['copies'] == 0
+    assert scale['copies'] == 8
+    assert discretise['copies'] == 1
+    assert selection['columns_out'] < selection['columns_in']
+
+    # Methods are restored
+    assert 'load' not in vars(dataset)
+
+
+def test_profiler_nested_calls():
+    # Test recording only the outermost call of filters
+    dataset = Dataset(
+        'datasets/measures2', format='txt', datetime_columns=['date', 'time'])
+    dataset.load()
+    with Profiler(dataset) as profiler:
+        df = dataset.filter_by_hour(16, 'date_time')
+    assert [record['method'] for record in profiler.records] == ['filter_by_hour']
+    assert profiler.records[0]['rows_out'] == len(df)
+    assert profiler.records[0]['peak_memory'] is None
+    assert isinstance(profiler.to_frame(), pd.DataFrame)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from arm_preprocessing.quantiles import QuantileSketch
+
+
+def test_quantile_sketch_rank_error():
+    # Test quantiles updated chunk by chunk are within the rank error
+    values = np.random.default_rng(0).lognormal(size=200000)
+    sketch = QuantileSketch(rank_error=0.01)
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+    quantiles = np.linspace(0, 1, 11)
+    result = sketch.quantiles(quantiles)
+    ranks = np.searchsorted(np.sort(values), result) / len(values)
+    assert np.abs(ranks - quantiles).max() <= 0.01
+    assert result[0] == values.min()
+    assert result[-1] == values.max()
+    assert sketch.count == len(values)
+
+
+def test_quantile_sketch_merge():
+    # Test merging sketches of parts of a column
+    values = np.random.default_rng(1).normal(size=100000)
+    values[::100] = np.nan
+    first = QuantileSketch(rank_error=0.01).update(values[:50000])
+    second = QuantileSketch(rank_error=0.01, seed=1).update(values[50000:])
+    merged = first.merge(second)
+    present = np.sort(values[~np.isnan(values)])
+    assert merged.count == len(present)
+    ranks = np.searchsorted(present, merged.quantiles([0.25, 0.5, 0.75])) / len(present)
+    assert np.abs(ranks - [0.25, 0.5, 0.75]).max() <= 0.01
+
+    # Empty sketches
+    assert np.isnan(QuantileSketch().quantiles([0.5])).all()
+    with pytest.raises(ValueError):
+        QuantileSketch(rank_error=0)
+
+
+def test_quantile_sketch_merge_rank_error():
+    # Test all quantiles of sketches merged across workers are within the rank error
+    quantiles = np.linspace(0, 1, 101)
+    for trial in range(4):
+        values = np.random.default_rng(trial).normal(size=1000000)
+        sketch = QuantileSketch(rank_error=0.01, seed=trial)
+        for seed, part in enumerate(np.array_split(values, 8), start=1):
+            worker = QuantileSketch(rank_error=0.01, seed=10 * trial + seed)
+            for chunk in np.array_split(part, 5):
+                worker.update(chunk)
+            sketch.merge(worker)
+        ranks = np.searchsorted(np.sort(values), sketch.quantiles(quantiles)) / len(values)
+        assert np.abs(ranks - quantiles).max() <= 0.01
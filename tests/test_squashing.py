@@ -1,3 +1,7 @@
+import niaarm
+import pandas as pd
+from niaarm import squash
+
 from arm_preprocessing.dataset import Dataset
 
 
@@ -18,3 +22,14 @@ def test_squash_euclidean():
     original_size = len(dataset.data)
     dataset.squash(threshold=0.75, similarity='euclidean')
     assert len(dataset.data) < original_size
+
+
+def test_squash_matches_niaarm():
+    # Test squashing matches NiaARM
+    for filename, threshold, similarity in [('datasets/breast', 0.75, 'euclidean'), ('datasets/Abalone', 0.9999, 'cosine')]:
+        dataset = Dataset(filename, format='csv')
+        dataset.load()
+        expected = squash(niaarm.Dataset(dataset.data.copy()),
+                          threshold, similarity).transactions
+        dataset.squash(threshold=threshold, similarity=similarity)
+        pd.testing.assert_frame_equal(dataset.data, expected)
@@ -0,0 +1,56 @@
+import pytest
+import pandas as pd
+
+from arm_preprocessing.dataset import Dataset
+from arm_preprocessing.timeseries import TimeSeries
+
+
+def load_measures():
+    # Load the measures dataset with a renamed datetime column
+    dataset = Dataset('datasets/measures2', format='txt',
+                      datetime_columns=['date', 'time'])
+    dataset.load()
+    return dataset.data.rename(columns={'date_time': 'timestamp'})
+
+
+def test_filter_intervals():
+    # Test splitting the dataset into intervals as groupby
+    df = load_measures()
+    for data in [df, df.sample(frac=1, random_state=0)]:
+        series = TimeSeries(data, datetime_column='timestamp')
+        expected = {
+            label: group
+            for label, group in data.groupby(pd.Grouper(key='timestamp', freq='1min'))
+        }
+        intervals = series.filter_intervals('1min')
+        assert list(intervals) == list(expected)
+        for label, group in series.iter_intervals('1min'):
+            pd.testing.assert_frame_equal(group, expected[label])
+
+    # Intervals of sorted datasets are slices
+    intervals = TimeSeries(df, datetime_column='timestamp').filter_intervals('1min')
+    label = intervals.labels[1]
+    assert intervals.order is None
+    assert intervals.positions(label) == slice(*intervals.bounds(label))
+    with pytest.raises(KeyError):
+        intervals[pd.Timestamp('2000-01-01')]
+
+
+def test_stream_intervals():
+    # Test streaming intervals from chunks
+    df = load_measures()
+    chunks = (df.iloc[start:start + 7] for start in range(0, len(df), 7))
+    expected = TimeSeries(df, datetime_column='timestamp').filter_intervals('1min')
+    streamed = list(TimeSeries.stream_intervals(chunks, '1min', 'timestamp'))
+    assert [label for label, _ in streamed] == list(expected)
+    for label, group in streamed:
+        pd.testing.assert_frame_equal(group, expected[label])
+
+    # Stream from an instance
+    series = TimeSeries(df, datetime_column='timestamp')
+    assert len(list(series.stream_intervals([df], '1min', 'timestamp'))) == len(expected)
+
+    # Raise ValueError for unsorted chunks
+    with pytest.raises(ValueError):
+        list(TimeSeries.stream_intervals(
+            [df.iloc[20:], df.iloc[:20]], '1min', 'timestamp'))
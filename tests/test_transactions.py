@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from arm_preprocessing.dataset import Dataset
+
+
+def test_encode_transactions():
+    # Test encoding categorical, discretised and numerical columns
+    dataset = Dataset('datasets/Abalone', format='csv')
+    dataset.load()
+    dataset.discretise(method='equal_width', num_bins=5, columns=['Height'])
+    transactions = dataset.encode()
+    assert transactions.num_transactions == len(dataset.data)
+    assert transactions.codes.shape == (len(dataset.data), 2)
+    assert transactions.numerical.shape == (len(dataset.data), 7)
+    assert transactions.items[:3] == [('Sex', 'F'), ('Sex', 'I'), ('Sex', 'M')]
+    assert len(transactions.items) == 8
+
+    # Decoded dataset equals the preprocessed dataset
+    pd.testing.assert_frame_equal(
+        transactions.to_frame(), dataset.data.astype({'Sex': 'category'}))
+
+
+def test_transactions_support():
+    # Test counting supports with bitsets and the sparse matrix
+    dataset = Dataset('datasets/nursery', format='csv')
+    dataset.load()
+    transactions = dataset.encode()
+    matrix = transactions.to_sparse()
+    assert matrix.shape == (len(dataset.data), len(transactions.items))
+    assert matrix.nnz == dataset.data.size
+
+    itemset = [('Parents', 'usual'), ('Health', 'priority'), ('Class', 'priority')]
+    expected = np.logical_and.reduce(
+        [dataset.data[column] == category for column, category in itemset])
+    assert transactions.count(itemset) == expected.sum()
+    assert transactions.support(itemset) == expected.mean()
+    indices = [transactions.item_index(column, category)
+               for column, category in itemset]
+    assert matrix[:, indices].toarray().all(axis=1).sum() == expected.sum()
+    assert transactions.count([]) == len(dataset.data)
+
+    # Raise ValueError for invalid items
+    with pytest.raises(ValueError):
+        transactions.support([('Parents', 'invalid')])
+
+
+def test_encode_datetime():
+    # Test datetime column handling
+    dataset = Dataset('datasets/measures2', format='txt',
+                      datetime_columns=['date', 'time'])
+    dataset.load()
+    with pytest.raises(ValueError):
+        dataset.encode()
+    transactions = dataset.encode(columns=['mp', 'temperature'])
+    assert len(transactions.features) == 2